@@ -132,6 +132,7 @@ class Settings(BaseSettings, metaclass=Singleton):
     # Security settings
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 12
     
     # Monitoring and logging
     SENTRY_DSN: str = ""
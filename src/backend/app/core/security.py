@@ -8,6 +8,7 @@ for the application's authentication and authorization system.
 
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Any, Union
+import hmac
 
 # JWT handling - python-jose v3.3.0
 from jose import jwt, JWTError
@@ -25,12 +26,36 @@ from .exceptions import AuthenticationException
 from ..constants.user_roles import ALL_ROLES
 
 # Set up password hashing context with bcrypt scheme
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 # Use token algorithm from constants
 ALGORITHM = TOKEN_ALGORITHM
 
 
+class PlaintextHasher:
+    """
+    Password hasher that stores passwords unhashed behind a "plain$" marker.
+    
+    Exposes the hash/verify interface of passlib's CryptContext so it can stand in for
+    pwd_context in test runs, where bcrypt's cost dominates. Never use it in production.
+    """
+    
+    PREFIX = "plain$"
+    
+    def hash(self, password: str) -> str:
+        """Return the stored form of a password."""
+        return self.PREFIX + password
+    
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """Check a password against its stored form in constant time."""
+        # compare_digest only accepts ASCII str, so compare the UTF-8 bytes
+        return hmac.compare_digest((self.PREFIX + password).encode(), hashed_password.encode())
+
+
+# Hasher behind get_password_hash/verify_password; tests may replace it with a PlaintextHasher
+password_hasher = pwd_context
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
@@ -42,7 +67,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches hash, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -55,7 +80,7 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def validate_password(password: str) -> bool:
@@ -5,12 +5,13 @@ This module extends the base CRUD class with molecule-specific operations includ
 management, library associations, and specialized search capabilities.
 """
 
-from typing import List, Dict, Optional, Any, Union, Tuple
+from typing import List, Dict, Optional, Any, Union, Tuple, Set
 import uuid
 from datetime import datetime
 
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import select, insert, func, or_, and_, desc, asc
+from sqlalchemy.dialects import postgresql, sqlite
 
 from .base import CRUDBase
 from ..models.molecule import Molecule, MoleculeStatus, library_molecule, molecule_property
@@ -19,8 +20,8 @@ from ..constants.molecule_properties import PropertySource
 from ..schemas.molecule import MoleculeCreate, MoleculeUpdate
 from ..core.logging import get_logger
 from ..utils.chem_fingerprints import calculate_fingerprint, calculate_similarity
-from ..utils.rdkit_utils import check_substructure_match
-from ..utils.smiles import validate_smiles
+from ..utils.rdkit_utils import check_substructure_match, smiles_to_mol, calculate_basic_properties
+from ..utils.smiles import validate_smiles, get_inchi_key_from_smiles, get_molecular_formula_from_smiles
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -424,6 +425,7 @@ class CRUDMolecule(CRUDBase[Molecule, MoleculeCreate, MoleculeUpdate]):
         if filter_params.get("smiles_contains"):
             query = query.filter(Molecule.smiles.ilike(f"%{filter_params['smiles_contains']}%"))
         
+        # Formula is stored at creation time, so this is an indexed column filter
         if filter_params.get("formula_contains"):
             query = query.filter(Molecule.formula.ilike(f"%{filter_params['formula_contains']}%"))
         
@@ -497,7 +499,8 @@ class CRUDMolecule(CRUDBase[Molecule, MoleculeCreate, MoleculeUpdate]):
     
     def search_by_similarity(self, query_smiles: str, threshold: float = 0.7,
                             fingerprint_type: str = "morgan", db: Optional[Session] = None,
-                            skip: int = 0, limit: int = 100) -> Dict[str, Any]:
+                            skip: int = 0, limit: int = 100,
+                            query_fp: Optional[Any] = None) -> Dict[str, Any]:
         """
         Search for molecules similar to a query molecule.
         
@@ -508,19 +511,22 @@ class CRUDMolecule(CRUDBase[Molecule, MoleculeCreate, MoleculeUpdate]):
             db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
+            query_fp: Precomputed fingerprint of the query molecule (optional). When provided,
+                it must match fingerprint_type and SMILES parsing is skipped.
             
         Returns:
             Dictionary with similar molecules and similarity scores
         """
         db_session = db or self.db
         
-        # Validate query SMILES
-        if not validate_smiles(query_smiles):
-            logger.error(f"Invalid query SMILES: {query_smiles}")
-            raise ValueError("Invalid query SMILES string")
-        
-        # Calculate query fingerprint
-        query_fp = calculate_fingerprint(query_smiles, fingerprint_type)
+        if query_fp is None:
+            # Validate query SMILES
+            if not validate_smiles(query_smiles):
+                logger.error(f"Invalid query SMILES: {query_smiles}")
+                raise ValueError("Invalid query SMILES string")
+            
+            # Calculate query fingerprint
+            query_fp = calculate_fingerprint(query_smiles, fingerprint_type)
         
         # Get all molecules
         molecules = db_session.query(Molecule).all()
@@ -606,10 +612,89 @@ class CRUDMolecule(CRUDBase[Molecule, MoleculeCreate, MoleculeUpdate]):
             "pages": (total + limit - 1) // limit if limit > 0 else 1
         }
     
+    def _build_batch_rows(self, obj: MoleculeCreate) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Build the molecule and property rows for a single batch entry.
+        
+        Args:
+            obj: Molecule creation data
+            
+        Returns:
+            Tuple of the molecule row and its property rows
+        """
+        if not validate_smiles(obj.smiles):
+            raise ValueError("Invalid SMILES string")
+        
+        now = datetime.utcnow()
+        molecule_id = uuid.uuid4()
+        
+        # Imported properties first; calculated values replace them but keep their units,
+        # as Molecule.calculate_properties does after create_with_properties sets them
+        properties = {
+            prop.name: {"value": prop.value, "units": prop.units, "source": PropertySource.IMPORTED.value}
+            for prop in obj.properties or []
+        }
+        calculated = calculate_basic_properties(smiles_to_mol(obj.smiles))
+        for name, value in calculated.items():
+            if name not in ["molecular_weight", "formula"]:  # These are stored as attributes
+                properties[name] = {
+                    "value": value,
+                    "units": properties.get(name, {}).get("units"),
+                    "source": PropertySource.CALCULATED.value
+                }
+        
+        inchi_key = get_inchi_key_from_smiles(obj.smiles)
+        if not inchi_key:
+            raise ValueError("Could not generate InChI Key")
+        
+        molecule_row = {
+            "id": molecule_id,
+            "smiles": obj.smiles,
+            "inchi_key": inchi_key,
+            "formula": obj.formula or get_molecular_formula_from_smiles(obj.smiles),
+            "molecular_weight": obj.molecular_weight or calculated.get("molecular_weight"),
+            "metadata": obj.metadata,
+            "status": obj.status or MoleculeStatus.AVAILABLE.value,
+            "created_by": obj.created_by,
+            "created_at": now,
+            "updated_at": now
+        }
+        property_rows = [
+            {"molecule_id": molecule_id, "name": name, "created_at": now, **prop}
+            for name, prop in properties.items()
+        ]
+        return molecule_row, property_rows
+    
+    def _insert_molecule_rows(self, molecule_rows: List[Dict[str, Any]], db_session: Session) -> Set[uuid.UUID]:
+        """
+        Insert molecule rows, ignoring rows whose InChI Key is already stored where supported.
+        
+        Args:
+            molecule_rows: Molecule rows built by _build_batch_rows
+            db_session: Database session
+            
+        Returns:
+            IDs of the rows actually inserted
+        """
+        dialect_name = db_session.get_bind().dialect.name
+        if dialect_name in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+            stmt = dialect_insert(Molecule).on_conflict_do_nothing(
+                index_elements=["inchi_key"]
+            ).returning(Molecule.id)
+            return set(db_session.scalars(stmt, molecule_rows).all())
+        
+        db_session.execute(insert(Molecule), molecule_rows)
+        return {row["id"] for row in molecule_rows}
+    
     def batch_create(self, obj_list: List[MoleculeCreate], db: Optional[Session] = None) -> Dict[str, Any]:
         """
         Create multiple molecules in a batch operation.
         
+        Duplicates are detected by InChI Key, so different SMILES for the same structure
+        are skipped. Existing molecules are resolved with a single lookup and new molecules
+        and their properties are written with one multi-row INSERT per table.
+        
         Args:
             obj_list: List of molecule creation data
             db: Database session
@@ -624,29 +709,78 @@ class CRUDMolecule(CRUDBase[Molecule, MoleculeCreate, MoleculeUpdate]):
         skipped = []
         failed = []
         
+        # Build the rows for each entry; an invalid entry only fails itself
+        candidates = []
         for obj in obj_list:
             try:
-                # Check if molecule already exists
-                existing = self.get_by_smiles(obj.smiles, db=db_session)
-                if existing:
-                    skipped.append({"smiles": obj.smiles, "id": str(existing.id)})
-                    continue
-                
-                # Create new molecule with properties
-                molecule = self.create_with_properties(obj, db=db_session)
-                created.append(molecule)
+                molecule_row, molecule_property_rows = self._build_batch_rows(obj)
             except Exception as e:
                 logger.error(f"Failed to create molecule: {str(e)}")
                 failed.append({"smiles": obj.smiles, "error": str(e)})
+                continue
+            candidates.append((obj, molecule_row, molecule_property_rows))
+        
+        # Resolve molecules that already exist in one query
+        existing_ids = {}
+        if candidates:
+            existing_ids = dict(db_session.execute(
+                select(Molecule.inchi_key, Molecule.id).where(
+                    Molecule.inchi_key.in_({row["inchi_key"] for _, row, _ in candidates})
+                )
+            ).all())
+        
+        molecule_rows = []
+        property_rows_by_id = {}
+        for obj, molecule_row, molecule_property_rows in candidates:
+            # Skip molecules already stored or already queued in this batch
+            if molecule_row["inchi_key"] in existing_ids:
+                skipped.append({"smiles": obj.smiles, "id": str(existing_ids[molecule_row["inchi_key"]])})
+                continue
+            
+            existing_ids[molecule_row["inchi_key"]] = molecule_row["id"]
+            molecule_rows.append(molecule_row)
+            property_rows_by_id[molecule_row["id"]] = molecule_property_rows
         
-        # Commit all changes
+        # Insert all new rows and commit once
         try:
+            inserted_ids = self._insert_molecule_rows(molecule_rows, db_session) if molecule_rows else set()
+            
+            # Rows stored by another writer since the lookup are skipped, not failed
+            conflicting_rows = [row for row in molecule_rows if row["id"] not in inserted_ids]
+            if conflicting_rows:
+                stored_ids = dict(db_session.execute(
+                    select(Molecule.inchi_key, Molecule.id).where(
+                        Molecule.inchi_key.in_([row["inchi_key"] for row in conflicting_rows])
+                    )
+                ).all())
+                skipped.extend(
+                    {"smiles": row["smiles"], "id": str(stored_ids.get(row["inchi_key"]))}
+                    for row in conflicting_rows
+                )
+            
+            property_rows = [
+                property_row
+                for row in molecule_rows if row["id"] in inserted_ids
+                for property_row in property_rows_by_id[row["id"]]
+            ]
+            if property_rows:
+                db_session.execute(insert(molecule_property), property_rows)
             db_session.commit()
         except Exception as e:
             db_session.rollback()
             logger.error(f"Failed to commit batch creation: {str(e)}")
             raise
         
+        if inserted_ids:
+            # Return the created molecules in input order
+            created_by_id = {
+                created_molecule.id: created_molecule
+                for created_molecule in db_session.query(Molecule).filter(Molecule.id.in_(inserted_ids))
+            }
+            created = [created_by_id[row["id"]] for row in molecule_rows if row["id"] in created_by_id]
+        
+        logger.info(f"Batch created {len(created)} molecules")
+        
         # Return statistics
         return {
             "created": created,
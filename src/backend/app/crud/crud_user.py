@@ -1,12 +1,48 @@
 from typing import Optional, Any, Dict, List, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, update, select, func, event, inspect
+from sqlalchemy.orm.exc import ObjectDeletedError
 
 from .base import CRUDBase
 from ..models.user import User
 from ..schemas.user import UserCreate, UserUpdate
 from ..db.session import db_session
 
+# Session.info key for the users a session has flushed or looked up, by lowercased email
+EMAIL_CACHE_KEY = "user_email_cache"
+
+
+@event.listens_for(Session, "after_flush")
+def _update_email_cache(session: Session, flush_context: Any) -> None:
+    """Keep a session's email cache in step with the users it writes."""
+    cache = session.info.get(EMAIL_CACHE_KEY)
+    if cache is None and not any(isinstance(obj, User) for obj in session.new):
+        return
+    cache = session.info.setdefault(EMAIL_CACHE_KEY, {})
+    
+    # Forget changed and deleted users under any email, then re-add current ones.
+    # Only already-loaded emails are read, so no SQL is emitted from inside the flush.
+    stale = {id(obj) for obj in (*session.dirty, *session.deleted) if isinstance(obj, User)}
+    for key in [key for key, cached_user in cache.items() if id(cached_user) in stale]:
+        del cache[key]
+    for obj in (*session.new, *session.dirty):
+        if isinstance(obj, User) and obj not in session.deleted:
+            email = inspect(obj).dict.get("email")
+            if email:
+                cache[email.lower()] = obj
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_email_cache(session: Session, previous_transaction: Any) -> None:
+    """Drop the email cache when a session rolls back, as cached users may no longer exist."""
+    session.info.pop(EMAIL_CACHE_KEY, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_email_cache_on_commit(session: Session) -> None:
+    """Drop the email cache at commit, as other sessions may change or delete users from here on."""
+    session.info.pop(EMAIL_CACHE_KEY, None)
+
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """CRUD operations for User model with specialized methods for user management"""
@@ -15,6 +51,9 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         """
         Get a user by email address
         
+        Users the session has already flushed or looked up in its current transaction are
+        served from its email cache without a query.
+        
         Args:
             email: User's email address
             db: Optional database session
@@ -23,7 +62,39 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             User instance if found, None otherwise
         """
         db_session_local = db or db_session
-        return db_session_local.query(User).filter(User.email.ilike(email)).first()
+        key = email.lower()
+        
+        cache = db_session_local.info.get(EMAIL_CACHE_KEY, {})
+        cached_user = cache.get(key)
+        if cached_user is not None and cached_user in db_session_local:
+            try:
+                # Reading the email reloads an expired user, so a changed email is noticed
+                if cached_user.email.lower() == key:
+                    return cached_user
+            except ObjectDeletedError:
+                pass
+            cache.pop(key, None)
+        
+        db_user = db_session_local.query(User).filter(func.lower(User.email) == key).first()
+        if db_user is not None:
+            db_session_local.info.setdefault(EMAIL_CACHE_KEY, {})[key] = db_user
+        return db_user
+    
+    def email_exists(self, email: str, db: Optional[Session] = None) -> bool:
+        """
+        Check whether a user with the given email address exists
+        
+        Only the ID column is selected, for callers that do not need the user itself.
+        
+        Args:
+            email: Email address to check (case-insensitive)
+            db: Optional database session
+            
+        Returns:
+            True if a user has this email, False otherwise
+        """
+        db_session_local = db or db_session
+        return db_session_local.query(User.id).filter(func.lower(User.email) == email.lower()).first() is not None
     
     def create(self, obj_in: UserCreate, db: Optional[Session] = None) -> User:
         """
@@ -54,7 +125,48 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         
         return db_obj
     
-    def update(self, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]], db: Optional[Session] = None) -> User:
+    def bulk_create(self, objs_in: List[UserCreate], db: Optional[Session] = None) -> List[User]:
+        """
+        Create multiple users with password hashing in a single transaction
+    
+        The users are flushed together, which SQLAlchemy sends as one multi-row INSERT,
+        and reloaded with a single query after the commit.
+    
+        Args:
+            objs_in: List of user data for creation
+            db: Optional database session
+    
+        Returns:
+            List of created user instances, in input order
+        """
+        db_session_local = db or db_session
+    
+        db_objs = []
+        for obj_in in objs_in:
+            db_obj = User.from_dict(obj_in.model_dump(exclude={"password"}))
+            db_obj.set_password(obj_in.password)
+            db_objs.append(db_obj)
+    
+        # Add all users and commit once
+        db_session_local.add_all(db_objs)
+        db_session_local.flush()
+        user_ids = [db_obj.id for db_obj in db_objs]
+        db_session_local.commit()
+    
+        # Reload the expired instances with one SELECT instead of a refresh per user
+        loaded = {
+            db_obj.id: db_obj
+            for db_obj in db_session_local.query(User).filter(User.id.in_(user_ids)).all()
+        }
+        return [loaded[user_id] for user_id in user_ids]
+    
+    def update(
+        self,
+        db_obj: User,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        db: Optional[Session] = None,
+        flush: bool = False
+    ) -> User:
         """
         Update a user, handling password updates securely
         
@@ -62,6 +174,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             db_obj: Existing user to update
             obj_in: User data for updating
             db: Optional database session
+            flush: Only flush the changes, leaving the commit to the caller
             
         Returns:
             Updated user instance
@@ -81,6 +194,15 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             # Remove password from update data
             del update_data["password"]
         
+        if flush:
+            # Write the changes without ending the transaction or re-reading the row
+            for key, value in update_data.items():
+                if hasattr(db_obj, key):
+                    setattr(db_obj, key, value)
+            db_session_local.add(db_obj)
+            db_session_local.flush()
+            return db_obj
+        
         # Update remaining fields using parent update method
         return super().update(db_obj, update_data, db=db_session_local)
     
@@ -140,6 +262,32 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         """
         return user.is_superuser
     
+    def set_flags(self, db_obj: User, db: Optional[Session] = None, **flags: bool) -> User:
+        """
+        Set a user's account flags with a single UPDATE statement
+        
+        Args:
+            db_obj: User to update
+            db: Optional database session
+            **flags: New values for is_active and/or is_superuser
+            
+        Returns:
+            The user instance, reloaded on next attribute access
+            
+        Raises:
+            ValueError: If a flag other than is_active or is_superuser is given
+        """
+        unknown_flags = set(flags) - {"is_active", "is_superuser"}
+        if unknown_flags:
+            raise ValueError(f"Unknown user flags: {', '.join(sorted(unknown_flags))}")
+        
+        db_session_local = db or db_session
+        
+        db_session_local.execute(update(User).where(User.id == db_obj.id).values(**flags))
+        db_session_local.commit()
+        
+        return db_obj
+    
     def get_by_organization(
         self, 
         organization_id: Any, 
@@ -162,10 +310,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db_session_local = db or db_session
         
         # Query users by organization ID
-        query = db_session_local.query(User).filter(User.organization_id == organization_id)
+        condition = User.organization_id == organization_id
+        query = db_session_local.query(User).filter(condition)
         
-        # Get total count
-        total = query.count()
+        # Count directly on the table rather than wrapping the full SELECT in a subquery
+        total = db_session_local.execute(select(func.count()).select_from(User).where(condition)).scalar()
         
         # Apply pagination
         users = query.offset(skip).limit(limit).all()
@@ -204,15 +353,14 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         search_pattern = f"%{query}%"
         
         # Query users matching the search pattern in email or full name
-        query_obj = db_session_local.query(User).filter(
-            or_(
-                User.email.ilike(search_pattern),
-                User.full_name.ilike(search_pattern)
-            )
+        condition = or_(
+            User.email.ilike(search_pattern),
+            User.full_name.ilike(search_pattern)
         )
+        query_obj = db_session_local.query(User).filter(condition)
         
         # Get total count
-        total = query_obj.count()
+        total = db_session_local.execute(select(func.count()).select_from(User).where(condition)).scalar()
         
         # Apply pagination
         users = query_obj.offset(skip).limit(limit).all()
@@ -248,10 +396,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db_session_local = db or db_session
         
         # Query users by role
-        query = db_session_local.query(User).filter(User.role == role)
+        condition = User.role == role
+        query = db_session_local.query(User).filter(condition)
         
         # Get total count
-        total = query.count()
+        total = db_session_local.execute(select(func.count()).select_from(User).where(condition)).scalar()
         
         # Apply pagination
         users = query.offset(skip).limit(limit).all()
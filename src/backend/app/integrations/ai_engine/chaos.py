@@ -0,0 +1,112 @@
+"""
+Fault injection for exercising the AI Engine client's resilience paths.
+
+ChaosMiddleware is a requests transport adapter that fails a configurable share of
+requests the way a struggling AI engine would: connection failures, timeouts, 5xx and
+429 responses, malformed bodies and slow responses. Faults are drawn from a seeded
+random generator, so a given rule and seed always produce the same sequence, which
+keeps reliability tests deterministic.
+"""
+
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Faults in the order their probabilities are laid out on [0, 1)
+FAULTS = ("connection", "timeout", "5xx", "429", "malformed", "slow")
+
+
+@dataclass(frozen=True)
+class ChaosRule:
+    """Probabilities of each fault, per request, and the seed they are drawn with."""
+
+    p_connection: float = 0.0
+    p_timeout: float = 0.0
+    p_5xx: float = 0.0
+    p_429: float = 0.0
+    p_malformed: float = 0.0
+    p_slow: float = 0.0
+    status_5xx: int = 503
+    slow_seconds: float = 1.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if sum(getattr(self, f"p_{fault}") for fault in FAULTS) > 1:
+            raise ValueError("Fault probabilities must not add up to more than 1")
+
+
+class ChaosMiddleware(HTTPAdapter):
+    """Transport adapter that injects faults into requests according to a ChaosRule."""
+
+    def __init__(self, rule: ChaosRule, **kwargs):
+        """
+        Initialize the adapter with its rule and a generator seeded from it.
+
+        Args:
+            rule: Fault probabilities and seed
+            **kwargs: Passed through to HTTPAdapter
+        """
+        super().__init__(**kwargs)
+        self.rule = rule
+        self.injected: Counter = Counter()
+        self._random = random.Random(rule.seed)
+
+    def install(self, session: requests.Session) -> "ChaosMiddleware":
+        """
+        Route all of a session's requests through this adapter.
+
+        Args:
+            session: Session to install the adapter on, such as AIEngineClient.session
+
+        Returns:
+            The adapter, for chaining
+        """
+        session.mount("http://", self)
+        session.mount("https://", self)
+        return self
+
+    def _choose_fault(self) -> Optional[str]:
+        """Draw the fault for the next request, or None to let it through."""
+        roll = self._random.random()
+        for fault in FAULTS:
+            roll -= getattr(self.rule, f"p_{fault}")
+            if roll < 0:
+                return fault
+        return None
+
+    def _fault_response(self, request: requests.PreparedRequest, status_code: int, body: bytes) -> requests.Response:
+        """Build the response the adapter returns in place of the AI engine's."""
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Fail the request with the drawn fault, or send it on to the AI engine."""
+        fault = self._choose_fault()
+        if fault is None:
+            return super().send(request, **kwargs)
+
+        self.injected[fault] += 1
+        if fault == "connection":
+            raise requests.exceptions.ConnectionError("Injected connection failure", request=request)
+        if fault == "timeout":
+            raise requests.exceptions.ReadTimeout("Injected timeout", request=request)
+        if fault == "5xx":
+            return self._fault_response(request, self.rule.status_5xx, b'{"message": "Injected server error"}')
+        if fault == "429":
+            return self._fault_response(request, 429, b'{"message": "Injected rate limit"}')
+        if fault == "malformed":
+            return self._fault_response(request, 200, b'{"job_id": ')
+
+        time.sleep(self.rule.slow_seconds)
+        return super().send(request, **kwargs)
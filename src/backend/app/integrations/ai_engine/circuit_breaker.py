@@ -0,0 +1,136 @@
+"""
+Circuit breaker for asynchronous AI Engine calls.
+
+pybreaker guards the synchronous client methods, but its state is protected by a
+threading lock and its call() cannot await a coroutine. AsyncCircuitBreaker implements
+the same CLOSED -> OPEN -> HALF_OPEN state machine for coroutines. State transitions
+never await, so they are atomic on the event loop and need no lock; concurrent calls
+only contend while the breaker is half-open, where a single trial call is let through.
+"""
+
+import functools
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from pybreaker import CircuitBreakerError  # pybreaker ^1.0.0
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half-open"
+
+
+class AsyncCircuitBreaker:
+    """Circuit breaker for coroutine functions, mirroring pybreaker.CircuitBreaker."""
+
+    def __init__(
+        self,
+        fail_max: int = 5,
+        reset_timeout: float = 60,
+        exclude: Iterable[Callable[[BaseException], bool]] = (),
+        name: Optional[str] = None
+    ):
+        """
+        Initialize a closed circuit breaker.
+
+        Args:
+            fail_max: Consecutive failures after which the breaker opens
+            reset_timeout: Seconds the breaker stays open before allowing a trial call
+            exclude: Predicates for exceptions that should not count as failures
+            name: Name used in error messages
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self._exclude = list(exclude)
+        self._state = STATE_CLOSED
+        self._fail_counter = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def current_state(self) -> str:
+        """Current state of the breaker: closed, open or half-open."""
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            return STATE_HALF_OPEN
+        return self._state
+
+    @property
+    def fail_counter(self) -> int:
+        """Number of consecutive failures counted since the breaker last closed."""
+        return self._fail_counter
+
+    def open(self) -> None:
+        """Open the breaker, rejecting calls until reset_timeout has passed."""
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def close(self) -> None:
+        """Close the breaker and reset its failure count."""
+        self._state = STATE_CLOSED
+        self._fail_counter = 0
+        self._trial_in_flight = False
+
+    def _before_call(self) -> None:
+        """Let a call through or reject it, moving from open to half-open when due."""
+        state = self.current_state
+        if state == STATE_CLOSED:
+            return
+        if state == STATE_HALF_OPEN and not self._trial_in_flight:
+            self._state = STATE_HALF_OPEN
+            self._trial_in_flight = True
+            return
+        raise CircuitBreakerError(f"Circuit breaker {self.name} is open" if self.name else "Circuit breaker is open")
+
+    def _on_success(self) -> None:
+        """Close the breaker after a successful call or trial."""
+        # Calls started before the breaker opened do not close it when they finish
+        if self._state != STATE_OPEN:
+            self.close()
+
+    def _on_failure(self) -> None:
+        """Count a failure, opening the breaker after a failed trial or fail_max failures."""
+        if self._state == STATE_OPEN:
+            return
+        self._fail_counter += 1
+        if self._state == STATE_HALF_OPEN or self._fail_counter >= self.fail_max:
+            self.open()
+
+    async def call_async(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        Await func(*args, **kwargs) under the breaker.
+
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The result of func
+
+        Raises:
+            CircuitBreakerError: If the breaker is open
+        """
+        self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            if any(excluded(e) for excluded in self._exclude):
+                # Excluded errors say nothing about the backend, as with pybreaker
+                self._on_success()
+            else:
+                self._on_failure()
+            raise
+        except BaseException:
+            # A cancelled trial must not leave the breaker waiting on it forever
+            self._trial_in_flight = False
+            raise
+        self._on_success()
+        return result
+
+    def __call__(self, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """Decorate a coroutine function so every call goes through the breaker."""
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await self.call_async(func, *args, **kwargs)
+        return wrapper
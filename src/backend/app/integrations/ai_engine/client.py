@@ -6,13 +6,24 @@ It handles API communication, request/response processing, error handling, and i
 resilience patterns for the AI integration workflow.
 """
 
+import asyncio
+import random
 import requests
+import httpx  # httpx ^0.24.0
+import ijson  # ijson ^3.2.0
+import orjson  # orjson ^3.9.1
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 import json
+import socket
+import threading
 import time
 import uuid
-from typing import List, Dict, Optional, Any, Union
+from typing import List, Dict, Optional, Any, Union, Mapping
+from urllib.parse import urlparse
 
 from pybreaker import CircuitBreaker  # pybreaker ^1.0.0
+from pydantic import TypeAdapter
 
 from ...core.config import settings
 from ...core.logging import get_logger
@@ -30,6 +41,8 @@ from .exceptions import (
     InvalidPredictionParametersError,
 )
 
+from .circuit_breaker import AsyncCircuitBreaker
+from .rate_limiter import AsyncRateLimiter, parse_rate_limit
 from .models import (
     PredictionRequest,
     PredictionResponse,
@@ -37,6 +50,7 @@ from .models import (
     PredictionJobStatus,
     BatchPredictionRequest,
     BatchPredictionResponse,
+    MoleculePrediction,
     AIModelInfo,
     MAX_BATCH_SIZE,
 )
@@ -46,13 +60,83 @@ logger = get_logger(__name__)
 
 # Default configuration values
 DEFAULT_TIMEOUT = 30  # seconds
+MAX_SMILES_LENGTH = 1000  # matches the molecule schema's SMILES limit
+MAX_ASYNC_CONNECTIONS = 64
+POOL_CONNECTIONS = 32  # host pools kept by the sync session
+POOL_MAXSIZE = 64  # connections kept per host pool
+KEEPALIVE_EXPIRY = 85  # seconds
 DEFAULT_RETRIES = 3
+DEFAULT_MAX_CONCURRENCY = 32  # in-flight requests per client
 RETRY_BACKOFF_FACTOR = 0.5
+MAX_RETRY_BACKOFF = 64  # seconds
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})  # rate limiting and transient upstream errors
 DEFAULT_POLL_INTERVAL = 5  # seconds
+MIN_POLL_INTERVAL = 1  # seconds
+MAX_POLL_INTERVAL = 30  # seconds
 DEFAULT_MAX_WAIT_TIME = 300  # seconds (5 minutes)
 
-# Initialize circuit breaker for AI engine requests
-ai_engine_circuit_breaker = CircuitBreaker(fail_max=5, reset_timeout=60)
+# API endpoints, relative to the API URL; templates take their IDs with the % operator
+PREDICTIONS_ENDPOINT = "/predictions"
+PREDICTION_STATUS_ENDPOINT = "/predictions/%s/status"
+PREDICTION_RESULTS_ENDPOINT = "/predictions/%s/results"
+BATCH_PREDICTIONS_ENDPOINT = "/predictions/batch"
+BATCH_PREDICTION_STATUS_ENDPOINT = "/predictions/batch/%s"
+MODELS_ENDPOINT = "/models"
+MODEL_ENDPOINT = "/models/%s"
+MODEL_VERSION_ENDPOINT = "/models/%s/versions/%s"
+HEALTH_ENDPOINT = "/health"
+
+# Set of supported properties for constant-time membership checks
+_PREDICTABLE_PROPERTIES = frozenset(PREDICTABLE_PROPERTIES)
+
+# Validators for the responses parsed on every poll, built once at import
+_PREDICTION_RESPONSE_ADAPTER = TypeAdapter(PredictionResponse)
+_JOB_STATUS_ADAPTER = TypeAdapter(PredictionJobStatus)
+_MOLECULE_PREDICTION_ADAPTER = TypeAdapter(MoleculePrediction)
+
+
+def is_client_error(exception: Exception) -> bool:
+    """
+    Check whether an exception was caused by the request rather than the AI engine.
+    
+    Invalid requests (4xx responses other than 429) say nothing about the engine's
+    health, so they are excluded from the circuit breaker's failure count.
+    
+    Args:
+        exception: Exception raised by a client method
+        
+    Returns:
+        True for client-side errors, False otherwise
+    """
+    if not isinstance(exception, AIEngineException):
+        return False
+    if isinstance(exception, AIEngineResponseError):
+        status = exception.response_status
+    else:
+        status = getattr(exception, "status_code", None)
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+# Circuit breakers per endpoint group, so failing predictions do not also block
+# model lookups or health checks
+predictions_circuit_breaker = CircuitBreaker(
+    fail_max=5, reset_timeout=60, exclude=[is_client_error], name="ai_engine_predictions"
+)
+models_circuit_breaker = CircuitBreaker(
+    fail_max=5, reset_timeout=60, exclude=[is_client_error], name="ai_engine_models"
+)
+health_circuit_breaker = CircuitBreaker(fail_max=10, reset_timeout=10, name="ai_engine_health")
+
+# Guards the async prediction methods, which pybreaker's synchronous call() cannot await
+async_predictions_circuit_breaker = AsyncCircuitBreaker(
+    fail_max=5, reset_timeout=60, exclude=[is_client_error], name="ai_engine_predictions_async"
+)
+
+circuit_breakers = {
+    "predictions": predictions_circuit_breaker,
+    "models": models_circuit_breaker,
+    "health": health_circuit_breaker,
+}
 
 
 def validate_api_response(response: requests.Response) -> Dict[str, Any]:
@@ -122,6 +206,131 @@ def validate_api_response(response: requests.Response) -> Dict[str, Any]:
         )
 
 
+def parse_prediction_results(stream: Any) -> PredictionResponse:
+    """
+    Parse a prediction results body incrementally from a file-like stream.
+    
+    Each entry of the results array is validated as soon as it has been read, so the
+    raw body and its full dictionary tree are never held in memory at once.
+    
+    Args:
+        stream: File-like object yielding the JSON response body
+        
+    Returns:
+        Parsed prediction response
+        
+    Raises:
+        AIEngineResponseError: If the body is not valid JSON
+    """
+    fields: Dict[str, Any] = {}
+    results: Optional[List[MoleculePrediction]] = None
+    builder = None
+    target = None
+    depth = 0
+    
+    try:
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if builder is not None:
+                # Inside a top-level field or a results entry, build it up event by event
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+            elif event == "map_key" or prefix == "":
+                continue
+            elif prefix == "results":
+                if event == "start_array":
+                    results = []
+                continue
+            else:
+                # Start of a top-level field value ("job_id") or a results entry ("results.item")
+                target = prefix
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1 if event in ("start_map", "start_array") else 0
+            
+            if builder is not None and depth == 0:
+                if target == "results.item":
+                    results.append(_MOLECULE_PREDICTION_ADAPTER.validate_python(builder.value))
+                else:
+                    fields[target] = builder.value
+                builder = None
+    except ijson.JSONError as e:
+        raise AIEngineResponseError(
+            message="Failed to parse API response as JSON",
+            details={"error": str(e)}
+        )
+    
+    return _PREDICTION_RESPONSE_ADAPTER.validate_python({**fields, "results": results})
+
+
+def validate_properties(properties: List[str]) -> None:
+    """
+    Check that every requested property can be predicted by the AI engine.
+    
+    Args:
+        properties: Requested property names
+        
+    Raises:
+        UnsupportedPropertyError: If any property is not supported, naming all of them
+    """
+    invalid = set(properties) - _PREDICTABLE_PROPERTIES
+    if invalid:
+        raise UnsupportedPropertyError(property_name=", ".join(sorted(invalid)))
+
+
+def validate_smiles(smiles: List[str]) -> None:
+    """
+    Check a batch of SMILES strings before it is sent to the AI engine.
+    
+    Args:
+        smiles: SMILES strings to predict
+        
+    Raises:
+        BatchSizeExceededError: If the batch exceeds MAX_BATCH_SIZE
+        InvalidPredictionParametersError: If any SMILES exceeds MAX_SMILES_LENGTH
+    """
+    if len(smiles) > MAX_BATCH_SIZE:
+        raise BatchSizeExceededError(
+            batch_size=len(smiles),
+            max_batch_size=MAX_BATCH_SIZE
+        )
+    
+    # A single pass over the lengths, run by max() rather than a Python-level loop
+    longest = max(map(len, smiles), default=0)
+    if longest > MAX_SMILES_LENGTH:
+        raise InvalidPredictionParametersError(
+            message=f"SMILES exceeds maximum length of {MAX_SMILES_LENGTH} characters",
+            invalid_parameters={"smiles_length": longest}
+        )
+
+
+def calculate_poll_wait(attempt: int, min_interval: float, max_interval: float) -> float:
+    """
+    Calculates the delay before the next status poll using exponential backoff with jitter.
+    
+    Args:
+        attempt: Number of polls already made, starting at 0
+        min_interval: Delay after the first poll in seconds
+        max_interval: Upper bound of the backoff in seconds, before jitter is added
+        
+    Returns:
+        Seconds to wait before polling again
+    """
+    return min(max_interval, min_interval * 2 ** attempt) + random.uniform(0, 1)
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter that enables TCP keep-alive on its pooled connections."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ])
+        super().init_poolmanager(*args, **kwargs)
+
+
 class AIEngineClient:
     """Client for interacting with the external AI prediction engine."""
     
@@ -131,7 +340,8 @@ class AIEngineClient:
         api_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_RETRIES,
-        retry_backoff_factor: float = RETRY_BACKOFF_FACTOR
+        retry_backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
     ):
         """
         Initialize the AI Engine client with configuration.
@@ -142,24 +352,50 @@ class AIEngineClient:
             timeout: Timeout for API requests in seconds
             max_retries: Maximum number of retry attempts for failed requests
             retry_backoff_factor: Backoff factor for retry delays
+            max_concurrency: Maximum number of requests in flight at once
         """
         self.api_url = api_url or settings.AI_ENGINE_API_URL
+        # Endpoints are appended to this, so request URLs are a single concatenation
+        self._base_url = self.api_url.rstrip('/')
         self.api_key = api_key or settings.AI_ENGINE_API_KEY
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff_factor = retry_backoff_factor
+        self.max_concurrency = max_concurrency
         
-        # Initialize session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Bulkheads capping in-flight requests, so fan-out queues here instead of
+        # overloading the AI engine into rate limiting
+        self._bulkhead = asyncio.Semaphore(max_concurrency)
+        self._sync_bulkhead = threading.BoundedSemaphore(max_concurrency)
+        
+        # Per-host async rate limiters, sized from the X-RateLimit-Limit response header
+        self._limiters: Dict[str, AsyncRateLimiter] = {}
+        
+        self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "X-API-Key": self.api_key
-        })
+        }
+        
+        # Initialize session for connection pooling. Retries are handled by _make_request,
+        # so the adapter itself never retries.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.headers["Connection"] = "keep-alive"
+        adapter = KeepAliveAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Async HTTP client, created on first use and reused for the client's lifetime
+        self._async_session: Optional[httpx.AsyncClient] = None
         
         logger.info(f"Initialized AI Engine client with API URL: {self.api_url}")
     
-    @ai_engine_circuit_breaker
+    @predictions_circuit_breaker
     def predict_properties(self, request: PredictionRequest) -> PredictionResponse:
         """
         Submit a prediction request to the AI engine.
@@ -178,37 +414,31 @@ class AIEngineClient:
             AIEngineResponseError: If AI Engine returns an error response
         """
         # Validate properties against supported properties
-        for prop in request.properties:
-            if prop not in PREDICTABLE_PROPERTIES:
-                raise UnsupportedPropertyError(property_name=prop)
+        validate_properties(request.properties)
         
-        # Check batch size
-        if len(request.smiles) > MAX_BATCH_SIZE:
-            raise BatchSizeExceededError(
-                batch_size=len(request.smiles),
-                max_batch_size=MAX_BATCH_SIZE
-            )
+        # Check batch size and SMILES lengths
+        validate_smiles(request.smiles)
         
         # Prepare request payload
-        payload = request.dict()
+        payload = request.model_dump(mode="json")
         logger.info(f"Submitting prediction request for {len(request.smiles)} molecules "
                     f"and {len(request.properties)} properties")
         
         # Send request to AI Engine API
         response = self._make_request(
             method="POST",
-            endpoint="/predictions",
+            endpoint=PREDICTIONS_ENDPOINT,
             json_data=payload
         )
         
         # Validate and parse response
         data = validate_api_response(response)
-        result = PredictionResponse(**data)
+        result = _PREDICTION_RESPONSE_ADAPTER.validate_python(data)
         
         logger.info(f"Successfully submitted prediction request, job ID: {result.job_id}")
         return result
     
-    @ai_engine_circuit_breaker
+    @predictions_circuit_breaker
     def get_prediction_status(self, job_id: str) -> PredictionJobStatus:
         """
         Check the status of a prediction job.
@@ -237,18 +467,18 @@ class AIEngineClient:
         # Send request to AI Engine API
         response = self._make_request(
             method="GET",
-            endpoint=f"/predictions/{job_id}/status"
+            endpoint=PREDICTION_STATUS_ENDPOINT % job_id
         )
         
         # Validate and parse response
         data = validate_api_response(response)
-        result = PredictionJobStatus(**data)
+        result = _JOB_STATUS_ADAPTER.validate_python(data)
         
         logger.info(f"Job {job_id} status: {result.status}, "
                     f"progress: {result.completed_molecules}/{result.total_molecules}")
         return result
     
-    @ai_engine_circuit_breaker
+    @predictions_circuit_breaker
     def get_prediction_results(self, job_id: str) -> PredictionResponse:
         """
         Get the results of a completed prediction job.
@@ -274,15 +504,21 @@ class AIEngineClient:
                 details={"job_id": job_id}
             )
         
-        # Send request to AI Engine API
+        # Send request to AI Engine API, streaming the potentially large results body
         response = self._make_request(
             method="GET",
-            endpoint=f"/predictions/{job_id}/results"
+            endpoint=PREDICTION_RESULTS_ENDPOINT % job_id,
+            stream=True
         )
         
         # Validate and parse response
-        data = validate_api_response(response)
-        result = PredictionResponse(**data)
+        try:
+            if not 200 <= response.status_code < 300:
+                validate_api_response(response)
+            response.raw.decode_content = True
+            result = parse_prediction_results(response.raw)
+        finally:
+            response.close()
         
         logger.info(f"Successfully retrieved results for job {job_id}")
         return result
@@ -333,7 +569,199 @@ class AIEngineClient:
             details={"job_id": job_id}
         )
     
-    @ai_engine_circuit_breaker
+    @async_predictions_circuit_breaker
+    async def predict_properties_async(self, request: PredictionRequest) -> PredictionResponse:
+        """
+        Submit a prediction request to the AI engine over the shared async HTTP client.
+        
+        Args:
+            request: Prediction request model containing SMILES and properties
+            
+        Returns:
+            Prediction response with job ID and status
+            
+        Raises:
+            UnsupportedPropertyError: If requested properties are not supported
+            BatchSizeExceededError: If batch size exceeds maximum limit
+            AIEngineConnectionError: If connection to AI Engine fails
+            AIEngineTimeoutError: If request times out
+            AIEngineResponseError: If AI Engine returns an error response
+        """
+        validate_properties(request.properties)
+        
+        validate_smiles(request.smiles)
+        
+        response = await self._make_request_async(
+            method="POST",
+            endpoint=PREDICTIONS_ENDPOINT,
+            json_data=request.model_dump(mode="json")
+        )
+        
+        data = validate_api_response(response)
+        result = _PREDICTION_RESPONSE_ADAPTER.validate_python(data)
+        
+        logger.info(f"Successfully submitted prediction request, job ID: {result.job_id}")
+        return result
+    
+    @async_predictions_circuit_breaker
+    async def get_prediction_status_async(self, job_id: str) -> PredictionJobStatus:
+        """
+        Check the status of a prediction job over the shared async HTTP client.
+        
+        Args:
+            job_id: ID of the prediction job to check
+            
+        Returns:
+            Current status of the prediction job
+            
+        Raises:
+            PredictionJobNotFoundError: If job ID does not exist
+            AIEngineConnectionError: If connection to AI Engine fails
+            AIEngineTimeoutError: If request times out
+            AIEngineResponseError: If AI Engine returns an error response
+        """
+        try:
+            uuid.UUID(job_id)
+        except ValueError:
+            raise InvalidPredictionParametersError(
+                message="Invalid job ID format",
+                details={"job_id": job_id}
+            )
+        
+        response = await self._make_request_async(
+            method="GET",
+            endpoint=PREDICTION_STATUS_ENDPOINT % job_id
+        )
+        
+        data = validate_api_response(response)
+        return _JOB_STATUS_ADAPTER.validate_python(data)
+    
+    @async_predictions_circuit_breaker
+    async def get_prediction_results_async(self, job_id: str) -> PredictionResponse:
+        """
+        Get the results of a completed prediction job over the shared async HTTP client.
+        
+        Args:
+            job_id: ID of the prediction job
+            
+        Returns:
+            Prediction results for the job
+            
+        Raises:
+            PredictionJobNotFoundError: If job ID does not exist
+            AIEngineConnectionError: If connection to AI Engine fails
+            AIEngineTimeoutError: If request times out
+            AIEngineResponseError: If AI Engine returns an error response
+        """
+        try:
+            uuid.UUID(job_id)
+        except ValueError:
+            raise InvalidPredictionParametersError(
+                message="Invalid job ID format",
+                details={"job_id": job_id}
+            )
+        
+        response = await self._make_request_async(
+            method="GET",
+            endpoint=PREDICTION_RESULTS_ENDPOINT % job_id
+        )
+        
+        data = validate_api_response(response)
+        result = _PREDICTION_RESPONSE_ADAPTER.validate_python(data)
+        
+        logger.info(f"Successfully retrieved results for job {job_id}")
+        return result
+    
+    async def wait_for_prediction_completion_async(
+        self,
+        job_id: str,
+        max_wait_time: int = DEFAULT_MAX_WAIT_TIME,
+        poll_interval_min: float = MIN_POLL_INTERVAL,
+        poll_interval_max: float = MAX_POLL_INTERVAL
+    ) -> PredictionResponse:
+        """
+        Wait for a prediction job to complete, polling with exponential backoff and jitter.
+        
+        Unlike wait_for_prediction_completion, this does not hold a thread while waiting,
+        so many jobs can be awaited concurrently on one event loop.
+        
+        Args:
+            job_id: ID of the prediction job
+            max_wait_time: Maximum time to wait in seconds
+            poll_interval_min: Delay after the first status check in seconds
+            poll_interval_max: Upper bound of the backoff between status checks in seconds
+            
+        Returns:
+            Prediction results after job completion
+            
+        Raises:
+            AIEngineTimeoutError: If job does not complete within max_wait_time
+            AIEngineException: If job fails or another error occurs
+        """
+        wait_time = 0.0
+        attempt = 0
+        
+        while wait_time < max_wait_time:
+            status = await self.get_prediction_status_async(job_id)
+            
+            if status.status == "completed":
+                return await self.get_prediction_results_async(job_id)
+            
+            if status.status == "failed":
+                raise AIEngineException(
+                    message=f"Prediction job {job_id} failed",
+                    details={"job_id": job_id, "status": status.dict()}
+                )
+            
+            # Job is still processing, back off without overshooting max_wait_time
+            delay = min(
+                calculate_poll_wait(attempt, poll_interval_min, poll_interval_max),
+                max_wait_time - wait_time
+            )
+            await asyncio.sleep(delay)
+            wait_time += delay
+            attempt += 1
+        
+        raise AIEngineTimeoutError(
+            message=f"Prediction job {job_id} did not complete within {max_wait_time} seconds",
+            timeout_seconds=max_wait_time,
+            details={"job_id": job_id}
+        )
+    
+    async def wait_for_all(
+        self,
+        job_ids: List[str],
+        max_wait_time: int = DEFAULT_MAX_WAIT_TIME,
+        max_concurrency: Optional[int] = None
+    ) -> List[Union[PredictionResponse, Exception]]:
+        """
+        Wait for several prediction jobs concurrently.
+        
+        The jobs are polled side by side, so the total wait is that of the slowest job
+        rather than the sum of all of them.
+        
+        Args:
+            job_ids: IDs of the prediction jobs
+            max_wait_time: Maximum time to wait for each job in seconds
+            max_concurrency: Maximum number of jobs polled at once (defaults to the
+                client's max_concurrency)
+            
+        Returns:
+            For each job ID, in order, its prediction results or the exception raised
+            while waiting for it
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        
+        async def wait_for_job(job_id: str) -> PredictionResponse:
+            async with semaphore:
+                return await self.wait_for_prediction_completion_async(job_id, max_wait_time)
+        
+        return await asyncio.gather(
+            *(wait_for_job(job_id) for job_id in job_ids),
+            return_exceptions=True
+        )
+    
+    @predictions_circuit_breaker
     def submit_batch_prediction(self, request: BatchPredictionRequest) -> BatchPredictionResponse:
         """
         Submit a batch prediction request for multiple molecules.
@@ -352,9 +780,7 @@ class AIEngineClient:
             AIEngineResponseError: If AI Engine returns an error response
         """
         # Validate properties against supported properties
-        for prop in request.properties:
-            if prop not in PREDICTABLE_PROPERTIES:
-                raise UnsupportedPropertyError(property_name=prop)
+        validate_properties(request.properties)
         
         # Check batch size
         if len(request.molecule_ids) > MAX_BATCH_SIZE:
@@ -364,14 +790,14 @@ class AIEngineClient:
             )
         
         # Prepare request payload
-        payload = request.dict()
+        payload = request.model_dump(mode="json")
         logger.info(f"Submitting batch prediction request for {len(request.molecule_ids)} molecules "
                     f"and {len(request.properties)} properties")
         
         # Send request to AI Engine API
         response = self._make_request(
             method="POST",
-            endpoint="/predictions/batch",
+            endpoint=BATCH_PREDICTIONS_ENDPOINT,
             json_data=payload
         )
         
@@ -382,7 +808,45 @@ class AIEngineClient:
         logger.info(f"Successfully submitted batch prediction request, batch ID: {result.batch_id}")
         return result
     
-    @ai_engine_circuit_breaker
+    @async_predictions_circuit_breaker
+    async def submit_batch_prediction_async(self, request: BatchPredictionRequest) -> BatchPredictionResponse:
+        """
+        Submit a batch prediction request over the shared async HTTP client.
+        
+        Args:
+            request: Batch prediction request with molecule IDs
+            
+        Returns:
+            Batch prediction response with batch ID and status
+            
+        Raises:
+            UnsupportedPropertyError: If requested properties are not supported
+            BatchSizeExceededError: If batch size exceeds maximum limit
+            AIEngineConnectionError: If connection to AI Engine fails
+            AIEngineTimeoutError: If request times out
+            AIEngineResponseError: If AI Engine returns an error response
+        """
+        validate_properties(request.properties)
+        
+        if len(request.molecule_ids) > MAX_BATCH_SIZE:
+            raise BatchSizeExceededError(
+                batch_size=len(request.molecule_ids),
+                max_batch_size=MAX_BATCH_SIZE
+            )
+        
+        response = await self._make_request_async(
+            method="POST",
+            endpoint=BATCH_PREDICTIONS_ENDPOINT,
+            json_data=request.model_dump(mode="json")
+        )
+        
+        data = validate_api_response(response)
+        result = BatchPredictionResponse(**data)
+        
+        logger.info(f"Successfully submitted batch prediction request, batch ID: {result.batch_id}")
+        return result
+    
+    @predictions_circuit_breaker
     def get_batch_prediction_status(self, batch_id: str) -> BatchPredictionResponse:
         """
         Check the status of a batch prediction job.
@@ -411,7 +875,7 @@ class AIEngineClient:
         # Send request to AI Engine API
         response = self._make_request(
             method="GET",
-            endpoint=f"/predictions/batch/{batch_id}"
+            endpoint=BATCH_PREDICTION_STATUS_ENDPOINT % batch_id
         )
         
         # Validate and parse response
@@ -421,7 +885,7 @@ class AIEngineClient:
         logger.info(f"Batch {batch_id} status: {result.status}")
         return result
     
-    @ai_engine_circuit_breaker
+    @models_circuit_breaker
     def get_available_models(self) -> List[AIModelInfo]:
         """
         Get information about available AI prediction models.
@@ -437,7 +901,7 @@ class AIEngineClient:
         # Send request to AI Engine API
         response = self._make_request(
             method="GET",
-            endpoint="/models"
+            endpoint=MODELS_ENDPOINT
         )
         
         # Validate and parse response
@@ -447,7 +911,7 @@ class AIEngineClient:
         logger.info(f"Retrieved {len(models)} available AI models")
         return models
     
-    @ai_engine_circuit_breaker
+    @models_circuit_breaker
     def get_model_info(self, model_name: str, model_version: Optional[str] = None) -> AIModelInfo:
         """
         Get detailed information about a specific AI model.
@@ -465,9 +929,10 @@ class AIEngineClient:
             AIEngineResponseError: If AI Engine returns an error response
         """
         # Construct endpoint URL
-        endpoint = f"/models/{model_name}"
         if model_version:
-            endpoint += f"/versions/{model_version}"
+            endpoint = MODEL_VERSION_ENDPOINT % (model_name, model_version)
+        else:
+            endpoint = MODEL_ENDPOINT % model_name
         
         # Send request to AI Engine API
         response = self._make_request(
@@ -490,9 +955,10 @@ class AIEngineClient:
             True if API is healthy, False otherwise
         """
         try:
-            response = self._make_request(
+            response = health_circuit_breaker.call(
+                self._make_request,
                 method="GET",
-                endpoint="/health",
+                endpoint=HEALTH_ENDPOINT,
                 timeout=5  # Short timeout for health check
             )
             health_status = response.status_code == 200
@@ -509,17 +975,19 @@ class AIEngineClient:
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, str]] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        stream: bool = False
     ) -> requests.Response:
         """
         Internal method to make HTTP requests with retry logic.
         
         Args:
             method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint path
+            endpoint: API endpoint path, starting with '/'
             json_data: JSON data for request body
             params: Query parameters
             timeout: Request timeout in seconds
+            stream: Leave the body unread, for the caller to consume from response.raw
             
         Returns:
             HTTP response from the API
@@ -529,34 +997,37 @@ class AIEngineClient:
             AIEngineTimeoutError: If request times out
             AIEngineException: For other request exceptions
         """
-        url = f"{self.api_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        url = self._base_url + endpoint
         timeout = timeout if timeout is not None else self.timeout
         retry_count = 0
         
+        # Serialize the body once with orjson, not again on every retry
+        body = orjson.dumps(json_data) if json_data is not None else None
+        
         while True:
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    json=json_data,
-                    params=params,
-                    timeout=timeout
-                )
-                return response
+                with self._sync_bulkhead:
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        data=body,
+                        params=params,
+                        timeout=timeout,
+                        stream=stream
+                    )
+                # Only rate limiting and transient upstream errors are retried
+                if response.status_code not in RETRYABLE_STATUS_CODES or retry_count >= self.max_retries:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                response.close()
             
             except requests.exceptions.ConnectionError as e:
-                retry_count += 1
-                if retry_count > self.max_retries:
+                if retry_count >= self.max_retries:
                     raise AIEngineConnectionError(
                         message=f"Failed to connect to AI Engine after {self.max_retries} attempts",
                         details={"url": url, "error": str(e)}
                     )
-                
-                # Exponential backoff
-                wait_time = self.retry_backoff_factor * (2 ** (retry_count - 1))
-                logger.warning(f"Connection error, retrying in {wait_time:.2f} seconds "
-                              f"(attempt {retry_count}/{self.max_retries})")
-                time.sleep(wait_time)
+                reason = "Connection error"
             
             except requests.exceptions.Timeout as e:
                 raise AIEngineTimeoutError(
@@ -569,4 +1040,154 @@ class AIEngineClient:
                 raise AIEngineException(
                     message=f"Error making request to AI Engine: {str(e)}",
                     details={"url": url, "method": method, "error": str(e)}
-                )
\ No newline at end of file
+                )
+            
+            retry_count += 1
+            wait_time = self._retry_wait(retry_count)
+            logger.warning(f"{reason}, retrying in {wait_time:.2f} seconds "
+                          f"(attempt {retry_count}/{self.max_retries})")
+            time.sleep(wait_time)
+    
+    def _retry_wait(self, retry_count: int) -> float:
+        """
+        Delay before a retry, using exponential backoff with full jitter.
+        
+        Drawing the whole delay at random spreads out clients that failed together,
+        so they do not retry in lockstep when the AI engine recovers.
+        
+        Args:
+            retry_count: Number of the upcoming retry, starting at 1
+            
+        Returns:
+            Seconds to wait before retrying
+        """
+        ceiling = min(MAX_RETRY_BACKOFF, self.retry_backoff_factor * 2 ** (retry_count - 1))
+        return random.uniform(0, ceiling)
+    
+    @property
+    def async_session(self) -> httpx.AsyncClient:
+        """
+        Shared async HTTP client, created on first use.
+        
+        Keep-alive connections are pooled across calls until aclose() is awaited.
+        
+        Returns:
+            The client's httpx.AsyncClient
+        """
+        if self._async_session is None or self._async_session.is_closed:
+            self._async_session = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=MAX_ASYNC_CONNECTIONS,
+                    max_keepalive_connections=MAX_ASYNC_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY
+                )
+            )
+        return self._async_session
+    
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client and its pooled connections."""
+        if self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
+    
+    def _update_rate_limit(self, host: str, headers: Mapping[str, str]) -> None:
+        """
+        Size the host's rate limiter from the limit advertised in response headers.
+        
+        The limiter is only replaced when the advertised limit drops, so hosts settle
+        on the lowest ceiling they have reported.
+        
+        Args:
+            host: Host the response came from
+            headers: Response headers
+        """
+        max_rate = parse_rate_limit(headers)
+        if max_rate is None:
+            return
+        
+        limiter = self._limiters.get(host)
+        if limiter is None or max_rate < limiter.max_rate:
+            self._limiters[host] = AsyncRateLimiter(max_rate)
+            logger.info(f"Rate limiting AI Engine requests to {host} at {max_rate:.0f} "
+                       f"per {self._limiters[host].time_period} seconds")
+    
+    async def _make_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None
+    ) -> httpx.Response:
+        """
+        Internal method to make async HTTP requests with retry logic.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path, starting with '/'
+            json_data: JSON data for request body
+            params: Query parameters
+            timeout: Request timeout in seconds
+            
+        Returns:
+            HTTP response from the API
+            
+        Raises:
+            AIEngineConnectionError: If connection fails after all retries
+            AIEngineTimeoutError: If request times out
+            AIEngineException: For other request exceptions
+        """
+        url = self._base_url + endpoint
+        host = urlparse(url).netloc
+        timeout = timeout if timeout is not None else self.timeout
+        retry_count = 0
+        body = orjson.dumps(json_data) if json_data is not None else None
+        
+        while True:
+            try:
+                limiter = self._limiters.get(host)
+                if limiter is not None:
+                    await limiter.acquire()
+                
+                # The slot is held per attempt, not across retry backoff
+                async with self._bulkhead:
+                    response = await self.async_session.request(
+                        method=method,
+                        url=url,
+                        content=body,
+                        params=params,
+                        timeout=timeout
+                    )
+                self._update_rate_limit(host, response.headers)
+                if response.status_code not in RETRYABLE_STATUS_CODES or retry_count >= self.max_retries:
+                    return response
+                reason = f"HTTP {response.status_code}"
+            
+            except httpx.ConnectError as e:
+                if retry_count >= self.max_retries:
+                    raise AIEngineConnectionError(
+                        message=f"Failed to connect to AI Engine after {self.max_retries} attempts",
+                        details={"url": url, "error": str(e)}
+                    )
+                reason = "Connection error"
+            
+            except httpx.TimeoutException as e:
+                raise AIEngineTimeoutError(
+                    message="Request to AI Engine timed out",
+                    timeout_seconds=timeout,
+                    details={"url": url, "error": str(e)}
+                )
+            
+            except Exception as e:
+                raise AIEngineException(
+                    message=f"Error making request to AI Engine: {str(e)}",
+                    details={"url": url, "method": method, "error": str(e)}
+                )
+            
+            retry_count += 1
+            wait_time = self._retry_wait(retry_count)
+            logger.warning(f"{reason}, retrying in {wait_time:.2f} seconds "
+                          f"(attempt {retry_count}/{self.max_retries})")
+            await asyncio.sleep(wait_time)
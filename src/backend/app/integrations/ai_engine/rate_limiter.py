@@ -0,0 +1,81 @@
+"""
+Rate limiting for asynchronous AI Engine requests.
+
+Provides a leaky-bucket limiter that async callers enter before each request, so a
+burst of coroutines is spread out to the rate the AI engine permits instead of being
+answered with 429 responses and retried.
+"""
+
+import asyncio
+import time
+from typing import Optional, Mapping
+
+# Response header advertising the AI engine's request quota
+RATE_LIMIT_HEADER = "X-RateLimit-Limit"
+
+# Window the advertised limit applies to, in seconds
+DEFAULT_RATE_LIMIT_PERIOD = 60
+
+# Fraction of the advertised limit to use, leaving headroom for clock skew
+RATE_LIMIT_HEADROOM = 0.95
+
+
+class AsyncRateLimiter:
+    """Leaky-bucket rate limiter allowing max_rate acquisitions per time_period."""
+
+    def __init__(self, max_rate: float, time_period: float = DEFAULT_RATE_LIMIT_PERIOD):
+        """
+        Initialize the limiter with an empty bucket.
+
+        Args:
+            max_rate: Number of acquisitions allowed per time period
+            time_period: Length of the period in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _leak(self) -> None:
+        """Drain the bucket by the capacity regained since the last check."""
+        now = time.monotonic()
+        self._level = max(0.0, self._level - (now - self._last_check) * self._rate_per_sec)
+        self._last_check = now
+
+    async def acquire(self) -> None:
+        """Wait until the bucket has capacity, then take one slot from it."""
+        # Waiters queue on the lock, so capacity is handed out in arrival order
+        async with self._lock:
+            self._leak()
+            while self._level + 1 > self.max_rate:
+                await asyncio.sleep((self._level + 1 - self.max_rate) / self._rate_per_sec)
+                self._leak()
+            self._level += 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+def parse_rate_limit(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Derive the request rate to use from the AI engine's rate limit headers.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Requests per DEFAULT_RATE_LIMIT_PERIOD with headroom applied, or None if the
+        response carries no usable limit
+    """
+    try:
+        limit = float(headers.get(RATE_LIMIT_HEADER, ""))
+    except ValueError:
+        return None
+    if limit <= 0:
+        return None
+    return max(1.0, limit * RATE_LIMIT_HEADROOM)
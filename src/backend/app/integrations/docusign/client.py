@@ -5,6 +5,7 @@ import datetime
 from typing import Dict, List, Optional, Any, Union, Tuple
 
 import requests  # version ^2.28.0
+from pydantic import ValidationError  # version ^2.0.0
 import jwt  # version ^2.6.0
 from cryptography.hazmat.backends import default_backend  # version ^39.0.0
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
@@ -17,7 +18,7 @@ from .models import (
 from .exceptions import (
     DocuSignException, DocuSignConnectionError, DocuSignTimeoutError,
     DocuSignResponseError, AuthenticationError, EnvelopeCreationError, 
-    TemplateError, RecipientError
+    TemplateError, RecipientError, WebhookError
 )
 from ...core.logging import get_logger
 
@@ -325,6 +326,12 @@ class DocuSignClient:
                 envelope_id=envelope_id,
                 details=e.details if hasattr(e, 'details') else None
             )
+        except ValidationError as e:
+            logger.error(f"Invalid DocuSign response for created envelope: {str(e)}")
+            raise EnvelopeCreationError(
+                message=f"Invalid DocuSign response for created envelope: {str(e)}",
+                details={"response_body": response}
+            )
 
     def get_envelope(self, envelope_id: str) -> Envelope:
         """Get information about an existing envelope.
@@ -349,6 +356,12 @@ class DocuSignClient:
             
             return envelope
             
+        except ValidationError as e:
+            logger.error(f"Invalid DocuSign response for envelope {envelope_id}: {str(e)}")
+            raise DocuSignResponseError(
+                message=f"Invalid DocuSign response for envelope {envelope_id}: {str(e)}",
+                response_body=response
+            )
         except Exception as e:
             logger.error(f"Failed to get envelope {envelope_id}: {str(e)}")
             raise
@@ -513,6 +526,12 @@ class DocuSignClient:
             logger.debug(f"Retrieved {len(documents)} documents for envelope {envelope_id}")
             return documents
             
+        except ValidationError as e:
+            logger.error(f"Invalid DocuSign response for envelope documents {envelope_id}: {str(e)}")
+            raise DocuSignResponseError(
+                message=f"Invalid DocuSign response for envelope documents {envelope_id}: {str(e)}",
+                response_body=response
+            )
         except Exception as e:
             logger.error(f"Failed to get envelope documents {envelope_id}: {str(e)}")
             raise
@@ -608,6 +627,12 @@ class DocuSignClient:
             logger.debug(f"Retrieved {len(recipients)} recipients for envelope {envelope_id}")
             return recipients
             
+        except ValidationError as e:
+            logger.error(f"Invalid DocuSign response for envelope recipients {envelope_id}: {str(e)}")
+            raise DocuSignResponseError(
+                message=f"Invalid DocuSign response for envelope recipients {envelope_id}: {str(e)}",
+                response_body=response
+            )
         except Exception as e:
             logger.error(f"Failed to get envelope recipients {envelope_id}: {str(e)}")
             raise
@@ -755,6 +780,7 @@ class DocuSignClient:
             WebhookEvent: Processed webhook event
             
         Raises:
+            WebhookError: When the payload has no envelope ID or status
             DocuSignException: When webhook processing fails
         """
         try:
@@ -764,6 +790,12 @@ class DocuSignClient:
             logger.info(f"Processed webhook event for envelope {webhook_event.envelope_id}: {webhook_event.status}")
             return webhook_event
             
+        except ValidationError as e:
+            logger.error(f"Invalid webhook payload: {str(e)}")
+            raise WebhookError(
+                message=f"Invalid webhook payload: {str(e)}",
+                event_type=webhook_data.get("event")
+            )
         except Exception as e:
             logger.error(f"Failed to process webhook event: {str(e)}")
             raise DocuSignException(message=f"Failed to process webhook event: {str(e)}")
\ No newline at end of file
@@ -1,6 +1,6 @@
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 # Constants for DocuSign envelope status
 ENVELOPE_STATUS = {
@@ -34,6 +34,27 @@ RECIPIENT_TYPES = {
     "INTERMEDIARY": "Recipient routes the envelope to recipients"
 }
 
+# Keys under which DocuSign groups recipients by type in envelope and template responses
+RECIPIENT_GROUPS = ["signers", "carbonCopies", "inPersonSigners", "editors", "intermediaries"]
+
+
+def _flatten_recipients(recipients: Any) -> Any:
+    """Flatten a DocuSign recipients-by-type object into a list of recipient dicts."""
+    if not isinstance(recipients, dict):
+        return recipients
+
+    flattened = []
+    for recipient_type in RECIPIENT_GROUPS:
+        for recipient_data in recipients.get(recipient_type) or []:
+            # Copy so the caller's response data is left untouched
+            flattened.append({**recipient_data, "recipientType": recipient_type[:-1]})  # Remove the 's' at the end
+    return flattened or None
+
+
+def _blank_to_none(value: Any) -> Any:
+    """Treat an empty string as unset so it is left out of DocuSign API payloads."""
+    return None if value == "" else value
+
 
 class DocuSignConfig(BaseModel):
     """Configuration model for DocuSign API integration."""
@@ -47,54 +68,42 @@ class DocuSignConfig(BaseModel):
     use_jwt_auth: bool = False
     callback_url: Optional[str] = None
 
-    def model_config(self):
-        """Pydantic model configuration"""
-        return {
-            "arbitrary_types_allowed": True,
-            "extra": "forbid"
-        }
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
 
-    @validator("use_jwt_auth")
-    def validate_jwt_auth(cls, use_jwt_auth, values):
+    @field_validator("use_jwt_auth")
+    @classmethod
+    def validate_jwt_auth(cls, use_jwt_auth: bool, info: ValidationInfo) -> bool:
         """Validate JWT authentication configuration."""
-        if use_jwt_auth and not values.get("private_key_path"):
+        if use_jwt_auth and not info.data.get("private_key_path"):
             raise ValueError("private_key_path is required when use_jwt_auth is True")
         return use_jwt_auth
 
 
 class Recipient(BaseModel):
     """Model for DocuSign envelope recipient."""
+    model_config = ConfigDict(populate_by_name=True)
+
     email: str
     name: str
-    recipient_id: str
-    recipient_type: str
-    routing_order: Optional[str] = "1"
+    recipient_id: str = Field(alias="recipientId")
+    recipient_type: str = Field(alias="recipientType")
+    routing_order: Optional[str] = Field("1", alias="routingOrder")
     status: Optional[str] = None
-    status_changed_datetime: Optional[datetime] = None
-    signing_url: Optional[str] = None
+    status_changed_datetime: Optional[datetime] = Field(None, alias="statusChangedDateTime")
+    signing_url: Optional[str] = Field(None, alias="signingUrl")
 
     @classmethod
     def from_docusign_response(cls, data: Dict[str, Any]) -> "Recipient":
         """Create Recipient instance from DocuSign API response."""
-        return cls(
-            email=data.get("email", ""),
-            name=data.get("name", ""),
-            recipient_id=data.get("recipientId", ""),
-            recipient_type=data.get("recipientType", ""),
-            routing_order=data.get("routingOrder", "1"),
-            status=data.get("status", None),
-            status_changed_datetime=data.get("statusChangedDateTime", None),
-            signing_url=data.get("signingUrl", None)
-        )
+        return cls.model_validate(data)
 
     def to_docusign_dict(self) -> Dict[str, Any]:
         """Convert Recipient to DocuSign API format."""
-        result = {
-            "email": self.email,
-            "name": self.name,
-            "recipientId": self.recipient_id,
-            "routingOrder": self.routing_order,
-        }
+        result = self.model_dump(
+            by_alias=True,
+            exclude_none=True,
+            include={"email", "name", "recipient_id", "routing_order"}
+        )
 
         # Add recipient type-specific fields
         if self.recipient_type.upper() == "SIGNER":
@@ -119,41 +128,36 @@ class Recipient(BaseModel):
 
 class DocumentInfo(BaseModel):
     """Model for document information in DocuSign envelope."""
-    document_id: str
+    model_config = ConfigDict(populate_by_name=True)
+
+    document_id: str = Field(alias="documentId")
     name: str
-    file_extension: Optional[str] = None
+    file_extension: Optional[str] = Field(None, alias="fileExtension")
     content: Optional[bytes] = None
-    document_base64: Optional[str] = None
+    document_base64: Optional[str] = Field(None, alias="documentBase64")
+
+    @field_validator("file_extension", "document_base64", mode="before")
+    @classmethod
+    def validate_optional_text(cls, value: Any) -> Any:
+        """Store empty strings as None."""
+        return _blank_to_none(value)
 
     @classmethod
     def from_docusign_response(cls, data: Dict[str, Any]) -> "DocumentInfo":
         """Create DocumentInfo instance from DocuSign API response."""
-        return cls(
-            document_id=data.get("documentId", ""),
-            name=data.get("name", ""),
-            file_extension=data.get("fileExtension", None),
-        )
+        return cls.model_validate(data)
 
     def to_docusign_dict(self) -> Dict[str, Any]:
         """Convert DocumentInfo to DocuSign API format."""
-        result = {
-            "documentId": self.document_id,
-            "name": self.name,
-        }
-
-        if self.file_extension:
-            result["fileExtension"] = self.file_extension
-
-        if self.document_base64:
-            result["documentBase64"] = self.document_base64
-
-        return result
+        return self.model_dump(by_alias=True, exclude_none=True, exclude={"content"})
 
 
 class EnvelopeCreate(BaseModel):
     """Model for creating a new DocuSign envelope."""
-    email_subject: str
-    email_body: Optional[str] = None
+    model_config = ConfigDict(populate_by_name=True)
+
+    email_subject: str = Field(alias="emailSubject")
+    email_body: Optional[str] = Field(None, alias="emailBlurb")
     documents: List[DocumentInfo]
     recipients: List[Recipient]
     status: str  # draft, sent, etc.
@@ -161,8 +165,15 @@ class EnvelopeCreate(BaseModel):
     notification_uri: Optional[str] = None
     event_types: Optional[List[str]] = None
 
-    @validator("status")
-    def validate_status(cls, status):
+    @field_validator("email_body", mode="before")
+    @classmethod
+    def validate_email_body(cls, email_body: Any) -> Any:
+        """Store an empty email body as None."""
+        return _blank_to_none(email_body)
+
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, status: str) -> str:
         """Validate envelope status."""
         if status.upper() not in ENVELOPE_STATUS:
             raise ValueError(f"Invalid status: {status}. Must be one of: {', '.join(ENVELOPE_STATUS.keys())}")
@@ -170,13 +181,11 @@ class EnvelopeCreate(BaseModel):
 
     def to_docusign_dict(self) -> Dict[str, Any]:
         """Convert EnvelopeCreate to DocuSign API format."""
-        result = {
-            "emailSubject": self.email_subject,
-            "status": self.status,
-        }
-
-        if self.email_body:
-            result["emailBlurb"] = self.email_body
+        result = self.model_dump(
+            by_alias=True,
+            exclude_none=True,
+            include={"email_subject", "email_body", "status"}
+        )
 
         # Add documents
         if self.documents:
@@ -219,61 +228,50 @@ class EnvelopeCreate(BaseModel):
 
 class Envelope(BaseModel):
     """Model for DocuSign envelope information."""
-    envelope_id: str
+    model_config = ConfigDict(populate_by_name=True)
+
+    envelope_id: str = Field(alias="envelopeId")
     status: str
-    status_changed_datetime: Optional[datetime] = None
-    created_datetime: Optional[datetime] = None
-    sent_datetime: Optional[datetime] = None
-    completed_datetime: Optional[datetime] = None
-    delivered_datetime: Optional[datetime] = None
-    declined_datetime: Optional[datetime] = None
-    voided_datetime: Optional[datetime] = None
-    email_subject: Optional[str] = None
+    status_changed_datetime: Optional[datetime] = Field(None, alias="statusChangedDateTime")
+    created_datetime: Optional[datetime] = Field(None, alias="createdDateTime")
+    sent_datetime: Optional[datetime] = Field(None, alias="sentDateTime")
+    completed_datetime: Optional[datetime] = Field(None, alias="completedDateTime")
+    delivered_datetime: Optional[datetime] = Field(None, alias="deliveredDateTime")
+    declined_datetime: Optional[datetime] = Field(None, alias="declinedDateTime")
+    voided_datetime: Optional[datetime] = Field(None, alias="voidedDateTime")
+    email_subject: Optional[str] = Field(None, alias="emailSubject")
     recipients: Optional[List[Recipient]] = None
     documents: Optional[List[DocumentInfo]] = None
 
+    @field_validator("recipients", mode="before")
+    @classmethod
+    def validate_recipients(cls, recipients: Any) -> Any:
+        """Accept recipients grouped by type as returned by DocuSign."""
+        return _flatten_recipients(recipients)
+
     @classmethod
     def from_docusign_response(cls, data: Dict[str, Any]) -> "Envelope":
         """Create Envelope instance from DocuSign API response."""
-        envelope = cls(
-            envelope_id=data.get("envelopeId", ""),
-            status=data.get("status", ""),
-            status_changed_datetime=data.get("statusChangedDateTime", None),
-            created_datetime=data.get("createdDateTime", None),
-            sent_datetime=data.get("sentDateTime", None),
-            completed_datetime=data.get("completedDateTime", None),
-            delivered_datetime=data.get("deliveredDateTime", None),
-            declined_datetime=data.get("declinedDateTime", None),
-            voided_datetime=data.get("voidedDateTime", None),
-            email_subject=data.get("emailSubject", None),
-        )
-
-        # Add recipients if present
-        if "recipients" in data and data["recipients"]:
-            envelope.recipients = []
-            for recipient_type in ["signers", "carbonCopies", "inPersonSigners", "editors", "intermediaries"]:
-                if recipient_type in data["recipients"] and data["recipients"][recipient_type]:
-                    for recipient_data in data["recipients"][recipient_type]:
-                        recipient_data["recipientType"] = recipient_type[:-1]  # Remove the 's' at the end
-                        envelope.recipients.append(Recipient.from_docusign_response(recipient_data))
-
-        # Add documents if present
-        if "documents" in data and data["documents"]:
-            envelope.documents = [
-                DocumentInfo.from_docusign_response(doc_data) for doc_data in data["documents"]
-            ]
-
-        return envelope
+        return cls.model_validate(data)
 
 
 class EnvelopeStatusUpdate(BaseModel):
     """Model for updating DocuSign envelope status."""
+    model_config = ConfigDict(populate_by_name=True)
+
     envelope_id: str
     status: str
-    status_reason: Optional[str] = None
+    status_reason: Optional[str] = Field(None, alias="statusReason")
+
+    @field_validator("status_reason", mode="before")
+    @classmethod
+    def validate_status_reason(cls, status_reason: Any) -> Any:
+        """Store an empty status reason as None."""
+        return _blank_to_none(status_reason)
 
-    @validator("status")
-    def validate_status(cls, status):
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, status: str) -> str:
         """Validate envelope status."""
         if status.upper() not in ENVELOPE_STATUS:
             raise ValueError(f"Invalid status: {status}. Must be one of: {', '.join(ENVELOPE_STATUS.keys())}")
@@ -281,14 +279,7 @@ class EnvelopeStatusUpdate(BaseModel):
 
     def to_docusign_dict(self) -> Dict[str, Any]:
         """Convert EnvelopeStatusUpdate to DocuSign API format."""
-        result = {
-            "status": self.status,
-        }
-
-        if self.status_reason:
-            result["statusReason"] = self.status_reason
-
-        return result
+        return self.model_dump(by_alias=True, exclude_none=True, exclude={"envelope_id"})
 
 
 class WebhookEvent(BaseModel):
@@ -309,18 +300,12 @@ class WebhookEvent(BaseModel):
             envelope_data = payload  # Fallback if no specific envelope data found
 
         # Extract recipients if present
-        recipients = None
-        if "recipients" in envelope_data and envelope_data["recipients"]:
-            recipients = []
-            for recipient_type in ["signers", "carbonCopies", "inPersonSigners", "editors", "intermediaries"]:
-                if recipient_type in envelope_data["recipients"] and envelope_data["recipients"][recipient_type]:
-                    for recipient_data in envelope_data["recipients"][recipient_type]:
-                        recipient_data["recipientType"] = recipient_type[:-1]  # Remove the 's' at the end
-                        recipients.append(Recipient.from_docusign_response(recipient_data))
+        recipients = _flatten_recipients(envelope_data.get("recipients") or None)
 
+        # Missing envelopeId or status fails validation rather than defaulting to ""
         return cls(
-            envelope_id=envelope_data.get("envelopeId", ""),
-            status=envelope_data.get("status", ""),
+            envelope_id=envelope_data.get("envelopeId"),
+            status=envelope_data.get("status"),
             event_type=payload.get("event", None),
             status_changed_datetime=envelope_data.get("statusChangedDateTime", None),
             recipients=recipients,
@@ -346,38 +331,23 @@ class SigningUrl(BaseModel):
 
 class TemplateInfo(BaseModel):
     """Model for DocuSign template information."""
-    template_id: str
+    model_config = ConfigDict(populate_by_name=True)
+
+    template_id: str = Field(alias="templateId")
     name: str
     description: Optional[str] = None
-    created_datetime: Optional[datetime] = None
-    last_modified_datetime: Optional[datetime] = None
+    created_datetime: Optional[datetime] = Field(None, alias="created")
+    last_modified_datetime: Optional[datetime] = Field(None, alias="lastModified")
     recipients: Optional[List[Recipient]] = None
     documents: Optional[List[DocumentInfo]] = None
 
+    @field_validator("recipients", mode="before")
+    @classmethod
+    def validate_recipients(cls, recipients: Any) -> Any:
+        """Accept recipients grouped by type as returned by DocuSign."""
+        return _flatten_recipients(recipients)
+
     @classmethod
     def from_docusign_response(cls, data: Dict[str, Any]) -> "TemplateInfo":
         """Create TemplateInfo instance from DocuSign API response."""
-        template = cls(
-            template_id=data.get("templateId", ""),
-            name=data.get("name", ""),
-            description=data.get("description", None),
-            created_datetime=data.get("created", None),
-            last_modified_datetime=data.get("lastModified", None),
-        )
-
-        # Add recipients if present
-        if "recipients" in data and data["recipients"]:
-            template.recipients = []
-            for recipient_type in ["signers", "carbonCopies", "inPersonSigners", "editors", "intermediaries"]:
-                if recipient_type in data["recipients"] and data["recipients"][recipient_type]:
-                    for recipient_data in data["recipients"][recipient_type]:
-                        recipient_data["recipientType"] = recipient_type[:-1]  # Remove the 's' at the end
-                        template.recipients.append(Recipient.from_docusign_response(recipient_data))
-
-        # Add documents if present
-        if "documents" in data and data["documents"]:
-            template.documents = [
-                DocumentInfo.from_docusign_response(doc_data) for doc_data in data["documents"]
-            ]
-
-        return template
\ No newline at end of file
+        return cls.model_validate(data)
\ No newline at end of file
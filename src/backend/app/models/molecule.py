@@ -72,7 +72,13 @@ class Molecule(Base):
     # Create indexes for efficient querying
     __table_args__ = (
         Index('ix_molecule_status', 'status'),
-        Index('ix_molecule_created_at', 'created_at')
+        Index('ix_molecule_created_at', 'created_at'),
+        # Trigram index for substring formula filters (requires the pg_trgm extension)
+        Index(
+            'ix_molecule_formula_trgm', 'formula',
+            postgresql_using='gin',
+            postgresql_ops={'formula': 'gin_trgm_ops'}
+        )
     )
     
     @validates('smiles')
@@ -6,7 +6,7 @@ and organization association. It includes methods for password management, user
 identification, and audit tracking.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, UUID
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, UUID, Index, func
 from sqlalchemy.orm import relationship, validates
 from datetime import datetime
 import uuid
@@ -30,7 +30,7 @@ class User(Base):
     hashed_password = Column(String(255), nullable=False)
     
     # Role and permissions
-    role = Column(String(50), nullable=False)
+    role = Column(String(50), nullable=False, index=True)
     is_active = Column(Boolean, default=True, nullable=False)
     is_superuser = Column(Boolean, default=False, nullable=False)
     
@@ -41,6 +41,22 @@ class User(Base):
     # Audit information
     last_login = Column(DateTime, nullable=True)
     
+    __table_args__ = (
+        # Case-insensitive email lookups
+        Index('ix_user_email_lower', func.lower(email)),
+        # Trigram indexes for substring search on email and name (requires the pg_trgm extension)
+        Index(
+            'ix_user_email_trgm', 'email',
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'}
+        ),
+        Index(
+            'ix_user_full_name_trgm', 'full_name',
+            postgresql_using='gin',
+            postgresql_ops={'full_name': 'gin_trgm_ops'}
+        )
+    )
+    
     def __init__(self, **kwargs):
         """Initialize a new User instance with default values."""
         # Set default values
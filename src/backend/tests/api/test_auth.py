@@ -3,7 +3,7 @@ from unittest import mock
 import uuid
 import json
 
-from ..conftest import app, client, db_session, test_user, test_admin, admin_token_headers, create_test_user, SYSTEM_ADMIN, PHARMA_ADMIN, PHARMA_SCIENTIST, CRO_ADMIN, settings  # Import fixtures
+from ..conftest import app, test_admin, admin_token_headers, create_test_user, SYSTEM_ADMIN, PHARMA_ADMIN, PHARMA_SCIENTIST, CRO_ADMIN, settings  # Import fixtures
 # pytest: ^7.0.0
 # unittest: standard library
 # uuid: standard library
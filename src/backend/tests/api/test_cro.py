@@ -6,7 +6,7 @@ import unittest.mock
 import uuid
 import json
 
-from ..conftest import app, client, db_session, admin_token_headers, pharma_token_headers, cro_token_headers, test_admin
+from ..conftest import app, admin_token_headers, pharma_token_headers, cro_token_headers, test_admin
 from ...app.models.cro_service import ServiceType, CROService
 from ...app.crud.crud_cro_service import cro_service
 from ...app.core.exceptions import NotFoundException, ConflictException
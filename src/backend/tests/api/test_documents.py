@@ -6,7 +6,7 @@ import pytest
 from fastapi import status
 from io import BytesIO
 
-from ..conftest import client, db_session, pharma_token_headers, cro_token_headers, test_submission
+from ..conftest import pharma_token_headers, cro_token_headers, test_submission
 from ...app.constants.document_types import DocumentType, DOCUMENT_STATUS
 
 def test_create_upload_url(client, pharma_token_headers, test_submission):
@@ -5,7 +5,7 @@ import json
 import random
 from typing import List
 
-from ..conftest import client, db_session, admin_token_headers, pharma_token_headers, test_user, test_molecule, test_molecules
+from ..conftest import admin_token_headers, pharma_token_headers
 from ...app.models.library import Library
 from ...app.crud.crud_library import library
 
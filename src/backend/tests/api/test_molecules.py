@@ -7,7 +7,7 @@ from typing import List
 
 from fastapi import status
 
-from ..conftest import app, client, db_session, test_user, test_admin, test_molecule, test_molecules, pharma_token_headers, admin_token_headers, create_test_molecule
+from ..conftest import app, test_admin, pharma_token_headers, admin_token_headers, create_test_molecule
 from ..conftest import molecule_service, storage_service, AIEngineClient, MoleculeException, CSVException
 from ..conftest import Molecule, User
 
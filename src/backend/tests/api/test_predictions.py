@@ -4,7 +4,7 @@ import json
 import uuid
 from datetime import datetime
 
-from ..conftest import client, db_session, pharma_token_headers, test_molecule, test_molecules
+from ..conftest import pharma_token_headers
 from ...app.services.prediction_service import prediction_service, AIEngineClient
 from ...app.integrations.ai_engine.exceptions import AIEngineException, AIServiceUnavailableError
 from ...app.core.exceptions import PredictionException
@@ -6,7 +6,7 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
-from ..conftest import client, db_session, pharma_token_headers, cro_token_headers, test_user, test_molecule, test_molecules
+from ..conftest import pharma_token_headers, cro_token_headers
 from ...app.constants.submission_status import SubmissionStatus, SubmissionAction
 from ...app.models.submission import Submission
 from ...app.crud.crud_submission import submission
@@ -8,7 +8,7 @@ from typing import Dict, Any
 from fastapi import FastAPI, Request, Response, Depends, HTTPException, status
 from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST, HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND, HTTP_422_UNPROCESSABLE_ENTITY
 
-from src.backend.tests.conftest import client, db_session, admin_token_headers, pharma_token_headers, cro_token_headers, test_user, test_admin_user, create_test_user, User
+from src.backend.tests.conftest import admin_token_headers, pharma_token_headers, cro_token_headers, create_test_user, User
 from src.backend.app.schemas.user import UserCreate, UserUpdate
 from src.backend.app.constants.user_roles import SYSTEM_ADMIN, PHARMA_ADMIN, PHARMA_SCIENTIST, CRO_ADMIN, CRO_TECHNICIAN
 
@@ -1,6 +1,8 @@
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 from typing import Dict
 
@@ -8,21 +10,76 @@ from ..app.main import app
 from ..app.db.base import Base
 from ..app.api.deps import get_db
 from ..app.core.config import settings
+from ..app.core import security
+from ..app.core.constants import ENVIRONMENT_TESTING
 from ..app.models.user import User
 from ..app.models.molecule import Molecule
 from ..app.models.library import Library
 from ..app.models.cro_service import CROService
 from ..constants.user_roles import SYSTEM_ADMIN, PHARMA_ADMIN, PHARMA_SCIENTIST, CRO_ADMIN
-from passlib.context import CryptContext  # passlib version: ^1.7.4
+import asyncio
+import contextlib
+import functools
+import time
 import uuid
 from datetime import datetime
 import os
 
-# Define a global password context for hashing passwords
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt's minimum cost factor; the hash still verifies because the cost is stored in it
+TEST_BCRYPT_ROUNDS = 4
+
+class CachedHasher:
+    """Wrap a password hasher so identical test passwords are hashed only once"""
+
+    def __init__(self, hasher):
+        self._hasher = hasher
+        # The cache lives on the wrapper, so swapping password_hasher also drops its hashes
+        self.hash = functools.lru_cache(maxsize=128)(hasher.hash)
+
+    def verify(self, password, hashed_password):
+        """Check a password with the wrapped hasher"""
+        return self._hasher.verify(password, hashed_password)
+
+def pytest_configure(config):
+    """Switch the application to the testing environment and skip bcrypt for password hashes"""
+    os.environ.setdefault("ENVIRONMENT", ENVIRONMENT_TESTING)
+    settings.BCRYPT_ROUNDS = TEST_BCRYPT_ROUNDS
+    security.pwd_context.update(bcrypt__rounds=TEST_BCRYPT_ROUNDS)
+    security.password_hasher = CachedHasher(security.PlaintextHasher())
+
+# Test modules whose tests share module-scoped fixtures or module-level state, such as
+# the AI engine client and its circuit breakers, and so must stay on one xdist worker
+XDIST_GROUPS = {
+    "test_ai_engine.py": "ai_engine",
+}
+
+def pytest_collection_modifyitems(config, items):
+    """Assign pytest-xdist groups, which --dist loadgroup keeps on a single worker"""
+    for item in items:
+        if item.path.name in XDIST_GROUPS:
+            item.add_marker(pytest.mark.xdist_group(XDIST_GROUPS[item.path.name]))
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Make retry backoff and polling delays return immediately in every test"""
+    real_async_sleep = asyncio.sleep
+    monkeypatch.setattr(time, "sleep", lambda *args, **kwargs: None)
+    # Still yield to the event loop, so concurrent coroutines interleave as they would
+    monkeypatch.setattr(asyncio, "sleep", lambda *args, **kwargs: real_async_sleep(0))
 
 # Define a test database URL, using in-memory SQLite for testing
-TEST_DATABASE_URL = "sqlite:///./test.db"
+TEST_DATABASE_URL = "sqlite:///file:memdb?mode=memory&cache=shared&uri=true"
+
+# pytest-xdist sets this in each worker process; a plain pytest run behaves as worker gw0
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+def get_worker_db_url(url: str) -> URL:
+    """Derive a database URL unique to the current pytest-xdist worker"""
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite":
+        root, ext = os.path.splitext(url.database)
+        return url.set(database=f"{root}_{WORKER_ID}{ext}")
+    return url.set(database=f"test_crud_{WORKER_ID}")
 
 @pytest.fixture(scope="session")
 def get_test_db_url() -> str:
@@ -36,74 +93,147 @@ def get_test_db_url() -> str:
         # Otherwise, return the default in-memory SQLite URL
         return TEST_DATABASE_URL
 
-# Create a SQLAlchemy engine for the test database
-engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+# Create a SQLAlchemy engine for this worker's test database
+BASE_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", TEST_DATABASE_URL)
+WORKER_DATABASE_URL = get_worker_db_url(BASE_DATABASE_URL)
+IS_SQLITE = WORKER_DATABASE_URL.get_backend_name() == "sqlite"
+# StaticPool keeps a single SQLite connection, so an in-memory database lives for the whole run
+engine = create_engine(
+    WORKER_DATABASE_URL,
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+    poolclass=StaticPool if IS_SQLITE else None
+)
 
 # Create a session factory for creating database sessions
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# pysqlite only honours SAVEPOINT once its implicit transaction handling is disabled
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_sqlite_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+@pytest.fixture(scope="session")
+def worker_database():
+    """Fixture creating this worker's test database and removing it after the run"""
+    database = WORKER_DATABASE_URL.database
+    if engine.dialect.name == "sqlite":
+        yield database
+        engine.dispose()
+        if WORKER_DATABASE_URL.query.get("mode") != "memory" and os.path.exists(database):
+            os.remove(database)
+        return
+
+    # Server databases are created through the base URL's maintenance connection
+    admin_engine = create_engine(BASE_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    with admin_engine.connect() as admin_connection:
+        admin_connection.exec_driver_sql(f'DROP DATABASE IF EXISTS "{database}"')
+        admin_connection.exec_driver_sql(f'CREATE DATABASE "{database}"')
+    try:
+        yield database
+    finally:
+        engine.dispose()
+        with admin_engine.connect() as admin_connection:
+            admin_connection.exec_driver_sql(f'DROP DATABASE IF EXISTS "{database}"')
+        admin_engine.dispose()
+
 @pytest.fixture(scope="session")
-def test_db_session():
-    """Fixture providing a database session for tests"""
-    # Create all tables in the test database
+def connection(worker_database):
+    """Fixture providing a single connection with the schema created once per test run"""
     Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    connection = engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        # Nothing written during the run is ever committed to the database
+        transaction.rollback()
+        connection.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(scope="session")
+def session_db(connection):
+    """Fixture providing the session shared by session- and module-scoped data fixtures"""
+    # Commits issued by CRUD methods release a SAVEPOINT instead of ending the outer transaction
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture()
+def db_session(connection, session_db):
+    """Fixture providing a database session whose changes are rolled back after each test"""
+    savepoint = connection.begin_nested()
     try:
-        yield db
+        yield session_db
     finally:
-        db.close()
+        session_db.rollback()
+        if savepoint.is_active:
+            savepoint.rollback()
+        # Reload shared fixture objects from the restored rows on next access
+        session_db.expire_all()
+
+@pytest.fixture()
+def test_db_session(db_session):
+    """Fixture providing a database session for tests; an alias of db_session"""
+    # The engine has a single connection, so every session must share its outer transaction
+    return db_session
 
 @pytest.fixture()
-def client(test_db_session):
+def client(db_session):
     """Fixture providing a TestClient for API testing"""
     def override_get_db():
-        try:
-            yield test_db_session
-        finally:
-            test_db_session.close()
+        # Closing here would detach the shared fixture objects; db_session cleans up after the test
+        yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
     yield TestClient(app)
     app.dependency_overrides.clear()
 
 @pytest.fixture()
-def test_db(test_db_session):
-    """Fixture setting up and tearing down the test database"""
-    # Set up the test database with tables and initial test data
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
-    try:
-        # Create all tables defined in Base.metadata
-        Base.metadata.create_all(bind=engine)
-        # Create a database session
-        db = TestingSessionLocal()
-        # Add test users with different roles
-        create_test_user(db, "system_admin@example.com", "password", "System Admin", SYSTEM_ADMIN)
-        create_test_user(db, "pharma_admin@example.com", "password", "Pharma Admin", PHARMA_ADMIN)
-        create_test_user(db, "pharma_scientist@example.com", "password", "Pharma Scientist", PHARMA_SCIENTIST)
-        create_test_user(db, "cro_admin@example.com", "password", "CRO Admin", CRO_ADMIN)
-        # Add test CRO services
-        create_test_cro_services(db)
-        # Add test molecules with properties
-        create_test_molecules(db, 5)
-        # Add test libraries
-        molecules = db.query(Molecule).all()
-        user = db.query(User).filter(User.email == "pharma_admin@example.com").first()
-        create_test_libraries(db, user, molecules)
-        # Commit the session
-        db.commit()
-        # Close the session
-        db.close()
-        yield
-    finally:
-        # Drop all tables after the test is finished
-        Base.metadata.drop_all(bind=engine)
+def test_db(db_session):
+    """Fixture seeding test data that is rolled back with the test"""
+    db = db_session
+    # Add test users with different roles
+    create_test_user(db, "system_admin@example.com", "password", "System Admin", SYSTEM_ADMIN)
+    create_test_user(db, "pharma_admin@example.com", "password", "Pharma Admin", PHARMA_ADMIN)
+    create_test_user(db, "pharma_scientist@example.com", "password", "Pharma Scientist", PHARMA_SCIENTIST)
+    create_test_user(db, "cro_admin@example.com", "password", "CRO Admin", CRO_ADMIN)
+    # Add test CRO services
+    create_test_cro_services(db)
+    # Add test molecules with properties
+    create_test_molecules(db, 5)
+    # Add test libraries
+    molecules = db.query(Molecule).all()
+    user = db.query(User).filter(User.email == "pharma_admin@example.com").first()
+    create_test_libraries(db, user, molecules)
+    # Flush only; the per-test SAVEPOINT in db_session discards the rows afterwards
+    db.flush()
+    yield
 
-@pytest.fixture()
-def test_user(test_db_session):
-    """Fixture providing a standard test user"""
+@pytest.fixture(scope="session")
+def test_user(session_db):
+    """Fixture providing a standard test user shared by all tests.
+
+    Committed once on the session-wide transaction, before any per-test SAVEPOINT opens; tests
+    should only reference it (typically by ID) and use test_user_mutable when they modify a user.
+    """
     # Create a test user with specified role and credentials
-    return create_test_user(test_db_session, "test_user@example.com", "password", "Test User", PHARMA_SCIENTIST)
+    user = create_test_user(session_db, "test_user@example.com", "password", "Test User", PHARMA_SCIENTIST)
+    session_db.commit()
+    return user
+
+@pytest.fixture()
+def test_user_mutable(db_session):
+    """Fixture providing a per-test user that a test may modify; rolled back with the test"""
+    user = create_test_user(db_session, f"test_user_{uuid.uuid4().hex}@example.com", "password", "Test User", PHARMA_SCIENTIST)
+    db_session.flush()
+    return user
 
 @pytest.fixture()
 def test_admin_user(test_db_session):
@@ -111,11 +241,18 @@ def test_admin_user(test_db_session):
     # Create a test user with specified role and credentials
     return create_test_user(test_db_session, "test_admin@example.com", "password", "Test Admin", SYSTEM_ADMIN)
 
-@pytest.fixture()
-def test_molecules(test_db_session):
-    """Fixture providing test molecules"""
+@pytest.fixture(scope="session")
+def test_molecules(session_db):
+    """Fixture providing test molecules shared by all tests; treat them as read-only"""
     # Create test molecules with properties for testing
-    return create_test_molecules(test_db_session, 3)
+    molecules = create_test_molecules(session_db, 3)
+    session_db.commit()
+    return molecules
+
+@pytest.fixture(scope="session")
+def test_molecule(test_molecules):
+    """Fixture providing a single test molecule"""
+    return test_molecules[0]
 
 @pytest.fixture()
 def test_libraries(test_db_session, test_user, test_molecules):
@@ -143,18 +280,32 @@ def auth_headers(client, test_user):
     headers = {"Authorization": f"Bearer {token}"}
     return headers
 
+@contextlib.contextmanager
+def count_queries(conn):
+    """Collect the SQL statements executed on a connection, for bounding query counts in tests"""
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(conn, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(conn, "before_cursor_execute", before_cursor_execute)
+
 def create_test_user(db, email, password, name, role):
     """Create a test user with specified role and credentials"""
     # Create a new User object with provided details
     user = User(
         email=email,
         full_name=name,
-        hashed_password=pwd_context.hash(password),
+        hashed_password=security.get_password_hash(password),
         role=role,
         is_active=True
     )
-    # Hash the password using pwd_context
-    user.hashed_password = pwd_context.hash(password)
+    # Hash the password the same way the application does
+    user.hashed_password = security.get_password_hash(password)
     # Set user as active
     user.is_active = True
     # Add user to database session
@@ -2,7 +2,6 @@ import pytest
 from uuid import uuid4
 from datetime import datetime
 
-from ..conftest import db_session, test_user
 from ...app.crud.crud_document import document
 from ...app.models.document import Document
 from ...app.models.submission import Submission
@@ -12,6 +12,7 @@ from src.backend.app.models.library import Library
 from src.backend.app.schemas.molecule import MoleculeCreate, MoleculeUpdate
 from src.backend.app.constants.molecule_properties import PropertySource
 from src.backend.app.utils.smiles import validate_smiles
+from src.backend.app.utils.chem_fingerprints import get_fingerprint_from_smiles
 
 
 def test_create_from_smiles(db_session: Session):
@@ -233,7 +234,8 @@ def test_filter_molecules(db_session: Session):
     assert molecule1 not in filtered_molecules
     assert molecule3 not in filtered_molecules
 
-    # Test filtering by formula substring
+    # Test filtering by formula substring against the formula stored at creation
+    assert molecule2.formula == "C6H6"
     filter_params = {"formula_contains": "C6H6"}
     filtered_molecules = molecule.filter_molecules(filter_params=filter_params, db=db_session)["items"]
     assert molecule2 in filtered_molecules
@@ -297,36 +299,39 @@ def test_search_by_similarity(db_session: Session):
     molecule2 = molecule.create_from_smiles(smiles="c1ccccc1", db=db_session)
     molecule3 = molecule.create_from_smiles(smiles="C1CCCCC1", db=db_session)
 
-    # Call molecule.search_by_similarity with a query SMILES and threshold
+    # Compute each query fingerprint once and reuse it across thresholds
     query_smiles = "c1ccccc1"
-    threshold = 0.5
+    query_fp_morgan = get_fingerprint_from_smiles(query_smiles, "morgan")
+    query_fp_maccs = get_fingerprint_from_smiles(query_smiles, "maccs")
+
+    # Call molecule.search_by_similarity with a query SMILES and threshold
     similar_molecules = molecule.search_by_similarity(
-        query_smiles=query_smiles, threshold=threshold, db=db_session
+        query_smiles=query_smiles, threshold=0.5, query_fp=query_fp_morgan, db=db_session
+    )["items"]
+    similar_molecules_maccs = molecule.search_by_similarity(
+        query_smiles=query_smiles, threshold=0.5, fingerprint_type="maccs",
+        query_fp=query_fp_maccs, db=db_session
+    )["items"]
+    similar_molecules_high_threshold = molecule.search_by_similarity(
+        query_smiles=query_smiles, threshold=0.9, query_fp=query_fp_morgan, db=db_session
     )["items"]
 
     # Assert that molecules above the similarity threshold are returned
-    assert any(mol["smiles"] == molecule2.smiles for mol in similar_molecules)
+    similar_smiles = {mol["smiles"] for mol in similar_molecules}
+    assert molecule2.smiles in similar_smiles
 
     # Assert that molecules below the similarity threshold are not returned
-    assert not any(mol["smiles"] == molecule1.smiles for mol in similar_molecules)
-    assert not any(mol["smiles"] == molecule3.smiles for mol in similar_molecules)
+    assert molecule1.smiles not in similar_smiles
+    assert molecule3.smiles not in similar_smiles
 
     # Assert that results are sorted by similarity (descending)
     if len(similar_molecules) > 1:
         assert similar_molecules[0]["similarity"] >= similar_molecules[1]["similarity"]
 
     # Test with different fingerprint types
-    similar_molecules_maccs = molecule.search_by_similarity(
-        query_smiles=query_smiles, threshold=threshold, fingerprint_type="maccs", db=db_session
-    )["items"]
     assert isinstance(similar_molecules_maccs, list)
 
-    # Test with different similarity thresholds
-    threshold = 0.9
-    similar_molecules_high_threshold = molecule.search_by_similarity(
-        query_smiles=query_smiles, threshold=threshold, db=db_session
-    )["items"]
-    # Depending on the exact similarity, this may be empty
+    # Test with different similarity thresholds; depending on the exact similarity, this may be empty
     assert isinstance(similar_molecules_high_threshold, list)
 
 
@@ -403,4 +408,48 @@ def test_batch_create(db_session: Session):
     assert batch_result_with_invalid["created_count"] == 0
     assert batch_result_with_invalid["skipped_count"] == 3
     assert batch_result_with_invalid["failed_count"] == 0
-    assert db_session.query(Molecule).count() == 3
\ No newline at end of file
+    assert db_session.query(Molecule).count() == 3
+
+
+def test_batch_create_skips_same_molecule_under_other_smiles(db_session: Session):
+    """Tests that batch creation detects duplicates by InChI Key rather than by SMILES"""
+    # Ethanol written two ways in one batch; created molecules keep the input order
+    batch_result = molecule.batch_create(
+        obj_list=[MoleculeCreate(smiles="CCO"), MoleculeCreate(smiles="OCC"), MoleculeCreate(smiles="c1ccncc1")],
+        db=db_session
+    )
+    assert [created.smiles for created in batch_result["created"]] == ["CCO", "c1ccncc1"]
+    assert batch_result["skipped"] == [{"smiles": "OCC", "id": str(batch_result["created"][0].id)}]
+    assert batch_result["failed_count"] == 0
+
+    # A third spelling of an already stored molecule is skipped, not failed
+    batch_result_stored = molecule.batch_create(obj_list=[MoleculeCreate(smiles="C(O)C")], db=db_session)
+    assert batch_result_stored["created_count"] == 0
+    assert batch_result_stored["skipped_count"] == 1
+    assert batch_result_stored["failed_count"] == 0
+
+
+def test_batch_create_keeps_create_with_properties_fields(db_session: Session):
+    """Tests that batch creation keeps metadata, status and property precedence from create_with_properties"""
+    batch_result = molecule.batch_create(
+        obj_list=[
+            MoleculeCreate(
+                smiles="CC(=O)Oc1ccccc1C(=O)O",
+                metadata={"batch": "A-1"},
+                status=MoleculeStatus.PENDING.value,
+                properties=[{"name": "logp", "value": 4.5, "units": "log units", "source": PropertySource.IMPORTED.value}]
+            ),
+            MoleculeCreate(smiles="c1ccccc1"),
+        ],
+        db=db_session
+    )
+    aspirin, benzene = batch_result["created"]
+    assert aspirin.metadata == {"batch": "A-1"}
+    assert aspirin.status == MoleculeStatus.PENDING.value
+    assert benzene.status == MoleculeStatus.AVAILABLE.value
+
+    # The calculated logp replaces the imported value but keeps its units
+    logp = next(prop for prop in aspirin.properties if prop.name == "logp")
+    assert logp.source == PropertySource.CALCULATED.value
+    assert logp.value != 4.5
+    assert logp.units == "log units"
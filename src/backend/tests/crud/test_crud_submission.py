@@ -1,354 +1,425 @@
 # src/backend/tests/crud/test_crud_submission.py
+import importlib.util
 import pytest
 from uuid import uuid4
 from datetime import datetime
-import random
+from types import MappingProxyType, SimpleNamespace
+from sqlalchemy import event, insert, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import raiseload
 
-from ..conftest import db_session, test_user, test_molecule, test_molecules
+from ..conftest import count_queries
 from ...app.crud.crud_submission import submission
-from ...app.crud.crud_cro_service import cro_service
-from ...app.crud.crud_document import document
 from ...app.schemas.submission import SubmissionCreate, SubmissionUpdate, SubmissionFilter, SubmissionAction, SubmissionPricingUpdate
 from ...app.constants.submission_status import SubmissionStatus, SubmissionAction as SubmissionActionEnum
-from ...app.models.cro_service import ServiceType
+from ...app.models.cro_service import CROService, ServiceType
+from ...app.models.document import Document
+from ...app.models.submission import Submission, submission_molecule
 from ...app.constants.document_types import DocumentType
 
-@pytest.fixture
-def create_test_cro_service(db_session):
-    """Creates a test CRO service for submission testing"""
-    cro_service_data = {
-        "name": f"Test CRO Service {uuid4()}",
-        "description": "Test CRO service description",
-        "provider": "Test CRO Provider",
-        "service_type": ServiceType.BINDING_ASSAY,
-        "base_price": random.uniform(100, 1000),
-        "price_currency": "USD",
-        "typical_turnaround_days": random.randint(7, 30),
-        "active": True
-    }
-    created_cro_service = cro_service.create(cro_service_data, db=db_session)
-    return created_cro_service
+# Submission status values, resolved once for the assertions and parametrize tables below
+(
+    _DRAFT, _SUBMITTED, _PENDING_REVIEW, _PRICING_PROVIDED, _APPROVED, _IN_PROGRESS,
+    _RESULTS_UPLOADED, _RESULTS_REVIEWED, _COMPLETED, _CANCELLED, _REJECTED
+) = (
+    status.value for status in (
+        SubmissionStatus.DRAFT,
+        SubmissionStatus.SUBMITTED,
+        SubmissionStatus.PENDING_REVIEW,
+        SubmissionStatus.PRICING_PROVIDED,
+        SubmissionStatus.APPROVED,
+        SubmissionStatus.IN_PROGRESS,
+        SubmissionStatus.RESULTS_UPLOADED,
+        SubmissionStatus.RESULTS_REVIEWED,
+        SubmissionStatus.COMPLETED,
+        SubmissionStatus.CANCELLED,
+        SubmissionStatus.REJECTED,
+    )
+)
+
+# Maximum SQL statements allowed per fetch, independent of how many rows are returned
+RELATIONSHIP_QUERY_BUDGET = 3  # submission + eager loads for molecules and documents
+LISTING_QUERY_BUDGET = 2  # COUNT + page SELECT
+
+# Benchmarks need the pytest-benchmark plugin and only run when explicitly enabled
+requires_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None, reason="pytest-benchmark is not installed"
+)
+
+# Required documents attached to every bundled submission; per-row ids are added at insert time
+_DOCUMENT_TEMPLATES = (
+    MappingProxyType({
+        "name": "Test Material Transfer Agreement",
+        "type": DocumentType.MATERIAL_TRANSFER_AGREEMENT,
+        "url": "http://example.com/mta.pdf",
+        "status": "UPLOADED",
+        "is_signed": True
+    }),
+    MappingProxyType({
+        "name": "Test Non-Disclosure Agreement",
+        "type": DocumentType.NON_DISCLOSURE_AGREEMENT,
+        "url": "http://example.com/nda.pdf",
+        "status": "UPLOADED",
+        "is_signed": True
+    }),
+    MappingProxyType({
+        "name": "Test Experiment Specification",
+        "type": DocumentType.EXPERIMENT_SPECIFICATION,
+        "url": "http://example.com/spec.pdf",
+        "status": "UPLOADED",
+        "is_signed": True
+    }),
+)
+
+@pytest.fixture(scope="module")
+def data_bundle(connection, session_db, test_user, test_molecules):
+    """Creates the module's CRO service, submissions, molecule links and required documents once.
+
+    Each table is populated with a single (executemany) INSERT; the per-test SAVEPOINT in
+    db_session rolls back any changes tests make to these rows. The rows live in a module-level
+    SAVEPOINT, opened after the session-scoped fixtures above, that is rolled back when the
+    module ends so later modules on the worker never see them.
+    """
+    savepoint = connection.begin_nested()
+    try:
+        now = datetime.utcnow()
+        cro_service_id = session_db.execute(
+            insert(CROService).values(
+                name=f"Test CRO Service {uuid4()}",
+                description="Test CRO service description",
+                provider="Test CRO Provider",
+                service_type=ServiceType.BINDING_ASSAY,
+                base_price=500.00,
+                price_currency="USD",
+                typical_turnaround_days=14,
+                active=True
+            ).returning(CROService.id)
+        ).scalar_one()
+
+        submission_rows = [
+            {"name": "Test Submission", "description": "Test submission description"},
+            {"name": "Test Submission with Molecules", "description": "Test submission with molecules description"},
+            {"name": "Test Submission Workflow", "description": "Test submission workflow description"},
+        ]
+        draft_id, with_molecules_id, workflow_id = session_db.scalars(
+            insert(Submission).returning(Submission.id, sort_by_parameter_order=True),
+            [
+                {**row, "cro_service_id": cro_service_id, "created_by": test_user.id,
+                 "status": _DRAFT}
+                for row in submission_rows
+            ]
+        ).all()
+
+        session_db.execute(
+            insert(submission_molecule),
+            [
+                {"submission_id": submission_id, "molecule_id": molecule.id, "added_at": now}
+                for submission_id in (with_molecules_id, workflow_id)
+                for molecule in test_molecules
+            ]
+        )
+
+        document_ids = session_db.scalars(
+            insert(Document).returning(Document.id),
+            [
+                {**fields, "submission_id": submission_id, "uploaded_by": test_user.id, "uploaded_at": now}
+                for submission_id in (draft_id, with_molecules_id, workflow_id)
+                for fields in _DOCUMENT_TEMPLATES
+            ]
+        ).all()
+        session_db.commit()
+
+        submissions = {
+            s.id: s for s in session_db.scalars(
+                select(Submission).where(Submission.id.in_([draft_id, with_molecules_id, workflow_id]))
+            )
+        }
+        documents = session_db.scalars(select(Document).where(Document.id.in_(document_ids))).all()
+        yield SimpleNamespace(
+            cro_service=session_db.get(CROService, cro_service_id),
+            draft_submission=submissions[draft_id],
+            submission_with_molecules=submissions[with_molecules_id],
+            workflow_submission=submissions[workflow_id],
+            submission_ids=frozenset(submissions),
+            documents=documents
+        )
+    finally:
+        session_db.rollback()
+        if savepoint.is_active:
+            savepoint.rollback()
+        session_db.expire_all()
+
+@pytest.fixture(scope="module")
+def readonly_db(session_db, data_bundle):
+    """Shares the bundled data with tests that never write, skipping the per-test SAVEPOINT"""
+    return session_db
+
+@pytest.fixture(scope="module")
+def default_filter(test_user):
+    """Builds the submission filter once per module; use model_copy() before changing it"""
+    return SubmissionFilter(created_by=test_user.id, name_contains="Test")
 
 @pytest.fixture
-def create_test_submission(db_session, test_user, create_test_cro_service):
-    """Creates a test submission for testing CRUD operations"""
-    submission_data = {
-        "name": "Test Submission",
-        "cro_service_id": create_test_cro_service.id,
-        "created_by": test_user.id,
-        "description": "Test submission description"
-    }
-    created_submission = submission.create_submission(submission_data, test_user, db=db_session)
-    return created_submission
+def strict_loading(readonly_db):
+    """Makes relationships that a query did not eager-load raise on access instead of lazy loading"""
+    def apply_raiseload(orm_execute_state):
+        if orm_execute_state.is_select:
+            orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+    # Drop state loaded by fixtures so only the query under test populates relationships
+    readonly_db.expire_all()
+    event.listen(readonly_db, "do_orm_execute", apply_raiseload)
+    try:
+        yield readonly_db
+    finally:
+        event.remove(readonly_db, "do_orm_execute", apply_raiseload)
 
 @pytest.fixture
-def create_test_submission_with_molecules(db_session, test_user, create_test_cro_service, test_molecules):
-    """Creates a test submission with molecules for testing"""
-    submission_data = {
-        "name": "Test Submission with Molecules",
-        "cro_service_id": create_test_cro_service.id,
-        "created_by": test_user.id,
-        "description": "Test submission with molecules description",
-        "molecule_ids": [molecule.id for molecule in test_molecules]
-    }
-    created_submission = submission.create_submission(submission_data, test_user, db=db_session)
-    return created_submission
+def opt_in_benchmark(request, benchmark):
+    """Provides the benchmark fixture, skipping unless run with --benchmark-enable or --benchmark-only"""
+    if not (request.config.getoption("benchmark_enable") or request.config.getoption("benchmark_only")):
+        pytest.skip("benchmarks are opt-in; run with --benchmark-enable --benchmark-only")
+    return benchmark
 
-@pytest.fixture
-def create_test_documents(db_session, create_test_submission):
-    """Creates test documents for a submission"""
-    document_data = [
-        {
-            "name": "Test Material Transfer Agreement",
-            "type": DocumentType.MATERIAL_TRANSFER_AGREEMENT,
-            "submission_id": create_test_submission.id,
-            "uploaded_by": create_test_submission.created_by,
-            "url": "http://example.com/mta.pdf",
-            "status": "UPLOADED",
-            "is_signed": True
-        },
-        {
-            "name": "Test Non-Disclosure Agreement",
-            "type": DocumentType.NON_DISCLOSURE_AGREEMENT,
-            "submission_id": create_test_submission.id,
-            "uploaded_by": create_test_submission.created_by,
-            "url": "http://example.com/nda.pdf",
-            "status": "UPLOADED",
-            "is_signed": True
-        },
-        {
-            "name": "Test Experiment Specification",
-            "type": DocumentType.EXPERIMENT_SPECIFICATION,
-            "submission_id": create_test_submission.id,
-            "uploaded_by": create_test_submission.created_by,
-            "url": "http://example.com/spec.pdf",
-            "status": "UPLOADED",
-            "is_signed": True
-        }
-    ]
-    created_documents = []
-    for data in document_data:
-        created_document = document.create(data, db=db_session)
-        created_documents.append(created_document)
-    return created_documents
-
-def test_create_submission(db_session, test_user, create_test_cro_service):
+def test_create_submission(db_session, test_user, data_bundle):
     """Tests creating a new submission"""
     submission_data = {
         "name": "Test Submission",
-        "cro_service_id": create_test_cro_service.id,
+        "cro_service_id": data_bundle.cro_service.id,
         "created_by": test_user.id,
         "description": "Test submission description"
     }
     created_submission = submission.create_submission(submission_data, test_user, db=db_session)
     assert created_submission.name == "Test Submission"
-    assert created_submission.cro_service_id == create_test_cro_service.id
+    assert created_submission.cro_service_id == data_bundle.cro_service.id
     assert created_submission.created_by == test_user.id
     assert created_submission.description == "Test submission description"
-    assert created_submission.status == SubmissionStatus.DRAFT.value
+    assert created_submission.status == _DRAFT
 
-def test_get_submission(db_session, create_test_submission):
+@pytest.mark.readonly
+def test_get_submission(readonly_db, data_bundle):
     """Tests retrieving a submission by ID"""
-    retrieved_submission = submission.get_with_relationships(create_test_submission.id, db=db_session)
-    assert retrieved_submission.id == create_test_submission.id
-
-def test_get_submission_with_relationships(db_session, create_test_submission_with_molecules, create_test_documents):
-    """Tests retrieving a submission with its relationships"""
-    retrieved_submission = submission.get_with_relationships(create_test_submission_with_molecules.id, db=db_session)
-    assert retrieved_submission.id == create_test_submission_with_molecules.id
+    retrieved_submission = submission.get_with_relationships(data_bundle.draft_submission.id, db=readonly_db)
+    assert retrieved_submission.id == data_bundle.draft_submission.id
+
+@pytest.mark.readonly
+def test_get_submission_with_relationships(readonly_db, strict_loading, data_bundle):
+    """Tests retrieving a submission with its relationships eager-loaded"""
+    with count_queries(readonly_db.connection()) as queries:
+        retrieved_submission = submission.get_with_relationships(data_bundle.submission_with_molecules.id, db=readonly_db)
+    assert len(queries) <= RELATIONSHIP_QUERY_BUDGET
+    assert retrieved_submission.id == data_bundle.submission_with_molecules.id
+    # These would raise under strict_loading if they were lazy loaded (N+1)
     assert len(retrieved_submission.molecules) > 0
     assert len(retrieved_submission.documents) > 0
     assert retrieved_submission.cro_service is not None
+    # Relationships outside the eager-load set must not be silently lazy loaded
+    with pytest.raises(InvalidRequestError):
+        retrieved_submission.results
 
-def test_update_submission(db_session, create_test_submission):
+def test_update_submission(db_session, data_bundle):
     """Tests updating a submission"""
     update_data = {
         "name": "Updated Submission Name",
         "description": "Updated submission description"
     }
-    updated_submission = submission.update_submission(create_test_submission, update_data, db=db_session)
+    updated_submission = submission.update_submission(data_bundle.draft_submission, update_data, db=db_session)
     assert updated_submission.name == "Updated Submission Name"
     assert updated_submission.description == "Updated submission description"
 
-def test_get_by_creator(db_session, test_user, create_test_submission):
+@pytest.mark.readonly
+def test_get_by_creator(readonly_db, test_user, data_bundle):
     """Tests retrieving submissions by creator"""
-    retrieved_submissions = submission.get_by_creator(test_user.id, db=db_session)
-    assert len(retrieved_submissions["items"]) > 0
-    assert retrieved_submissions["total"] > 0
-    assert create_test_submission in retrieved_submissions["items"]
-
-def test_get_by_status(db_session, create_test_submission):
+    with count_queries(readonly_db.connection()) as queries:
+        retrieved_submissions = submission.get_by_creator(test_user.id, limit=1, db=readonly_db)
+    assert len(queries) <= LISTING_QUERY_BUDGET
+    # Existence only: fetch a single row and check it is one the bundle inserted
+    assert retrieved_submissions["total"] >= 1
+    assert len(retrieved_submissions["items"]) == 1
+    assert retrieved_submissions["items"][0].id in data_bundle.submission_ids
+
+@pytest.mark.readonly
+def test_get_by_status(readonly_db, data_bundle):
     """Tests retrieving submissions by status"""
-    retrieved_submissions = submission.get_by_status([SubmissionStatus.DRAFT.value], db=db_session)
-    assert len(retrieved_submissions["items"]) > 0
-    assert retrieved_submissions["total"] > 0
-    assert create_test_submission in retrieved_submissions["items"]
-
-def test_get_active_submissions(db_session, create_test_submission):
+    with count_queries(readonly_db.connection()) as queries:
+        retrieved_submissions = submission.get_by_status([_DRAFT], limit=1, db=readonly_db)
+    assert len(queries) <= LISTING_QUERY_BUDGET
+    assert retrieved_submissions["total"] >= 1
+    assert len(retrieved_submissions["items"]) == 1
+    assert retrieved_submissions["items"][0].id in data_bundle.submission_ids
+
+@pytest.mark.readonly
+def test_get_active_submissions(readonly_db, data_bundle):
     """Tests retrieving active submissions"""
-    retrieved_submissions = submission.get_active_submissions(db=db_session)
-    assert len(retrieved_submissions["items"]) > 0
-    assert retrieved_submissions["total"] > 0
-    assert create_test_submission in retrieved_submissions["items"]
-
-def test_get_by_molecule(db_session, test_molecule, create_test_submission_with_molecules):
+    with count_queries(readonly_db.connection()) as queries:
+        retrieved_submissions = submission.get_active_submissions(limit=1, db=readonly_db)
+    assert len(queries) <= LISTING_QUERY_BUDGET
+    assert retrieved_submissions["total"] >= 1
+    assert len(retrieved_submissions["items"]) == 1
+    assert retrieved_submissions["items"][0].id in data_bundle.submission_ids
+
+@pytest.mark.readonly
+def test_get_by_molecule(readonly_db, test_molecule, data_bundle):
     """Tests retrieving submissions by molecule"""
-    retrieved_submissions = submission.get_by_molecule(test_molecule.id, db=db_session)
-    assert len(retrieved_submissions["items"]) > 0
-    assert retrieved_submissions["total"] > 0
-    assert create_test_submission_with_molecules in retrieved_submissions["items"]
+    retrieved_submissions = submission.get_by_molecule(test_molecule.id, limit=1, db=readonly_db)
+    assert retrieved_submissions["total"] >= 1
+    assert len(retrieved_submissions["items"]) == 1
+    assert retrieved_submissions["items"][0].id in data_bundle.submission_ids
 
-def test_get_by_cro_service(db_session, create_test_cro_service, create_test_submission):
+@pytest.mark.readonly
+def test_get_by_cro_service(readonly_db, data_bundle):
     """Tests retrieving submissions by CRO service"""
-    retrieved_submissions = submission.get_by_cro_service(create_test_cro_service.id, db=db_session)
-    assert len(retrieved_submissions["items"]) > 0
-    assert retrieved_submissions["total"] > 0
-    assert create_test_submission in retrieved_submissions["items"]
+    retrieved_submissions = submission.get_by_cro_service(data_bundle.cro_service.id, limit=1, db=readonly_db)
+    assert retrieved_submissions["total"] >= 1
+    assert len(retrieved_submissions["items"]) == 1
+    assert retrieved_submissions["items"][0].id in data_bundle.submission_ids
 
-def test_filter_submissions(db_session, test_user, create_test_submission):
+@pytest.mark.readonly
+def test_filter_submissions(readonly_db, default_filter, data_bundle):
     """Tests filtering submissions with multiple criteria"""
-    filter_params = SubmissionFilter(created_by=test_user.id, name_contains="Test")
-    filtered_submissions = submission.filter_submissions(filter_params, db=db_session)
+    with count_queries(readonly_db.connection()) as queries:
+        filtered_submissions = submission.filter_submissions(default_filter, db=readonly_db)
+    assert len(queries) <= LISTING_QUERY_BUDGET
     assert len(filtered_submissions["items"]) > 0
     assert filtered_submissions["total"] > 0
-    assert create_test_submission in filtered_submissions["items"]
+    assert data_bundle.draft_submission.id in {item.id for item in filtered_submissions["items"]}
 
-def test_update_status(db_session, create_test_submission):
+def test_update_status(db_session, data_bundle):
     """Tests updating a submission status"""
-    updated_submission = submission.update_status(create_test_submission.id, SubmissionStatus.SUBMITTED.value, db=db_session)
-    assert updated_submission.status == SubmissionStatus.SUBMITTED.value
+    updated_submission = submission.update_status(data_bundle.draft_submission.id, _SUBMITTED, db=db_session)
+    assert updated_submission.status == _SUBMITTED
     assert updated_submission.submitted_at is not None
 
-def test_add_molecule(db_session, create_test_submission, test_molecule):
+def test_add_molecule(db_session, data_bundle, test_molecule):
     """Tests adding a molecule to a submission"""
-    success = submission.add_molecule(create_test_submission.id, test_molecule.id, db=db_session)
+    success = submission.add_molecule(data_bundle.draft_submission.id, test_molecule.id, db=db_session)
     assert success is True
-    retrieved_submission = submission.get_with_relationships(create_test_submission.id, db=db_session)
-    assert test_molecule in retrieved_submission.molecules
+    # Reload only the molecules collection rather than the full eager-loaded submission
+    db_session.refresh(data_bundle.draft_submission, attribute_names=["molecules"])
+    assert test_molecule.id in {molecule.id for molecule in data_bundle.draft_submission.molecules}
 
-def test_remove_molecule(db_session, create_test_submission_with_molecules, test_molecules):
+def test_remove_molecule(db_session, data_bundle, test_molecules):
     """Tests removing a molecule from a submission"""
     molecule_to_remove = test_molecules[0]
-    success = submission.remove_molecule(create_test_submission_with_molecules.id, molecule_to_remove.id, db=db_session)
+    success = submission.remove_molecule(data_bundle.submission_with_molecules.id, molecule_to_remove.id, db=db_session)
     assert success is True
-    retrieved_submission = submission.get_with_relationships(create_test_submission_with_molecules.id, db=db_session)
-    assert molecule_to_remove not in retrieved_submission.molecules
+    db_session.refresh(data_bundle.submission_with_molecules, attribute_names=["molecules"])
+    assert molecule_to_remove.id not in {molecule.id for molecule in data_bundle.submission_with_molecules.molecules}
 
-def test_set_pricing(db_session, create_test_submission):
+def test_set_pricing(db_session, data_bundle):
     """Tests setting pricing for a submission"""
     pricing_data = {
         "price": 1500.00,
         "price_currency": "USD",
         "estimated_turnaround_days": 14
     }
-    submission.update_status(create_test_submission.id, SubmissionStatus.PENDING_REVIEW.value, db=db_session)
-    updated_submission = submission.set_pricing(create_test_submission.id, pricing_data, db=db_session)
+    submission.update_status(data_bundle.draft_submission.id, _PENDING_REVIEW, db=db_session)
+    updated_submission = submission.set_pricing(data_bundle.draft_submission.id, pricing_data, db=db_session)
     assert updated_submission.price == 1500.00
     assert updated_submission.price_currency == "USD"
     assert updated_submission.estimated_turnaround_days == 14
-    assert updated_submission.status == SubmissionStatus.PRICING_PROVIDED.value
+    assert updated_submission.status == _PRICING_PROVIDED
 
-def test_set_specifications(db_session, create_test_submission):
+def test_set_specifications(db_session, data_bundle):
     """Tests setting specifications for a submission"""
     specifications = {"assay_type": "Binding Assay", "target": "Target Protein"}
-    updated_submission = submission.set_specifications(create_test_submission.id, specifications, db=db_session)
+    updated_submission = submission.set_specifications(data_bundle.draft_submission.id, specifications, db=db_session)
     assert updated_submission.specifications == specifications
 
-def test_submit_submission(db_session, create_test_submission_with_molecules, create_test_documents):
+def test_submit_submission(db_session, data_bundle):
     """Tests submitting a submission to a CRO"""
-    updated_submission = submission.submit_submission(create_test_submission_with_molecules.id, db=db_session)
-    assert updated_submission.status == SubmissionStatus.SUBMITTED.value
+    updated_submission = submission.submit_submission(data_bundle.submission_with_molecules.id, db=db_session)
+    assert updated_submission.status == _SUBMITTED
     assert updated_submission.submitted_at is not None
 
-def test_approve_submission(db_session, create_test_submission_with_molecules, create_test_documents):
+def test_approve_submission(db_session, data_bundle):
     """Tests approving a submission with pricing"""
-    submission_id = create_test_submission_with_molecules.id
-    submission.update_status(submission_id, SubmissionStatus.PENDING_REVIEW.value, db=db_session)
+    submission_id = data_bundle.submission_with_molecules.id
+    submission.update_status(submission_id, _PENDING_REVIEW, db=db_session)
     pricing_data = SubmissionPricingUpdate(price=1500.00, price_currency="USD", estimated_turnaround_days=14)
     submission.set_pricing(submission_id, pricing_data, db=db_session)
     updated_submission = submission.approve_submission(submission_id, db=db_session)
-    assert updated_submission.status == SubmissionStatus.APPROVED.value
+    assert updated_submission.status == _APPROVED
     assert updated_submission.approved_at is not None
 
-def test_cancel_submission(db_session, create_test_submission):
+def test_cancel_submission(db_session, data_bundle):
     """Tests cancelling a submission"""
-    updated_submission = submission.cancel_submission(create_test_submission.id, db=db_session)
-    assert updated_submission.status == SubmissionStatus.CANCELLED.value
+    updated_submission = submission.cancel_submission(data_bundle.draft_submission.id, db=db_session)
+    assert updated_submission.status == _CANCELLED
 
-def test_complete_submission(db_session, create_test_submission_with_molecules, create_test_documents):
+def test_complete_submission(db_session, data_bundle):
     """Tests completing a submission"""
-    submission_id = create_test_submission_with_molecules.id
-    submission.update_status(submission_id, SubmissionStatus.RESULTS_REVIEWED.value, db=db_session)
+    submission_id = data_bundle.submission_with_molecules.id
+    submission.update_status(submission_id, _RESULTS_REVIEWED, db=db_session)
     updated_submission = submission.complete_submission(submission_id, db=db_session)
-    assert updated_submission.status == SubmissionStatus.COMPLETED.value
+    assert updated_submission.status == _COMPLETED
     assert updated_submission.completed_at is not None
 
-def test_process_submission_action(db_session, create_test_submission_with_molecules, create_test_documents):
+def test_process_submission_action(db_session, data_bundle):
     """Tests processing different submission actions"""
-    action_data = SubmissionAction(action=SubmissionStatus.SUBMITTED.value)
-    updated_submission = submission.process_submission_action(create_test_submission_with_molecules.id, action_data, db=db_session)
-    assert updated_submission.status == SubmissionStatus.SUBMITTED.value
+    action_data = SubmissionAction(action=_SUBMITTED)
+    updated_submission = submission.process_submission_action(data_bundle.submission_with_molecules.id, action_data, db=db_session)
+    assert updated_submission.status == _SUBMITTED
 
-def test_get_submission_counts_by_status(db_session, test_user, create_test_submission):
+@pytest.mark.readonly
+def test_get_submission_counts_by_status(readonly_db, test_user, data_bundle):
     """Tests getting submission counts grouped by status"""
-    status_counts = submission.get_submission_counts_by_status(db=db_session)
-    assert any(count.status == SubmissionStatus.DRAFT.value and count.count > 0 for count in status_counts)
+    status_counts = submission.get_submission_counts_by_status(db=readonly_db)
+    counts = {count.status: count.count for count in status_counts}
+    assert counts.get(_DRAFT, 0) > 0
 
-def test_check_required_documents(db_session, create_test_submission, create_test_documents):
+@pytest.mark.readonly
+def test_check_required_documents(readonly_db, data_bundle):
     """Tests checking required documents for a submission"""
-    document_requirements = submission.check_required_documents(create_test_submission.id, db=db_session)
+    document_requirements = submission.check_required_documents(data_bundle.draft_submission.id, db=readonly_db)
     assert len(document_requirements.required_documents) > 0
     assert len(document_requirements.existing_documents) > 0
     for doc in document_requirements.required_documents:
         assert doc["completed"] is True
 
-def test_submission_workflow(db_session, test_user, create_test_cro_service, test_molecules):
-    """Tests the complete submission workflow from creation to completion"""
-    # 1. Create a new submission
-    submission_data = {
-        "name": "Test Submission Workflow",
-        "cro_service_id": create_test_cro_service.id,
-        "created_by": test_user.id,
-        "description": "Test submission workflow description"
-    }
-    created_submission = submission.create_submission(submission_data, test_user, db=db_session)
-    assert created_submission.status == SubmissionStatus.DRAFT.value
-
-    # 2. Add molecules to the submission
-    for molecule in test_molecules:
-        success = submission.add_molecule(created_submission.id, molecule.id, db=db_session)
-        assert success is True
-    retrieved_submission = submission.get_with_relationships(created_submission.id, db=db_session)
-    assert len(retrieved_submission.molecules) == len(test_molecules)
-
-    # 3. Create required documents
-    document_data = [
-        {
-            "name": "Test Material Transfer Agreement",
-            "type": DocumentType.MATERIAL_TRANSFER_AGREEMENT,
-            "submission_id": created_submission.id,
-            "uploaded_by": created_submission.created_by,
-            "url": "http://example.com/mta.pdf",
-            "status": "UPLOADED",
-            "is_signed": True
-        },
-        {
-            "name": "Test Non-Disclosure Agreement",
-            "type": DocumentType.NON_DISCLOSURE_AGREEMENT,
-            "submission_id": created_submission.id,
-            "uploaded_by": created_submission.created_by,
-            "url": "http://example.com/nda.pdf",
-            "status": "UPLOADED",
-            "is_signed": True
-        },
-        {
-            "name": "Test Experiment Specification",
-            "type": DocumentType.EXPERIMENT_SPECIFICATION,
-            "submission_id": created_submission.id,
-            "uploaded_by": created_submission.created_by,
-            "url": "http://example.com/spec.pdf",
-            "status": "UPLOADED",
-            "is_signed": True
-        }
-    ]
-    for data in document_data:
-        document.create(data, db=db_session)
-
-    # 4. Submit the submission
-    updated_submission = submission.submit_submission(created_submission.id, db=db_session)
-    assert updated_submission.status == SubmissionStatus.SUBMITTED.value
-    assert updated_submission.submitted_at is not None
-
-    # 5. Provide pricing for the submission
-    pricing_data = SubmissionPricingUpdate(price=1500.00, price_currency="USD", estimated_turnaround_days=14)
-    submission.update_status(created_submission.id, SubmissionStatus.PENDING_REVIEW.value, db=db_session)
-    updated_submission = submission.set_pricing(created_submission.id, pricing_data, db=db_session)
-    assert updated_submission.status == SubmissionStatus.PRICING_PROVIDED.value
-    assert updated_submission.price == 1500.00
-    assert updated_submission.price_currency == "USD"
-    assert updated_submission.estimated_turnaround_days == 14
-
-    # 6. Approve the submission
-    updated_submission = submission.approve_submission(created_submission.id, db=db_session)
-    assert updated_submission.status == SubmissionStatus.APPROVED.value
-    assert updated_submission.approved_at is not None
-
-    # 7. Update status to IN_PROGRESS
-    action_data = SubmissionAction(action=SubmissionStatus.IN_PROGRESS.value)
-    updated_submission = submission.process_submission_action(created_submission.id, action_data, db=db_session)
-    assert updated_submission.status == SubmissionStatus.IN_PROGRESS.value
-
-    # 8. Update status to RESULTS_UPLOADED
-    action_data = SubmissionAction(action=SubmissionStatus.RESULTS_UPLOADED.value)
-    updated_submission = submission.process_submission_action(created_submission.id, action_data, db=db_session)
-    assert updated_submission.status == SubmissionStatus.RESULTS_UPLOADED.value
-
-    # 9. Update status to RESULTS_REVIEWED
-    action_data = SubmissionAction(action=SubmissionStatus.RESULTS_REVIEWED.value)
-    updated_submission = submission.process_submission_action(created_submission.id, action_data, db=db_session)
-    assert updated_submission.status == SubmissionStatus.RESULTS_REVIEWED.value
-
-    # 10. Complete the submission
-    updated_submission = submission.complete_submission(created_submission.id, db=db_session)
-    assert updated_submission.status == SubmissionStatus.COMPLETED.value
-    assert updated_submission.completed_at is not None
\ No newline at end of file
+@pytest.mark.parametrize("from_status,action,action_data,to_status", [
+    (_DRAFT, SubmissionActionEnum.SUBMIT.value, None, _SUBMITTED),
+    (_PENDING_REVIEW, SubmissionActionEnum.PROVIDE_PRICING.value,
+     {"price": 1500.00, "price_currency": "USD", "estimated_turnaround_days": 14},
+     _PRICING_PROVIDED),
+    (_PRICING_PROVIDED, SubmissionActionEnum.APPROVE.value, None, _APPROVED),
+    (_APPROVED, SubmissionActionEnum.START_EXPERIMENT.value, None, _IN_PROGRESS),
+    (_IN_PROGRESS, SubmissionActionEnum.UPLOAD_RESULTS.value, None, _RESULTS_UPLOADED),
+    (_RESULTS_UPLOADED, SubmissionActionEnum.REVIEW_RESULTS.value, None, _RESULTS_REVIEWED),
+    (_RESULTS_REVIEWED, SubmissionActionEnum.COMPLETE.value, None, _COMPLETED),
+    (_DRAFT, SubmissionActionEnum.CANCEL.value, None, _CANCELLED),
+    (_SUBMITTED, SubmissionActionEnum.REJECT.value, None, _REJECTED),
+])
+def test_submission_workflow(db_session, data_bundle, from_status, action, action_data, to_status):
+    """Tests each transition of the submission workflow from its starting status"""
+    submission.update_status(data_bundle.workflow_submission.id, from_status, db=db_session)
+    updated_submission = submission.process_submission_action(
+        data_bundle.workflow_submission.id, SubmissionAction(action=action, data=action_data), db=db_session
+    )
+    assert updated_submission.status == to_status
+
+@requires_benchmark
+@pytest.mark.readonly
+def test_bench_get_with_relationships(opt_in_benchmark, readonly_db, data_bundle):
+    """Benchmarks loading a submission with its eager-loaded relationships"""
+    result = opt_in_benchmark.pedantic(
+        submission.get_with_relationships,
+        args=(data_bundle.submission_with_molecules.id,),
+        kwargs={"db": readonly_db},
+        rounds=50,
+        warmup_rounds=5
+    )
+    assert result.id == data_bundle.submission_with_molecules.id
+
+@requires_benchmark
+@pytest.mark.readonly
+def test_bench_filter_submissions(opt_in_benchmark, readonly_db, default_filter, data_bundle):
+    """Benchmarks filtering submissions with a prebuilt filter"""
+    result = opt_in_benchmark.pedantic(
+        submission.filter_submissions,
+        args=(default_filter,),
+        kwargs={"db": readonly_db},
+        rounds=50,
+        warmup_rounds=5
+    )
+    assert result["total"] > 0
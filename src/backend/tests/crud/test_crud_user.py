@@ -1,8 +1,11 @@
 import pytest
 import uuid
-import random
-import string
+import itertools
+import os
 
+from sqlalchemy import update
+
+from ..conftest import count_queries
 from ...app.crud.crud_user import user
 from ...app.models.user import User
 from ...app.schemas.user import UserCreate, UserUpdate
@@ -10,11 +13,28 @@ from ...app.constants.user_roles import (
     SYSTEM_ADMIN, PHARMA_ADMIN, PHARMA_SCIENTIST, CRO_ADMIN
 )
 
+# Sequence numbers keep generated emails unique without drawing random characters
+_email_counter = itertools.count()
+
+
+def _rand_email(prefix: str = "user") -> str:
+    """Return an email address unique within this test run."""
+    return f"{prefix}{next(_email_counter)}_{os.getpid()}@example.com"
+
+
+# Validated once; model_copy(update=...) clones it for bulk test data without re-running validators
+_USER_TEMPLATE = UserCreate(
+    email="template@example.com",
+    full_name="Template User",
+    password="StrongPass123!",
+    role=PHARMA_SCIENTIST
+)
+
 
 def test_create_user(db_session):
     """Test creating a new user with the CRUD user service."""
-    # Create a random email for testing
-    email = ''.join(random.choice(string.ascii_lowercase) for _ in range(10)) + "@example.com"
+    # Create a unique email for testing
+    email = _rand_email()
     
     # Create a UserCreate object with test data
     user_in = UserCreate(
@@ -67,12 +87,44 @@ def test_get_user_by_email(db_session, test_user):
     # Try to get a non-existent email
     non_existent_user = user.get_by_email("nonexistent@example.com", db=db_session)
     assert non_existent_user is None
+    
+    # Check existence without loading the user
+    assert user.email_exists(email.upper(), db=db_session) is True
+    assert user.email_exists("nonexistent@example.com", db=db_session) is False
+
+
+def test_get_user_by_email_cached(db_session):
+    """Test that a repeated lookup by email in the same transaction is served without a query."""
+    db_user = user.create(_USER_TEMPLATE.model_copy(update={"email": _rand_email()}), db=db_session)
+    
+    # The commit in create drops the cache; the first lookup refills it
+    assert user.get_by_email(db_user.email, db=db_session) is db_user
+    with count_queries(db_session.connection()) as queries:
+        cached_user = user.get_by_email(db_user.email.upper(), db=db_session)
+    assert cached_user is db_user
+    assert queries == []
+
+
+def test_get_user_by_email_cache_detects_changed_email(db_session):
+    """Test that a cached user whose email changed outside the ORM is not returned for the old email."""
+    old_email = _rand_email()
+    db_user = user.create(_USER_TEMPLATE.model_copy(update={"email": old_email}), db=db_session)
+    assert user.get_by_email(old_email, db=db_session) is db_user
+    
+    # Change the email behind the session's back, as another session would
+    db_session.execute(
+        update(User).where(User.id == db_user.id).values(email=_rand_email()),
+        execution_options={"synchronize_session": False}
+    )
+    db_session.expire(db_user)
+    
+    assert user.get_by_email(old_email, db=db_session) is None
 
 
 def test_authenticate_user(db_session):
     """Test user authentication with email and password."""
-    # Create a random email and password for testing
-    email = ''.join(random.choice(string.ascii_lowercase) for _ in range(10)) + "@example.com"
+    # Create a unique email and password for testing
+    email = _rand_email()
     password = "StrongPass123!"
     
     # Create a UserCreate object with test data
@@ -98,13 +150,13 @@ def test_authenticate_user(db_session):
     assert nonexistent_auth_user is None
 
 
-def test_update_user(db_session, test_user):
+def test_update_user(db_session, test_user_mutable):
     """Test updating user information."""
     # Create a UserUpdate object with new full name
     update_data = UserUpdate(full_name="Updated Name")
     
     # Call user.update with the test user and UserUpdate object
-    updated_user = user.update(test_user, update_data, db=db_session)
+    updated_user = user.update(test_user_mutable, update_data, db=db_session, flush=True)
     
     # Assert that the user's full name was updated
     assert updated_user.full_name == "Updated Name"
@@ -114,7 +166,7 @@ def test_update_user(db_session, test_user):
     update_data = UserUpdate(password=new_password)
     
     # Call user.update with the test user and UserUpdate object
-    updated_user = user.update(test_user, update_data, db=db_session)
+    updated_user = user.update(test_user_mutable, update_data, db=db_session, flush=True)
     
     # Assert that the user's password was updated and hashed
     assert updated_user.check_password(new_password)
@@ -129,7 +181,7 @@ def test_update_user(db_session, test_user):
     )
     
     # Call user.update with the test user and UserUpdate object
-    updated_user = user.update(test_user, update_data, db=db_session)
+    updated_user = user.update(test_user_mutable, update_data, db=db_session)
     
     # Assert all fields were updated correctly
     assert updated_user.full_name == "Multiple Updates"
@@ -138,9 +190,9 @@ def test_update_user(db_session, test_user):
     assert updated_user.role == PHARMA_ADMIN
     
     # Verify the user can authenticate with the new password
-    authenticated_user = user.authenticate(test_user.email, new_password, db=db_session)
+    authenticated_user = user.authenticate(test_user_mutable.email, new_password, db=db_session)
     assert authenticated_user is not None
-    assert authenticated_user.id == test_user.id
+    assert authenticated_user.id == test_user_mutable.id
 
 
 def test_get_users_by_organization(db_session):
@@ -149,27 +201,25 @@ def test_get_users_by_organization(db_session):
     org_id = uuid.uuid4()
     
     # Create multiple users with the same organization ID
-    for i in range(5):
-        user_in = UserCreate(
-            email=f"orguser{i}_{random.randint(1000, 9999)}@example.com",
-            full_name=f"Org User {i}",
-            password="StrongPass123!",
-            organization_id=org_id,
-            role=PHARMA_SCIENTIST
-        )
-        user.create(user_in, db=db_session)
+    user.bulk_create([
+        _USER_TEMPLATE.model_copy(update={
+            "email": _rand_email("orguser"),
+            "full_name": f"Org User {i}",
+            "organization_id": org_id
+        })
+        for i in range(5)
+    ], db=db_session)
     
     # Create users with different organization IDs
     different_org_id = uuid.uuid4()
-    for i in range(3):
-        user_in = UserCreate(
-            email=f"difforguser{i}_{random.randint(1000, 9999)}@example.com",
-            full_name=f"Different Org User {i}",
-            password="StrongPass123!",
-            organization_id=different_org_id,
-            role=PHARMA_SCIENTIST
-        )
-        user.create(user_in, db=db_session)
+    user.bulk_create([
+        _USER_TEMPLATE.model_copy(update={
+            "email": _rand_email("difforguser"),
+            "full_name": f"Different Org User {i}",
+            "organization_id": different_org_id
+        })
+        for i in range(3)
+    ], db=db_session)
     
     # Call user.get_by_organization with the organization ID
     result = user.get_by_organization(org_id, db=db_session)
@@ -192,46 +242,45 @@ def test_search_users(db_session):
     """Test searching users by email or name."""
     # Create users with specific email patterns and names
     base_email = "searchtest"
-    for i in range(5):
-        user_in = UserCreate(
-            email=f"{base_email}{i}@example.com",
-            full_name=f"Search Test User {i}",
-            password="StrongPass123!",
-            role=PHARMA_SCIENTIST
-        )
-        user.create(user_in, db=db_session)
+    users_in = [
+        _USER_TEMPLATE.model_copy(update={
+            "email": f"{base_email}{i}@example.com",
+            "full_name": f"Search Test User {i}"
+        })
+        for i in range(5)
+    ]
     
     # Create users with different positions of search term
-    user.create(UserCreate(
+    users_in.append(UserCreate(
         email="prefix_searchterm@example.com",
         full_name="Prefix Search Name",
         password="StrongPass123!",
         role=PHARMA_SCIENTIST
-    ), db=db_session)
+    ))
     
-    user.create(UserCreate(
+    users_in.append(UserCreate(
         email="middle_searchterm_suffix@example.com",
         full_name="Middle Search Term Name",
         password="StrongPass123!",
         role=PHARMA_SCIENTIST
-    ), db=db_session)
+    ))
     
-    user.create(UserCreate(
+    users_in.append(UserCreate(
         email="suffix_searchterm@example.com",
         full_name="Suffix Search Name",
         password="StrongPass123!",
         role=PHARMA_SCIENTIST
-    ), db=db_session)
+    ))
     
     # Create users with different email patterns
-    for i in range(3):
-        user_in = UserCreate(
-            email=f"different{i}@example.com",
-            full_name=f"Different User {i}",
-            password="StrongPass123!",
-            role=PHARMA_SCIENTIST
-        )
-        user.create(user_in, db=db_session)
+    users_in.extend(
+        _USER_TEMPLATE.model_copy(update={
+            "email": f"different{i}@example.com",
+            "full_name": f"Different User {i}"
+        })
+        for i in range(3)
+    )
+    user.bulk_create(users_in, db=db_session)
     
     # Search for users with a partial email match
     email_search_result = user.search("searchtest", db=db_session)
@@ -270,52 +319,68 @@ def test_search_users(db_session):
     assert len(no_match_result["items"]) == 0
 
 
-def test_get_users_by_role(db_session):
+# Users visible per role while the users_by_role fixture is active
+ROLE_COUNTS = {
+    SYSTEM_ADMIN: 2,
+    PHARMA_ADMIN: 3,
+    PHARMA_SCIENTIST: 5,
+    CRO_ADMIN: 2
+}
+
+
+@pytest.fixture(scope="module")
+def users_by_role(connection, session_db, test_user):
+    """Create the users for the role tests once per module, in a SAVEPOINT rolled back at module end.
+
+    test_user is the only user committed by a session-wide fixture; it is created before the
+    SAVEPOINT opens and counts towards ROLE_COUNTS for its role.
+    """
+    savepoint = connection.begin_nested()
+    try:
+        # Create users with different roles (SYSTEM_ADMIN, PHARMA_ADMIN, PHARMA_SCIENTIST, CRO_ADMIN)
+        user.bulk_create([
+            _USER_TEMPLATE.model_copy(update={
+                "email": _rand_email(role.lower()),
+                "full_name": f"{role} User {i}",
+                "role": role
+            })
+            for role, count in ROLE_COUNTS.items()
+            for i in range(count - (role == test_user.role))
+        ], db=session_db)
+        yield
+    finally:
+        session_db.rollback()
+        if savepoint.is_active:
+            savepoint.rollback()
+        session_db.expire_all()
+
+
+@pytest.mark.parametrize("role,expected", [*ROLE_COUNTS.items(), ("non_existent_role", 0)])
+def test_get_users_by_role(role, expected, users_by_role, db_session):
     """Test retrieving users by role."""
-    # Create users with different roles (SYSTEM_ADMIN, PHARMA_ADMIN, PHARMA_SCIENTIST, CRO_ADMIN)
-    role_counts = {
-        SYSTEM_ADMIN: 2,
-        PHARMA_ADMIN: 3,
-        PHARMA_SCIENTIST: 5,
-        CRO_ADMIN: 2
-    }
-    
-    for role, count in role_counts.items():
-        for i in range(count):
-            user_in = UserCreate(
-                email=f"{role.lower()}{i}_{random.randint(1000, 9999)}@example.com",
-                full_name=f"{role} User {i}",
-                password="StrongPass123!",
-                role=role
-            )
-            user.create(user_in, db=db_session)
-    
-    # Call user.get_by_role with each role
-    for role, count in role_counts.items():
-        result = user.get_by_role(role, db=db_session)
-        assert result["total"] == count
-        assert len(result["items"]) == count
-        for user_item in result["items"]:
-            assert user_item.role == role
-    
+    # Call user.get_by_role with the role
+    result = user.get_by_role(role, db=db_session)
+    assert result["total"] == expected
+    assert len(result["items"]) == expected
+    for user_item in result["items"]:
+        assert user_item.role == role
+
+
+def test_get_users_by_role_pagination(users_by_role, db_session):
+    """Test paginating users retrieved by role."""
     # Verify pagination works correctly
     paged_result = user.get_by_role(PHARMA_SCIENTIST, db=db_session, skip=2, limit=2)
-    assert paged_result["total"] == 5
+    assert paged_result["total"] == ROLE_COUNTS[PHARMA_SCIENTIST]
     assert len(paged_result["items"]) == 2
     assert paged_result["page"] == 2
     assert paged_result["pages"] == 3
-    
-    # Call with a non-existent role
-    non_existent_role_result = user.get_by_role("non_existent_role", db=db_session)
-    assert non_existent_role_result["total"] == 0
-    assert len(non_existent_role_result["items"]) == 0
 
 
 def test_is_active_superuser(db_session):
     """Test checking if a user is active and/or a superuser."""
     # Create a regular active user
     regular_user_in = UserCreate(
-        email=f"regular_{random.randint(1000, 9999)}@example.com",
+        email=_rand_email("regular_"),
         full_name="Regular User",
         password="StrongPass123!",
         role=PHARMA_SCIENTIST,
@@ -330,16 +395,13 @@ def test_is_active_superuser(db_session):
     
     # Create a superuser
     superuser_in = UserCreate(
-        email=f"super_{random.randint(1000, 9999)}@example.com",
+        email=_rand_email("super_"),
         full_name="Superuser",
         password="StrongPass123!",
         role=SYSTEM_ADMIN
     )
     superuser = user.create(superuser_in, db=db_session)
-    superuser.is_superuser = True
-    db_session.add(superuser)
-    db_session.commit()
-    db_session.refresh(superuser)
+    user.set_flags(superuser, is_superuser=True, db=db_session)
     
     # Assert that user.is_active returns True
     assert user.is_active(superuser) is True
@@ -349,16 +411,13 @@ def test_is_active_superuser(db_session):
     
     # Create an inactive user
     inactive_user_in = UserCreate(
-        email=f"inactive_{random.randint(1000, 9999)}@example.com",
+        email=_rand_email("inactive_"),
         full_name="Inactive User",
         password="StrongPass123!",
         role=PHARMA_SCIENTIST,
     )
     inactive_user = user.create(inactive_user_in, db=db_session)
-    inactive_user.is_active = False
-    db_session.add(inactive_user)
-    db_session.commit()
-    db_session.refresh(inactive_user)
+    user.set_flags(inactive_user, is_active=False, db=db_session)
     
     # Assert that user.is_active returns False
     assert user.is_active(inactive_user) is False
\ No newline at end of file
@@ -6,15 +6,27 @@ with the external AI prediction service.
 """
 
 import pytest
+import io
 import json
 import uuid
-from unittest.mock import patch, MagicMock, Mock
+from dataclasses import dataclass, field
+from typing import Optional
+from unittest.mock import patch, MagicMock, Mock, AsyncMock
 
+import httpx
+import orjson
 import requests
 import pybreaker
-from requests.exceptions import ConnectionError, Timeout
+from requests.exceptions import ConnectionError
 
-from app.integrations.ai_engine.client import AIEngineClient
+from app.integrations.ai_engine.client import (
+    AIEngineClient,
+    predictions_circuit_breaker,
+    async_predictions_circuit_breaker,
+    DEFAULT_RETRIES,
+    MAX_SMILES_LENGTH
+)
+from app.integrations.ai_engine.chaos import ChaosMiddleware, ChaosRule
 from app.integrations.ai_engine.models import (
     PredictionRequest,
     PredictionResponse,
@@ -27,21 +39,39 @@ from app.integrations.ai_engine.exceptions import (
     AIEngineConnectionError,
     AIEngineTimeoutError,
     AIEngineResponseError,
+    AIServiceUnavailableError,
     BatchSizeExceededError,
-    UnsupportedPropertyError
+    UnsupportedPropertyError,
+    InvalidPredictionParametersError
 )
 from app.constants.molecule_properties import PREDICTABLE_PROPERTIES
 
 
+@dataclass(slots=True)
 class MockResponse:
     """Mock HTTP response for testing API interactions."""
     
-    def __init__(self, status_code, json_data):
-        """Initialize mock response with status code and data."""
-        self.status_code = status_code
-        self.json_data = json_data
-        self.ok = 200 <= status_code < 300
-        self.text = json.dumps(json_data)
+    status_code: int
+    json_data: dict
+    headers: dict = field(default_factory=dict)
+    ok: bool = field(init=False)
+    _text: Optional[str] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        """Derive the ok flag from the status code."""
+        self.ok = 200 <= self.status_code < 300
+    
+    @property
+    def text(self):
+        """Serialized body, only computed for tests that read it."""
+        if self._text is None:
+            self._text = json.dumps(self.json_data)
+        return self._text
+    
+    @property
+    def raw(self):
+        """Body as a fresh file-like stream, as read from streamed responses."""
+        return io.BytesIO(self.text.encode())
     
     def json(self):
         """Mock json method to return the json_data."""
@@ -51,6 +81,20 @@ class MockResponse:
         """Mock raise_for_status method to raise HTTPError for non-2xx status codes."""
         if not self.ok:
             raise requests.HTTPError(f"HTTP Error: {self.status_code}")
+    
+    def close(self):
+        """Mock close method; there is no connection to release."""
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    AI Engine client shared by the synchronous tests in this module.
+    
+    Async tests and tests that change client state build their own client, as its
+    asyncio primitives and pooled async connections are tied to one event loop.
+    """
+    return AIEngineClient()
 
 
 def test_ai_engine_client_init():
@@ -61,6 +105,15 @@ def test_ai_engine_client_init():
     assert client.api_key == "test-api-key"  # Default from settings
     assert client.timeout == 30  # Default timeout
     assert client.max_retries == 3  # Default retries
+    assert client.max_concurrency == 32  # Default bulkhead size
+    assert client._bulkhead._value == 32
+    
+    # Verify both schemes share the keep-alive connection pool
+    adapter = client.session.get_adapter("https://ai-engine-api.example.com")
+    assert adapter is client.session.get_adapter("http://ai-engine-api.example.com")
+    assert adapter._pool_connections == 32
+    assert adapter._pool_maxsize == 64
+    assert adapter.max_retries.total == 0
     
     # Test with custom parameters
     custom_client = AIEngineClient(
@@ -68,13 +121,15 @@ def test_ai_engine_client_init():
         api_key="custom-key",
         timeout=60,
         max_retries=5,
-        retry_backoff_factor=1.0
+        retry_backoff_factor=1.0,
+        max_concurrency=8
     )
     assert custom_client.api_url == "https://custom-api.example.com"
     assert custom_client.api_key == "custom-key"
     assert custom_client.timeout == 60
     assert custom_client.max_retries == 5
     assert custom_client.retry_backoff_factor == 1.0
+    assert custom_client._bulkhead._value == 8
     
     # Verify session headers
     assert custom_client.session.headers["Content-Type"] == "application/json"
@@ -83,7 +138,7 @@ def test_ai_engine_client_init():
 
 
 @patch('requests.Session.post')
-def test_predict_properties_success(mock_post):
+def test_predict_properties_success(mock_post, client):
     """Tests successful property prediction request and response."""
     # Mock successful response
     mock_response = MockResponse(200, {
@@ -94,8 +149,7 @@ def test_predict_properties_success(mock_post):
     })
     mock_post.return_value = mock_response
     
-    # Create client and request
-    client = AIEngineClient()
+    # Create request
     request = PredictionRequest(
         smiles=["CC(C)CCO", "c1ccccc1"],
         properties=["logp", "solubility"]
@@ -108,7 +162,7 @@ def test_predict_properties_success(mock_post):
     mock_post.assert_called_once()
     args, kwargs = mock_post.call_args
     assert kwargs["url"] == "http://ai-engine-api.example.com/predictions"
-    assert kwargs["json"] == request.dict()
+    assert orjson.loads(kwargs["data"]) == request.model_dump(mode="json")
     
     # Verify response parsing
     assert isinstance(response, PredictionResponse)
@@ -118,10 +172,8 @@ def test_predict_properties_success(mock_post):
     assert response.model_version == "v1.0"
 
 
-def test_predict_properties_invalid_property():
+def test_predict_properties_invalid_property(client):
     """Tests error handling when invalid property is requested."""
-    client = AIEngineClient()
-    
     # Create request with invalid property
     request = PredictionRequest(
         smiles=["CC(C)CCO"],
@@ -136,10 +188,8 @@ def test_predict_properties_invalid_property():
     assert "invalid_property" in str(excinfo.value)
 
 
-def test_predict_properties_batch_size_exceeded():
+def test_predict_properties_batch_size_exceeded(client):
     """Tests error handling when batch size exceeds maximum."""
-    client = AIEngineClient()
-    
     # Create request with too many SMILES
     smiles_list = ["CC(C)CCO"] * (MAX_BATCH_SIZE + 1)
     request = PredictionRequest(
@@ -156,80 +206,203 @@ def test_predict_properties_batch_size_exceeded():
     assert str(len(smiles_list)) in str(excinfo.value)
 
 
-@patch('requests.Session.post')
-def test_predict_properties_connection_error(mock_post):
-    """Tests error handling when connection to AI engine fails."""
-    # Mock connection error
-    mock_post.side_effect = ConnectionError("Connection failed")
-    
-    # Create client and request
-    client = AIEngineClient()
+def test_predict_properties_smiles_too_long(client):
+    """Tests that over-long SMILES are rejected before any request is sent."""
     request = PredictionRequest(
-        smiles=["CC(C)CCO"],
+        smiles=["CC(C)CCO", "C" * (MAX_SMILES_LENGTH + 1)],
         properties=["logp"]
     )
     
-    # Expect AIEngineConnectionError
-    with pytest.raises(AIEngineConnectionError) as excinfo:
-        client.predict_properties(request)
+    with patch('requests.Session.request') as mock_request:
+        with pytest.raises(InvalidPredictionParametersError):
+            client.predict_properties(request)
     
-    # Verify retry mechanism is attempted the correct number of times
-    assert mock_post.call_count == client.max_retries + 1  # Initial attempt + retries
-    assert "failed to connect" in str(excinfo.value).lower()
+    mock_request.assert_not_called()
 
 
-@patch('requests.Session.post')
-def test_predict_properties_timeout_error(mock_post):
-    """Tests error handling when request to AI engine times out."""
-    # Mock timeout error
-    mock_post.side_effect = Timeout("Request timed out")
+# Fault injected on every attempt, the error it surfaces as, and the attempts made
+CHAOS_FAULTS = {
+    "connection": (ChaosRule(p_connection=1.0, seed=42), AIEngineConnectionError, DEFAULT_RETRIES + 1),
+    "timeout": (ChaosRule(p_timeout=1.0, seed=42), AIEngineTimeoutError, 1),
+    "5xx": (ChaosRule(p_5xx=1.0, seed=42), AIServiceUnavailableError, DEFAULT_RETRIES + 1),
+    "429": (ChaosRule(p_429=1.0, seed=42), AIEngineResponseError, DEFAULT_RETRIES + 1),
+    "malformed": (ChaosRule(p_malformed=1.0, seed=42), AIEngineResponseError, 1),
+}
+
+
+@pytest.mark.parametrize("fault", list(CHAOS_FAULTS))
+def test_predict_properties_fault(fault):
+    """Tests retries and error handling for each fault the AI engine can exhibit."""
+    rule, expected_error, expected_attempts = CHAOS_FAULTS[fault]
+    predictions_circuit_breaker.close()
     
-    # Create client and request
     client = AIEngineClient()
+    chaos = ChaosMiddleware(rule).install(client.session)
     request = PredictionRequest(
         smiles=["CC(C)CCO"],
         properties=["logp"]
     )
     
-    # Expect AIEngineTimeoutError
-    with pytest.raises(AIEngineTimeoutError) as excinfo:
+    with pytest.raises(expected_error):
         client.predict_properties(request)
     
-    # Verify error message contains timeout information
-    assert "timed out" in str(excinfo.value).lower()
-    assert mock_post.call_count == 1  # No retries for timeout
+    # Only connection errors and transient statuses are retried
+    assert chaos.injected == {fault: expected_attempts}
 
 
-@patch('requests.Session.post')
-def test_predict_properties_response_error(mock_post):
-    """Tests error handling when AI engine returns error response."""
-    # Mock error response
-    error_response = MockResponse(400, {
-        "message": "Invalid SMILES notation",
-        "details": {"invalid_smiles": ["CC(C"]},
-        "error_code": "validation_error"
+def test_chaos_rule_is_deterministic():
+    """Tests that the same rule and seed inject the same sequence of faults."""
+    rule = ChaosRule(p_timeout=0.2, p_5xx=0.1, seed=42)
+    
+    sequences = []
+    for _ in range(2):
+        chaos = ChaosMiddleware(rule)
+        sequences.append([chaos._choose_fault() for _ in range(50)])
+    
+    assert sequences[0] == sequences[1]
+    assert {"timeout", "5xx", None} >= set(sequences[0])
+
+
+@patch('requests.Session.request')
+def test_client_error_not_counted_by_circuit_breaker(mock_request, client):
+    """Tests that 4xx responses are neither retried nor counted as AI engine failures."""
+    mock_request.return_value = MockResponse(400, {"message": "Invalid SMILES notation"})
+    predictions_circuit_breaker.close()
+    
+    request = PredictionRequest(smiles=["CC(C"], properties=["logp"])
+    
+    with pytest.raises(AIEngineException):
+        client.predict_properties(request)
+    
+    assert mock_request.call_count == 1
+    assert predictions_circuit_breaker.fail_counter == 0
+
+
+@patch('time.sleep')
+@patch('requests.Session.request')
+def test_predict_properties_retries_transient_status(mock_request, mock_sleep, client):
+    """Tests that 503 responses are retried until the AI engine recovers."""
+    mock_request.side_effect = [
+        MockResponse(503, {"message": "Service unavailable"}),
+        MockResponse(200, {
+            "job_id": "123e4567-e89b-12d3-a456-426614174000",
+            "status": "queued"
+        })
+    ]
+    
+    request = PredictionRequest(smiles=["CC(C)CCO"], properties=["logp"])
+    response = client.predict_properties(request)
+    
+    assert mock_request.call_count == 2
+    assert mock_sleep.call_count == 1
+    assert response.job_id == "123e4567-e89b-12d3-a456-426614174000"
+
+
+@patch('random.uniform', side_effect=lambda low, high: high / 2)
+@patch('time.sleep')
+@patch('requests.Session.request')
+def test_retry_backoff_full_jitter(mock_request, mock_sleep, mock_uniform):
+    """Tests that retry delays are drawn from an exponentially growing, capped range."""
+    mock_request.side_effect = ConnectionError("Connection failed")
+    
+    client = AIEngineClient(max_retries=8, retry_backoff_factor=1.0)
+    request = PredictionRequest(smiles=["CC(C)CCO"], properties=["logp"])
+    
+    with pytest.raises(AIEngineConnectionError):
+        client.predict_properties(request)
+    
+    # Each delay is drawn from [0, min(64, 2 ** attempt)]
+    ceilings = [1, 2, 4, 8, 16, 32, 64, 64]
+    assert [c.args for c in mock_uniform.call_args_list] == [(0, ceiling) for ceiling in ceilings]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [ceiling / 2 for ceiling in ceilings]
+
+
+@pytest.mark.asyncio
+@patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+async def test_predict_properties_async_success(mock_request):
+    """Tests submitting a prediction request over the async HTTP client."""
+    mock_request.return_value = MockResponse(200, {
+        "job_id": "123e4567-e89b-12d3-a456-426614174000",
+        "status": "queued",
+        "model_name": "molecule_property_predictor",
+        "model_version": "v1.0"
     })
-    mock_post.return_value = error_response
     
-    # Create client and request
     client = AIEngineClient()
     request = PredictionRequest(
-        smiles=["CC(C"],  # Invalid SMILES
+        smiles=["CC(C)CCO", "c1ccccc1"],
+        properties=["logp", "solubility"]
+    )
+    try:
+        response = await client.predict_properties_async(request)
+        session = client.async_session
+        await client.predict_properties_async(request)
+        
+        # Verify the same pooled client serves subsequent calls
+        assert client.async_session is session
+    finally:
+        await client.aclose()
+    
+    assert mock_request.call_count == 2
+    args, kwargs = mock_request.call_args
+    assert kwargs["method"] == "POST"
+    assert kwargs["url"] == "http://ai-engine-api.example.com/predictions"
+    assert orjson.loads(kwargs["content"]) == request.model_dump(mode="json")
+    assert isinstance(response, PredictionResponse)
+    assert response.job_id == "123e4567-e89b-12d3-a456-426614174000"
+
+
+@pytest.mark.asyncio
+@patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+async def test_predict_properties_async_connection_error(mock_request):
+    """Tests retries and error handling when the async connection to the AI engine fails."""
+    mock_request.side_effect = httpx.ConnectError("Connection failed")
+    
+    client = AIEngineClient()
+    request = PredictionRequest(
+        smiles=["CC(C)CCO"],
         properties=["logp"]
     )
     
-    # Expect AIEngineResponseError
-    with pytest.raises(AIEngineResponseError) as excinfo:
-        client.predict_properties(request)
+    with pytest.raises(AIEngineConnectionError) as excinfo:
+        await client.predict_properties_async(request)
     
-    # Verify error message contains response status code
-    assert mock_post.call_count == 1
-    assert "400" in str(excinfo.value)
-    assert "Invalid SMILES notation" in str(excinfo.value)
+    assert mock_request.call_count == client.max_retries + 1  # Initial attempt + retries
+    assert "failed to connect" in str(excinfo.value).lower()
+
+
+@pytest.mark.asyncio
+@patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+async def test_rate_limit_from_response_headers(mock_request):
+    """Tests that the per-host rate limiter follows the lowest advertised limit."""
+    job = {
+        "job_id": "123e4567-e89b-12d3-a456-426614174000",
+        "status": "queued",
+        "model_name": "molecule_property_predictor",
+        "model_version": "v1.0"
+    }
+    client = AIEngineClient()
+    request = PredictionRequest(smiles=["CC(C)CCO"], properties=["logp"])
+    host = "ai-engine-api.example.com"
+    try:
+        mock_request.return_value = MockResponse(200, job, headers={"X-RateLimit-Limit": "100"})
+        await client.predict_properties_async(request)
+        assert client._limiters[host].max_rate == 95  # 5% headroom below the limit
+        
+        # A higher advertised limit keeps the existing limiter
+        mock_request.return_value = MockResponse(200, job, headers={"X-RateLimit-Limit": "200"})
+        await client.predict_properties_async(request)
+        assert client._limiters[host].max_rate == 95
+        
+        mock_request.return_value = MockResponse(200, job, headers={"X-RateLimit-Limit": "20"})
+        await client.predict_properties_async(request)
+        assert client._limiters[host].max_rate == 19
+    finally:
+        await client.aclose()
 
 
 @patch('requests.Session.get')
-def test_get_prediction_status(mock_get):
+def test_get_prediction_status(mock_get, client):
     """Tests retrieving prediction job status."""
     # Mock successful response
     mock_response = MockResponse(200, {
@@ -242,8 +415,7 @@ def test_get_prediction_status(mock_get):
     })
     mock_get.return_value = mock_response
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     job_id = "123e4567-e89b-12d3-a456-426614174000"
     status = client.get_prediction_status(job_id)
     
@@ -263,7 +435,7 @@ def test_get_prediction_status(mock_get):
 
 
 @patch('requests.Session.get')
-def test_get_prediction_results(mock_get):
+def test_get_prediction_results(mock_get, client):
     """Tests retrieving prediction results."""
     # Mock successful response
     mock_response = MockResponse(200, {
@@ -306,8 +478,7 @@ def test_get_prediction_results(mock_get):
     })
     mock_get.return_value = mock_response
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     job_id = "123e4567-e89b-12d3-a456-426614174000"
     results = client.get_prediction_results(job_id)
     
@@ -333,9 +504,40 @@ def test_get_prediction_results(mock_get):
     assert results.results[1].properties["solubility"]["units"] == "mg/mL"
 
 
+@patch('requests.Session.request')
+def test_get_prediction_results_streaming(mock_request, client):
+    """Tests that large result sets are parsed from the streamed body, not response.json()."""
+    job_id = "123e4567-e89b-12d3-a456-426614174000"
+    molecule_count = 2000
+    payload = {
+        "job_id": job_id,
+        "status": "completed",
+        "results": [
+            {
+                "smiles": "C" * (i % 50 + 1),
+                "properties": {"logp": {"value": i / 10, "confidence": 0.9, "units": None}}
+            }
+            for i in range(molecule_count)
+        ],
+        "metadata": {"elapsed_seconds": 12.5}
+    }
+    mock_response = MockResponse(200, payload)
+    mock_request.return_value = mock_response
+    
+    with patch.object(MockResponse, 'json', side_effect=AssertionError("body was buffered")):
+        results = client.get_prediction_results(job_id)
+    
+    assert mock_request.call_args.kwargs["stream"] is True
+    assert results.job_id == job_id
+    assert results.metadata == {"elapsed_seconds": 12.5}
+    assert len(results.results) == molecule_count
+    assert results.results[-1].smiles == "C" * ((molecule_count - 1) % 50 + 1)
+    assert results.results[-1].properties["logp"]["value"] == pytest.approx(199.9)
+
+
 @patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_status')
 @patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_results')
-def test_wait_for_prediction_completion_success(mock_get_results, mock_get_status):
+def test_wait_for_prediction_completion_success(mock_get_results, mock_get_status, client):
     """Tests waiting for prediction job to complete successfully."""
     # Mock get_prediction_status to return 'completed' status after a few calls
     job_id = "123e4567-e89b-12d3-a456-426614174000"
@@ -378,8 +580,7 @@ def test_wait_for_prediction_completion_success(mock_get_results, mock_get_statu
     )
     mock_get_results.return_value = mock_results
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     results = client.wait_for_prediction_completion(
         job_id=job_id,
         max_wait_time=30,
@@ -397,7 +598,7 @@ def test_wait_for_prediction_completion_success(mock_get_results, mock_get_statu
 
 
 @patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_status')
-def test_wait_for_prediction_completion_failure(mock_get_status):
+def test_wait_for_prediction_completion_failure(mock_get_status, client):
     """Tests waiting for prediction job that fails."""
     # Mock get_prediction_status to return 'failed' status after a few calls
     job_id = "123e4567-e89b-12d3-a456-426614174000"
@@ -420,9 +621,6 @@ def test_wait_for_prediction_completion_failure(mock_get_status):
     # First return processing status, then failed
     mock_get_status.side_effect = [processing_status, failed_status]
     
-    # Create client and call method
-    client = AIEngineClient()
-    
     # Expect AIEngineException when job fails
     with pytest.raises(AIEngineException) as excinfo:
         client.wait_for_prediction_completion(
@@ -437,8 +635,7 @@ def test_wait_for_prediction_completion_failure(mock_get_status):
 
 
 @patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_status')
-@patch('time.sleep')
-def test_wait_for_prediction_completion_timeout(mock_sleep, mock_get_status):
+def test_wait_for_prediction_completion_timeout(mock_get_status, client):
     """Tests timeout while waiting for prediction job."""
     # Mock get_prediction_status to always return 'processing' status
     job_id = "123e4567-e89b-12d3-a456-426614174000"
@@ -453,9 +650,6 @@ def test_wait_for_prediction_completion_timeout(mock_sleep, mock_get_status):
     # Always return processing to trigger timeout
     mock_get_status.return_value = processing_status
     
-    # Create client and call method
-    client = AIEngineClient()
-    
     # Expect AIEngineTimeoutError when max wait time is exceeded
     with pytest.raises(AIEngineTimeoutError) as excinfo:
         client.wait_for_prediction_completion(
@@ -470,8 +664,111 @@ def test_wait_for_prediction_completion_timeout(mock_sleep, mock_get_status):
     assert "5 seconds" in str(excinfo.value)
 
 
+@pytest.mark.asyncio
+@patch('asyncio.sleep', new_callable=AsyncMock)
+@patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_status_async', new_callable=AsyncMock)
+@patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_results_async', new_callable=AsyncMock)
+async def test_wait_for_prediction_completion_async_success(mock_get_results, mock_get_status, mock_sleep):
+    """Tests awaiting a prediction job that completes, with backoff between polls."""
+    job_id = "123e4567-e89b-12d3-a456-426614174000"
+    processing_status = PredictionJobStatus(
+        job_id=job_id,
+        status="processing",
+        total_molecules=10,
+        completed_molecules=5
+    )
+    completed_status = PredictionJobStatus(
+        job_id=job_id,
+        status="completed",
+        total_molecules=10,
+        completed_molecules=10
+    )
+    mock_get_status.side_effect = [processing_status, processing_status, completed_status]
+    mock_results = PredictionResponse(
+        job_id=job_id,
+        status="completed",
+        model_name="molecule_property_predictor",
+        model_version="v1.0"
+    )
+    mock_get_results.return_value = mock_results
+    
+    client = AIEngineClient()
+    results = await client.wait_for_prediction_completion_async(job_id=job_id, max_wait_time=30)
+    
+    # Verify the job was polled until completion and the results fetched once
+    assert mock_get_status.await_count == 3
+    mock_get_results.assert_awaited_once_with(job_id)
+    assert results == mock_results
+    
+    # Verify the delays grow exponentially, each with up to one second of jitter
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert len(delays) == 2
+    assert 1 <= delays[0] <= 2
+    assert 2 <= delays[1] <= 3
+
+
+@pytest.mark.asyncio
+@patch('asyncio.sleep', new_callable=AsyncMock)
+@patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_status_async', new_callable=AsyncMock)
+async def test_wait_for_prediction_completion_async_timeout(mock_get_status, mock_sleep):
+    """Tests timeout while awaiting a prediction job."""
+    job_id = "123e4567-e89b-12d3-a456-426614174000"
+    mock_get_status.return_value = PredictionJobStatus(
+        job_id=job_id,
+        status="processing",
+        total_molecules=10,
+        completed_molecules=5
+    )
+    
+    client = AIEngineClient()
+    with pytest.raises(AIEngineTimeoutError) as excinfo:
+        await client.wait_for_prediction_completion_async(job_id=job_id, max_wait_time=5)
+    
+    # Verify the total backoff never exceeds the maximum wait time
+    assert sum(call.args[0] for call in mock_sleep.await_args_list) == pytest.approx(5)
+    assert "did not complete" in str(excinfo.value)
+    assert "5 seconds" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+@patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_status_async', new_callable=AsyncMock)
+@patch('app.integrations.ai_engine.client.AIEngineClient.get_prediction_results_async', new_callable=AsyncMock)
+async def test_wait_for_all_completion(mock_get_results, mock_get_status):
+    """Tests awaiting several prediction jobs at once, with results in job order."""
+    job_ids = [str(uuid.uuid4()) for _ in range(3)]
+    statuses = {
+        job_ids[0]: iter(["processing", "processing", "completed"]),
+        job_ids[1]: iter(["completed"]),
+        job_ids[2]: iter(["processing", "failed"])
+    }
+    
+    def next_status(job_id):
+        return PredictionJobStatus(
+            job_id=job_id,
+            status=next(statuses[job_id]),
+            total_molecules=10,
+            completed_molecules=5
+        )
+    
+    mock_get_status.side_effect = next_status
+    mock_get_results.side_effect = lambda job_id: PredictionResponse(
+        job_id=job_id,
+        status="completed",
+        model_name="molecule_property_predictor",
+        model_version="v1.0"
+    )
+    
+    client = AIEngineClient()
+    results = await client.wait_for_all(job_ids, max_wait_time=30, max_concurrency=2)
+    
+    assert [result.job_id for result in results[:2]] == job_ids[:2]
+    assert isinstance(results[2], AIEngineException)
+    assert job_ids[2] in str(results[2])
+    assert mock_get_results.await_count == 2
+
+
 @patch('requests.Session.post')
-def test_submit_batch_prediction(mock_post):
+def test_submit_batch_prediction(mock_post, client):
     """Tests submitting batch prediction request."""
     # Mock successful response
     mock_response = MockResponse(200, {
@@ -483,8 +780,7 @@ def test_submit_batch_prediction(mock_post):
     })
     mock_post.return_value = mock_response
     
-    # Create client and request
-    client = AIEngineClient()
+    # Create request
     molecule_ids = [uuid.uuid4() for _ in range(5)]
     request = BatchPredictionRequest(
         molecule_ids=molecule_ids,
@@ -498,7 +794,7 @@ def test_submit_batch_prediction(mock_post):
     mock_post.assert_called_once()
     args, kwargs = mock_post.call_args
     assert kwargs["url"] == "http://ai-engine-api.example.com/predictions/batch"
-    assert kwargs["json"] == request.dict()
+    assert orjson.loads(kwargs["data"]) == request.model_dump(mode="json")
     
     # Verify response is parsed correctly into BatchPredictionResponse object
     assert response.batch_id == "123e4567-e89b-12d3-a456-426614174000"
@@ -509,7 +805,7 @@ def test_submit_batch_prediction(mock_post):
 
 
 @patch('requests.Session.get')
-def test_get_batch_prediction_status(mock_get):
+def test_get_batch_prediction_status(mock_get, client):
     """Tests retrieving batch prediction status."""
     # Mock successful response with batch status
     batch_id = "123e4567-e89b-12d3-a456-426614174000"
@@ -526,8 +822,7 @@ def test_get_batch_prediction_status(mock_get):
     })
     mock_get.return_value = mock_response
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     status = client.get_batch_prediction_status(batch_id)
     
     # Verify request was made with correct URL and parameters
@@ -545,7 +840,7 @@ def test_get_batch_prediction_status(mock_get):
 
 
 @patch('requests.Session.get')
-def test_get_available_models(mock_get):
+def test_get_available_models(mock_get, client):
     """Tests retrieving available AI models."""
     # Mock successful response with available models
     mock_response = MockResponse(200, {
@@ -566,8 +861,7 @@ def test_get_available_models(mock_get):
     })
     mock_get.return_value = mock_response
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     models = client.get_available_models()
     
     # Verify request was made with correct URL
@@ -586,7 +880,7 @@ def test_get_available_models(mock_get):
 
 
 @patch('requests.Session.get')
-def test_get_model_info(mock_get):
+def test_get_model_info(mock_get, client):
     """Tests retrieving specific model information."""
     # Mock successful response with model details
     model_name = "molecule_property_predictor"
@@ -604,8 +898,7 @@ def test_get_model_info(mock_get):
     })
     mock_get.return_value = mock_response
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     model_info = client.get_model_info(model_name, model_version)
     
     # Verify request was made with correct URL including model name and version
@@ -623,14 +916,13 @@ def test_get_model_info(mock_get):
 
 
 @patch('requests.Session.get')
-def test_health_check_success(mock_get):
+def test_health_check_success(mock_get, client):
     """Tests successful health check of AI engine."""
     # Mock successful response with 200 status code
     mock_response = MockResponse(200, {"status": "healthy"})
     mock_get.return_value = mock_response
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     health_status = client.health_check()
     
     # Verify request was made with correct URL
@@ -643,14 +935,13 @@ def test_health_check_success(mock_get):
 
 
 @patch('requests.Session.get')
-def test_health_check_failure(mock_get):
+def test_health_check_failure(mock_get, client):
     """Tests failed health check of AI engine."""
     # Mock failed response with non-200 status code
     mock_response = MockResponse(503, {"status": "unhealthy", "message": "Database connection issue"})
     mock_get.return_value = mock_response
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     health_status = client.health_check()
     
     # Verify request was made with correct URL
@@ -663,13 +954,12 @@ def test_health_check_failure(mock_get):
 
 
 @patch('requests.Session.get')
-def test_health_check_exception(mock_get):
+def test_health_check_exception(mock_get, client):
     """Tests health check when exception occurs."""
     # Mock requests.get to raise an exception
     mock_get.side_effect = ConnectionError("Connection failed")
     
-    # Create client and call method
-    client = AIEngineClient()
+    # Call method
     health_status = client.health_check()
     
     # Verify health_check catches exception and returns False
@@ -678,10 +968,9 @@ def test_health_check_exception(mock_get):
 
 @patch('requests.Session.post')
 @patch('pybreaker.CircuitBreaker.call')
-def test_circuit_breaker_functionality(mock_circuit_breaker, mock_post):
+def test_circuit_breaker_functionality(mock_circuit_breaker, mock_post, client):
     """Tests circuit breaker pattern implementation."""
     # Mock circuit breaker to track calls and failures
-    client = AIEngineClient()
     request = PredictionRequest(
         smiles=["CC(C)CCO"],
         properties=["logp"]
@@ -712,4 +1001,60 @@ def test_circuit_breaker_functionality(mock_circuit_breaker, mock_post):
     with pytest.raises(pybreaker.CircuitBreakerError) as excinfo:
         client.predict_properties(request)
     
-    assert "Circuit breaker open" in str(excinfo.value)
\ No newline at end of file
+    assert "Circuit breaker open" in str(excinfo.value)
+
+
+@patch('requests.Session.request')
+def test_circuit_breaker_isolation(mock_request, client):
+    """Tests that an open predictions breaker leaves model lookups and health checks working."""
+    predictions_circuit_breaker.open()
+    try:
+        request = PredictionRequest(smiles=["CC(C)CCO"], properties=["logp"])
+        with pytest.raises(pybreaker.CircuitBreakerError):
+            client.predict_properties(request)
+        mock_request.assert_not_called()
+        
+        mock_request.return_value = MockResponse(200, {"status": "healthy"})
+        assert client.health_check() is True
+        
+        mock_request.return_value = MockResponse(200, {"models": []})
+        assert client.get_available_models() == []
+    finally:
+        predictions_circuit_breaker.close()
+
+
+@pytest.mark.asyncio
+@patch('httpx.AsyncClient.request', new_callable=AsyncMock)
+async def test_async_circuit_breaker_functionality(mock_request):
+    """Tests that the async breaker opens after repeated failures and recovers after a trial call."""
+    mock_request.side_effect = httpx.ConnectError("Connection failed")
+    breaker = async_predictions_circuit_breaker
+    breaker.close()
+    
+    client = AIEngineClient(max_retries=0)
+    request = PredictionRequest(smiles=["CC(C)CCO"], properties=["logp"])
+    try:
+        for _ in range(breaker.fail_max):
+            with pytest.raises(AIEngineConnectionError):
+                await client.predict_properties_async(request)
+        assert breaker.current_state == "open"
+        
+        # Calls are rejected without reaching the AI engine while the breaker is open
+        with pytest.raises(pybreaker.CircuitBreakerError):
+            await client.predict_properties_async(request)
+        assert mock_request.call_count == breaker.fail_max
+        
+        # Once reset_timeout has passed, a successful trial call closes the breaker again
+        mock_request.side_effect = None
+        mock_request.return_value = MockResponse(200, {
+            "job_id": "123e4567-e89b-12d3-a456-426614174000",
+            "status": "queued"
+        })
+        breaker._opened_at -= breaker.reset_timeout
+        response = await client.predict_properties_async(request)
+        assert response.job_id == "123e4567-e89b-12d3-a456-426614174000"
+        assert breaker.current_state == "closed"
+    finally:
+        breaker.close()
+        await client.aclose()
+
@@ -9,11 +9,12 @@ with appropriate mocking of AWS services.
 import pytest
 import unittest.mock as mock
 import io
-import os
-import tempfile
 import uuid
+from types import SimpleNamespace
+import boto3
 from botocore.exceptions import ClientError
 
+from ...app.integrations.aws import s3 as s3_module
 from ...app.integrations.aws.s3 import (
     S3Client,
     upload_file,
@@ -29,409 +30,344 @@ from ...app.integrations.aws.s3 import (
 )
 from ...app.core.exceptions import IntegrationException
 from ...app.constants.error_messages import INTEGRATION_ERRORS
-from ...app.core.config import settings
+
+# Stand-in for the settings the S3 module reads, so tests do not depend on the environment
+FAKE_SETTINGS = SimpleNamespace(
+    S3_BUCKET_NAME='default-bucket',
+    AWS_REGION='us-east-1',
+    AWS_ACCESS_KEY_ID='testing',
+    AWS_SECRET_ACCESS_KEY='testing'
+)
+
+# Keyword arguments every S3 operation passes to boto3.client
+EXPECTED_CLIENT_KWARGS = dict(
+    region_name=FAKE_SETTINGS.AWS_REGION,
+    aws_access_key_id=FAKE_SETTINGS.AWS_ACCESS_KEY_ID,
+    aws_secret_access_key=FAKE_SETTINGS.AWS_SECRET_ACCESS_KEY
+)
+
+# Local path handed to upload_file; the mocked S3 client never opens it
+UPLOAD_FILE_PATH = '/nonexistent/test_upload.txt'
+
+# Object content used by the upload and download tests
+TEST_CONTENT = b'test content'
+
+# Buffer over TEST_CONTENT for tests whose mocks never read or write it; seek(0) before use
+TEST_CONTENT_BUF = io.BytesIO(TEST_CONTENT)
+
+# UUID the key generation test pins uuid4 to
+FIXED_UUID = uuid.UUID('12345678-1234-5678-1234-567812345678')
+
+# Presigned URL returned by the mocked S3 client and operations
+PRESIGNED_URL = 'https://test-bucket.s3.amazonaws.com/test/file.txt?signature=abc123'
+
+# Object metadata returned by the mocked S3 client and operations
+OBJECT_METADATA = {
+    'ContentLength': 12,
+    'ContentType': 'text/plain',
+    'Metadata': {'custom-key': 'custom-value'}
+}
+
+
+@pytest.fixture(scope='module', autouse=True)
+def fake_settings():
+    """Replace the settings the S3 module reads with FAKE_SETTINGS for the whole module"""
+    with mock.patch.object(s3_module, 'settings', FAKE_SETTINGS):
+        yield FAKE_SETTINGS
+
+
+@pytest.fixture(scope='module')
+def s3_spec():
+    """Autospec of a real S3 client, built once per module since it introspects every method"""
+    # botocore only constructs the client here; nothing is sent to AWS
+    real_s3 = boto3.client('s3', **EXPECTED_CLIENT_KWARGS)
+    return mock.create_autospec(real_s3, spec_set=True)
+
+
+@pytest.fixture(autouse=True)
+def mock_boto(s3_spec):
+    """Patch boto3.client for each test, yielding the patch and the S3 client it returns"""
+    # Clear calls, return values and side effects left by the previous test
+    s3_spec.reset_mock(return_value=True, side_effect=True)
+    with mock.patch('boto3.client', return_value=s3_spec) as mock_client:
+        yield mock_client, s3_spec
+
+
+@pytest.fixture
+def s3_client(mock_boto):
+    """S3Client for 'test-bucket', built on the mocked boto3 client"""
+    return S3Client(bucket_name='test-bucket')
+
+
+def assert_called_with_kwargs(mock_method, **expected):
+    """Assert a mock was called once, with exactly the expected keyword arguments"""
+    mock_method.assert_called_once()
+    assert not mock_method.call_args.args
+    assert mock_method.call_args.kwargs == expected
 
 
 @pytest.mark.parametrize('bucket_name', [None, 'test-bucket'])
-def test_s3_client_initialization(bucket_name):
+def test_s3_client_initialization(bucket_name, mock_boto):
     """Test that S3Client initializes correctly with default bucket name"""
-    with mock.patch('boto3.client') as mock_client:
-        # Initialize client with or without bucket name
-        client = S3Client(bucket_name=bucket_name)
-        
-        # Assert bucket name is set correctly
-        expected_bucket = bucket_name if bucket_name else settings.S3_BUCKET_NAME
-        assert client._bucket_name == expected_bucket
-        
-        # Verify boto3.client was called with correct parameters
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
+    mock_client, _ = mock_boto
+    
+    # Initialize client with or without bucket name
+    client = S3Client(bucket_name=bucket_name)
+    
+    # Assert bucket name is set correctly
+    expected_bucket = bucket_name if bucket_name else FAKE_SETTINGS.S3_BUCKET_NAME
+    assert client._bucket_name == expected_bucket
+    
+    # Verify boto3.client was called with correct parameters
+    mock_client.assert_called_once_with('s3', **EXPECTED_CLIENT_KWARGS)
 
 
-def test_upload_file_success():
+def test_upload_file_success(mock_boto):
     """Test successful file upload to S3"""
-    # Create a temporary file for testing
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_file.write(b'test content')
-        temp_file_path = temp_file.name
+    mock_client, mock_s3 = mock_boto
+    
+    # Call the function
+    result = upload_file(
+        file_path=UPLOAD_FILE_PATH,
+        key='test/file.txt',
+        bucket_name='test-bucket'
+    )
     
-    try:
-        with mock.patch('boto3.client') as mock_client:
-            # Setup mock
-            mock_s3 = mock.MagicMock()
-            mock_client.return_value = mock_s3
-            
-            # Call the function
-            result = upload_file(
-                file_path=temp_file_path,
-                key='test/file.txt',
-                bucket_name='test-bucket'
-            )
-            
-            # Assert result and verify interactions
-            assert result is True
-            mock_client.assert_called_once_with(
-                's3',
-                region_name=settings.AWS_REGION,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-            )
-            mock_s3.upload_file.assert_called_once_with(
-                Filename=temp_file_path,
-                Bucket='test-bucket',
-                Key='test/file.txt',
-                ExtraArgs={}
-            )
-    finally:
-        # Clean up temporary file
-        os.unlink(temp_file_path)
-
-
-def test_upload_file_failure():
+    # Assert result and verify interactions
+    assert result is True
+    mock_client.assert_called_once_with('s3', **EXPECTED_CLIENT_KWARGS)
+    assert_called_with_kwargs(
+        mock_s3.upload_file,
+        Filename=UPLOAD_FILE_PATH,
+        Bucket='test-bucket',
+        Key='test/file.txt',
+        ExtraArgs={}
+    )
+
+
+def test_upload_file_failure(mock_boto):
     """Test file upload failure and exception handling"""
-    # Create a temporary file for testing
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_file.write(b'test content')
-        temp_file_path = temp_file.name
+    mock_client, mock_s3 = mock_boto
     
-    try:
-        with mock.patch('boto3.client') as mock_client:
-            # Setup mock to raise exception
-            mock_s3 = mock.MagicMock()
-            mock_client.return_value = mock_s3
-            mock_s3.upload_file.side_effect = ClientError(
-                {'Error': {'Code': 'TestException', 'Message': 'Test error message'}},
-                'upload_file'
-            )
-            
-            # Call the function and expect exception
-            with pytest.raises(IntegrationException) as excinfo:
-                upload_file(
-                    file_path=temp_file_path,
-                    key='test/file.txt',
-                    bucket_name='test-bucket'
-                )
-            
-            # Verify exception details
-            assert INTEGRATION_ERRORS["S3_OPERATION_FAILED"] in str(excinfo.value)
-            assert excinfo.value.error_code == "s3_upload_failed"
-            assert "test/file.txt" in str(excinfo.value.details)
-            
-            # Verify client was called correctly
-            mock_client.assert_called_once()
-    finally:
-        # Clean up temporary file
-        os.unlink(temp_file_path)
-
-
-def test_upload_fileobj_success():
-    """Test successful file-like object upload to S3"""
-    # Create a BytesIO object for testing
-    file_obj = io.BytesIO(b'test content')
+    # Make the S3 call raise
+    mock_s3.upload_file.side_effect = ClientError(
+        {'Error': {'Code': 'TestException', 'Message': 'Test error message'}},
+        'upload_file'
+    )
     
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        # Call the function
-        result = upload_fileobj(
-            fileobj=file_obj,
+    # Call the function and expect exception
+    with pytest.raises(IntegrationException) as excinfo:
+        upload_file(
+            file_path=UPLOAD_FILE_PATH,
             key='test/file.txt',
             bucket_name='test-bucket'
         )
-        
-        # Assert result and verify interactions
-        assert result is True
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.upload_fileobj.assert_called_once_with(
-            Fileobj=file_obj,
-            Bucket='test-bucket',
-            Key='test/file.txt',
-            ExtraArgs={}
-        )
+    
+    # Verify exception details
+    assert INTEGRATION_ERRORS["S3_OPERATION_FAILED"] in str(excinfo.value)
+    assert excinfo.value.error_code == "s3_upload_failed"
+    assert "test/file.txt" in str(excinfo.value.details)
+    
+    # Verify client was called correctly
+    mock_client.assert_called_once()
 
 
-def test_download_file_success():
+def test_upload_fileobj_success(mock_boto):
+    """Test successful file-like object upload to S3"""
+    mock_client, mock_s3 = mock_boto
+    
+    # Reuse the shared content buffer; the mocked upload never reads it
+    file_obj = TEST_CONTENT_BUF
+    file_obj.seek(0)
+    
+    # Call the function
+    result = upload_fileobj(
+        fileobj=file_obj,
+        key='test/file.txt',
+        bucket_name='test-bucket'
+    )
+    
+    # Assert result and verify interactions
+    assert result is True
+    mock_client.assert_called_once_with('s3', **EXPECTED_CLIENT_KWARGS)
+    assert_called_with_kwargs(
+        mock_s3.upload_fileobj,
+        Fileobj=file_obj,
+        Bucket='test-bucket',
+        Key='test/file.txt',
+        ExtraArgs={}
+    )
+
+
+def test_download_file_success(mock_boto, tmp_path):
     """Test successful file download from S3"""
+    mock_client, mock_s3 = mock_boto
+    
     # Create a temporary file path for download destination
-    temp_file_path = os.path.join(tempfile.gettempdir(), 'test_download.txt')
+    temp_file_path = str(tmp_path / 'test_download.txt')
     
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        # Call the function
-        result = download_file(
-            key='test/file.txt',
-            file_path=temp_file_path,
-            bucket_name='test-bucket'
-        )
-        
-        # Assert result and verify interactions
-        assert result is True
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.download_file.assert_called_once_with(
-            Bucket='test-bucket',
-            Key='test/file.txt',
-            Filename=temp_file_path
-        )
-
-
-def test_download_fileobj_success():
+    # Call the function
+    result = download_file(
+        key='test/file.txt',
+        file_path=temp_file_path,
+        bucket_name='test-bucket'
+    )
+    
+    # Assert result and verify interactions
+    assert result is True
+    mock_client.assert_called_once_with('s3', **EXPECTED_CLIENT_KWARGS)
+    assert_called_with_kwargs(
+        mock_s3.download_file,
+        Bucket='test-bucket',
+        Key='test/file.txt',
+        Filename=temp_file_path
+    )
+
+
+def test_download_fileobj_success(mock_boto):
     """Test successful download to file-like object from S3"""
+    mock_client, mock_s3 = mock_boto
+    
     # Create a BytesIO object for download destination
     file_obj = io.BytesIO()
     
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        # Call the function
-        result = download_fileobj(
-            key='test/file.txt',
-            fileobj=file_obj,
-            bucket_name='test-bucket'
-        )
-        
-        # Assert result and verify interactions
-        assert result is True
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.download_fileobj.assert_called_once_with(
-            Bucket='test-bucket',
-            Key='test/file.txt',
-            Fileobj=file_obj
-        )
-
-
-def test_get_object_success():
+    # Call the function
+    result = download_fileobj(
+        key='test/file.txt',
+        fileobj=file_obj,
+        bucket_name='test-bucket'
+    )
+    
+    # Assert result and verify interactions
+    assert result is True
+    mock_client.assert_called_once_with('s3', **EXPECTED_CLIENT_KWARGS)
+    assert_called_with_kwargs(
+        mock_s3.download_fileobj,
+        Bucket='test-bucket',
+        Key='test/file.txt',
+        Fileobj=file_obj
+    )
+
+
+def test_get_object_success(mock_boto):
     """Test successful object retrieval from S3"""
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock with response
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        mock_response = {
-            'Body': io.BytesIO(b'test content'),
-            'ContentLength': 12,
-            'ContentType': 'text/plain'
-        }
-        mock_s3.get_object.return_value = mock_response
-        
-        # Call the function
-        result = get_object(
-            key='test/file.txt',
-            bucket_name='test-bucket'
-        )
-        
-        # Assert result and verify interactions
-        assert result == mock_response
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.get_object.assert_called_once_with(
-            Bucket='test-bucket',
-            Key='test/file.txt'
-        )
-
-
-def test_delete_object_success():
-    """Test successful object deletion from S3"""
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        # Call the function
-        result = delete_object(
-            key='test/file.txt',
-            bucket_name='test-bucket'
-        )
-        
-        # Assert result and verify interactions
-        assert result is True
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.delete_object.assert_called_once_with(
-            Bucket='test-bucket',
-            Key='test/file.txt'
-        )
-
-
-def test_list_objects_success():
-    """Test successful listing of objects in S3 bucket"""
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock with response
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        mock_response = {
-            'Contents': [
-                {'Key': 'test/file1.txt'},
-                {'Key': 'test/file2.txt'},
-                {'Key': 'test/file3.txt'}
-            ]
-        }
-        mock_s3.list_objects_v2.return_value = mock_response
-        
-        # Call the function
-        result = list_objects(
-            prefix='test/',
-            bucket_name='test-bucket'
-        )
-        
-        # Assert result and verify interactions
-        assert result == ['test/file1.txt', 'test/file2.txt', 'test/file3.txt']
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.list_objects_v2.assert_called_once_with(
-            Bucket='test-bucket',
-            Prefix='test/'
-        )
-
-
-def test_generate_presigned_url_success():
-    """Test successful generation of presigned URL"""
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock with response
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        mock_url = 'https://test-bucket.s3.amazonaws.com/test/file.txt?signature=abc123'
-        mock_s3.generate_presigned_url.return_value = mock_url
-        
-        # Call the function
-        result = generate_presigned_url(
-            key='test/file.txt',
-            bucket_name='test-bucket',
-            operation='get_object',
-            expiration=3600
-        )
-        
-        # Assert result and verify interactions
-        assert result == mock_url
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.generate_presigned_url.assert_called_once_with(
-            ClientMethod='get_object',
-            Params={'Bucket': 'test-bucket', 'Key': 'test/file.txt'},
-            ExpiresIn=3600
-        )
-
-
-def test_copy_object_success():
-    """Test successful object copy within S3"""
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        # Call the function
-        result = copy_object(
-            source_key='test/source.txt',
-            destination_key='test/destination.txt',
-            source_bucket='source-bucket',
-            destination_bucket='destination-bucket'
-        )
-        
-        # Assert result and verify interactions
-        assert result is True
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.copy_object.assert_called_once_with(
-            CopySource={'Bucket': 'source-bucket', 'Key': 'test/source.txt'},
-            Bucket='destination-bucket',
-            Key='test/destination.txt'
-        )
-
-
-def test_get_object_metadata_success():
-    """Test successful retrieval of object metadata"""
-    with mock.patch('boto3.client') as mock_client:
-        # Setup mock with response
-        mock_s3 = mock.MagicMock()
-        mock_client.return_value = mock_s3
-        
-        mock_metadata = {
-            'ContentLength': 12,
-            'ContentType': 'text/plain',
-            'Metadata': {'custom-key': 'custom-value'}
-        }
-        mock_s3.head_object.return_value = mock_metadata
-        
-        # Call the function
-        result = get_object_metadata(
-            key='test/file.txt',
-            bucket_name='test-bucket'
-        )
-        
-        # Assert result and verify interactions
-        assert result == mock_metadata
-        mock_client.assert_called_once_with(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        mock_s3.head_object.assert_called_once_with(
-            Bucket='test-bucket',
-            Key='test/file.txt'
-        )
+    mock_client, mock_s3 = mock_boto
+    
+    # Setup mock response around the shared content buffer
+    TEST_CONTENT_BUF.seek(0)
+    mock_response = {
+        'Body': TEST_CONTENT_BUF,
+        'ContentLength': 12,
+        'ContentType': 'text/plain'
+    }
+    mock_s3.get_object.return_value = mock_response
+    
+    # Call the function
+    result = get_object(
+        key='test/file.txt',
+        bucket_name='test-bucket'
+    )
+    
+    # Assert result and verify interactions
+    assert result == mock_response
+    mock_client.assert_called_once_with('s3', **EXPECTED_CLIENT_KWARGS)
+    assert_called_with_kwargs(
+        mock_s3.get_object,
+        Bucket='test-bucket',
+        Key='test/file.txt'
+    )
+
+
+# Module-level operations that make a single S3 call: function, its arguments, the
+# S3 client method it calls and that method's response, the expected S3 call, and the
+# expected result
+S3_OPERATION_CASES = [
+    pytest.param(
+        delete_object,
+        {'key': 'test/file.txt', 'bucket_name': 'test-bucket'},
+        'delete_object',
+        None,
+        {'Bucket': 'test-bucket', 'Key': 'test/file.txt'},
+        True,
+        id='delete_object'
+    ),
+    pytest.param(
+        list_objects,
+        {'prefix': 'test/', 'bucket_name': 'test-bucket'},
+        'list_objects_v2',
+        {'Contents': [{'Key': 'test/file1.txt'}, {'Key': 'test/file2.txt'}, {'Key': 'test/file3.txt'}]},
+        {'Bucket': 'test-bucket', 'Prefix': 'test/'},
+        ['test/file1.txt', 'test/file2.txt', 'test/file3.txt'],
+        id='list_objects'
+    ),
+    pytest.param(
+        generate_presigned_url,
+        {'key': 'test/file.txt', 'bucket_name': 'test-bucket', 'operation': 'get_object', 'expiration': 3600},
+        'generate_presigned_url',
+        PRESIGNED_URL,
+        {'ClientMethod': 'get_object', 'Params': {'Bucket': 'test-bucket', 'Key': 'test/file.txt'}, 'ExpiresIn': 3600},
+        PRESIGNED_URL,
+        id='generate_presigned_url'
+    ),
+    pytest.param(
+        copy_object,
+        {
+            'source_key': 'test/source.txt',
+            'destination_key': 'test/destination.txt',
+            'source_bucket': 'source-bucket',
+            'destination_bucket': 'destination-bucket'
+        },
+        'copy_object',
+        None,
+        {
+            'CopySource': {'Bucket': 'source-bucket', 'Key': 'test/source.txt'},
+            'Bucket': 'destination-bucket',
+            'Key': 'test/destination.txt'
+        },
+        True,
+        id='copy_object'
+    ),
+    pytest.param(
+        get_object_metadata,
+        {'key': 'test/file.txt', 'bucket_name': 'test-bucket'},
+        'head_object',
+        OBJECT_METADATA,
+        {'Bucket': 'test-bucket', 'Key': 'test/file.txt'},
+        OBJECT_METADATA,
+        id='get_object_metadata'
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    'operation,kwargs,s3_method,s3_response,expected_call,expected_result',
+    S3_OPERATION_CASES
+)
+def test_s3_operation_success(mock_boto, operation, kwargs, s3_method, s3_response, expected_call, expected_result):
+    """Test that each S3 operation makes its S3 call and returns the expected result"""
+    mock_client, mock_s3 = mock_boto
+    
+    # Setup mock response
+    getattr(mock_s3, s3_method).return_value = s3_response
+    
+    # Call the function
+    result = operation(**kwargs)
+    
+    # Assert result and verify interactions
+    assert result == expected_result
+    mock_client.assert_called_once_with('s3', **EXPECTED_CLIENT_KWARGS)
+    assert_called_with_kwargs(getattr(mock_s3, s3_method), **expected_call)
 
 
-def test_s3client_upload_success():
+def test_s3client_upload_success(s3_client):
     """Test successful upload using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.upload_fileobj') as mock_upload:
+    with mock.patch.object(s3_module, 'upload_fileobj') as mock_upload:
         # Setup mock
         mock_upload.return_value = True
         
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
-        
         # Call the method
-        content = b'test content'
-        result = client.upload(
-            content=content,
+        result = s3_client.upload(
+            content=TEST_CONTENT,
             key='test/file.txt',
             content_type='text/plain',
             metadata={'custom-key': 'custom-value'}
@@ -453,25 +389,22 @@ def test_s3client_upload_success():
         assert kwargs['extra_args']['Metadata'] == {'custom-key': 'custom-value'}
 
 
-def test_s3client_download_success():
+def test_s3client_download_success(s3_client):
     """Test successful download using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.download_fileobj') as mock_download:
+    with mock.patch.object(s3_module, 'download_fileobj') as mock_download:
         # Setup mock to write data to the BytesIO object
         def write_to_fileobj(*args, **kwargs):
             fileobj = kwargs['fileobj']
-            fileobj.write(b'test content')
+            fileobj.write(TEST_CONTENT)
             return True
         
         mock_download.side_effect = write_to_fileobj
         
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
-        
         # Call the method
-        result = client.download(key='test/file.txt')
+        result = s3_client.download(key='test/file.txt')
         
         # Assert result and verify interactions
-        assert result == b'test content'
+        assert result == TEST_CONTENT
         mock_download.assert_called_once()
         args, kwargs = mock_download.call_args
         
@@ -481,187 +414,99 @@ def test_s3client_download_success():
         assert isinstance(kwargs['fileobj'], io.BytesIO)
 
 
-def test_s3client_delete_success():
-    """Test successful deletion using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.delete_object') as mock_delete:
+# S3Client methods that delegate to a module-level operation: method, its arguments,
+# the operation it calls and that operation's result, and the expected call
+S3CLIENT_OPERATION_CASES = [
+    pytest.param(
+        'delete',
+        {'key': 'test/file.txt'},
+        'delete_object',
+        True,
+        {'key': 'test/file.txt', 'bucket_name': 'test-bucket'},
+        id='delete'
+    ),
+    pytest.param(
+        'list',
+        {'prefix': 'test/'},
+        'list_objects',
+        ['test/file1.txt', 'test/file2.txt'],
+        {'prefix': 'test/', 'bucket_name': 'test-bucket'},
+        id='list'
+    ),
+    pytest.param(
+        'get_presigned_url',
+        {'key': 'test/file.txt', 'operation': 'get_object', 'expiration': 3600},
+        'generate_presigned_url',
+        PRESIGNED_URL,
+        {'key': 'test/file.txt', 'bucket_name': 'test-bucket', 'operation': 'get_object', 'expiration': 3600, 'params': None},
+        id='get_presigned_url'
+    ),
+    pytest.param(
+        'get_download_url',
+        {'key': 'test/file.txt', 'expiration': 3600},
+        'generate_presigned_url',
+        PRESIGNED_URL,
+        {'key': 'test/file.txt', 'bucket_name': 'test-bucket', 'operation': 'get_object', 'expiration': 3600, 'params': None},
+        id='get_download_url'
+    ),
+    pytest.param(
+        'get_upload_url',
+        {'key': 'test/file.txt', 'content_type': 'text/plain', 'expiration': 3600},
+        'generate_presigned_url',
+        PRESIGNED_URL,
+        {
+            'key': 'test/file.txt',
+            'bucket_name': 'test-bucket',
+            'operation': 'put_object',
+            'expiration': 3600,
+            'params': {'ContentType': 'text/plain'}
+        },
+        id='get_upload_url'
+    ),
+    pytest.param(
+        'copy',
+        {'source_key': 'test/source.txt', 'destination_key': 'test/destination.txt'},
+        'copy_object',
+        True,
+        {
+            'source_key': 'test/source.txt',
+            'destination_key': 'test/destination.txt',
+            'source_bucket': 'test-bucket',
+            'destination_bucket': 'test-bucket'
+        },
+        id='copy'
+    ),
+    pytest.param(
+        'get_metadata',
+        {'key': 'test/file.txt'},
+        'get_object_metadata',
+        OBJECT_METADATA,
+        {'key': 'test/file.txt', 'bucket_name': 'test-bucket'},
+        id='get_metadata'
+    ),
+]
+
+
+@pytest.mark.parametrize('method,kwargs,operation,operation_result,expected_call', S3CLIENT_OPERATION_CASES)
+def test_s3client_operation_success(s3_client, method, kwargs, operation, operation_result, expected_call):
+    """Test that each S3Client method delegates to its S3 operation with the client's bucket"""
+    with mock.patch.object(s3_module, operation) as mock_operation:
         # Setup mock
-        mock_delete.return_value = True
-        
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
+        mock_operation.return_value = operation_result
         
         # Call the method
-        result = client.delete(key='test/file.txt')
+        result = getattr(s3_client, method)(**kwargs)
         
         # Assert result and verify interactions
-        assert result is True
-        mock_delete.assert_called_once_with(
-            key='test/file.txt',
-            bucket_name='test-bucket'
-        )
+        assert result == operation_result
+        assert_called_with_kwargs(mock_operation, **expected_call)
 
 
-def test_s3client_list_success():
-    """Test successful listing using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.list_objects') as mock_list:
-        # Setup mock
-        mock_list.return_value = ['test/file1.txt', 'test/file2.txt']
-        
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
-        
-        # Call the method
-        result = client.list(prefix='test/')
-        
-        # Assert result and verify interactions
-        assert result == ['test/file1.txt', 'test/file2.txt']
-        mock_list.assert_called_once_with(
-            prefix='test/',
-            bucket_name='test-bucket'
-        )
-
-
-def test_s3client_get_presigned_url_success():
-    """Test successful presigned URL generation using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.generate_presigned_url') as mock_url:
-        # Setup mock
-        mock_url.return_value = 'https://test-bucket.s3.amazonaws.com/test/file.txt?signature=abc123'
-        
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
-        
-        # Call the method
-        result = client.get_presigned_url(
-            key='test/file.txt',
-            operation='get_object',
-            expiration=3600
-        )
-        
-        # Assert result and verify interactions
-        assert result == 'https://test-bucket.s3.amazonaws.com/test/file.txt?signature=abc123'
-        mock_url.assert_called_once_with(
-            key='test/file.txt',
-            bucket_name='test-bucket',
-            operation='get_object',
-            expiration=3600,
-            params=None
-        )
-
-
-def test_s3client_get_download_url_success():
-    """Test successful download URL generation using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.generate_presigned_url') as mock_url:
-        # Setup mock
-        mock_url.return_value = 'https://test-bucket.s3.amazonaws.com/test/file.txt?signature=abc123'
-        
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
-        
-        # Call the method
-        result = client.get_download_url(key='test/file.txt', expiration=3600)
-        
-        # Assert result and verify interactions
-        assert result == 'https://test-bucket.s3.amazonaws.com/test/file.txt?signature=abc123'
-        mock_url.assert_called_once_with(
-            key='test/file.txt',
-            bucket_name='test-bucket',
-            operation='get_object',
-            expiration=3600,
-            params=None
-        )
-
-
-def test_s3client_get_upload_url_success():
-    """Test successful upload URL generation using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.generate_presigned_url') as mock_url:
-        # Setup mock
-        mock_url.return_value = 'https://test-bucket.s3.amazonaws.com/test/file.txt?signature=abc123'
-        
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
-        
-        # Call the method
-        result = client.get_upload_url(
-            key='test/file.txt',
-            content_type='text/plain',
-            expiration=3600
-        )
-        
-        # Assert result and verify interactions
-        assert result == 'https://test-bucket.s3.amazonaws.com/test/file.txt?signature=abc123'
-        mock_url.assert_called_once_with(
-            key='test/file.txt',
-            bucket_name='test-bucket',
-            operation='put_object',
-            expiration=3600,
-            params={'ContentType': 'text/plain'}
-        )
-
-
-def test_s3client_copy_success():
-    """Test successful object copy using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.copy_object') as mock_copy:
-        # Setup mock
-        mock_copy.return_value = True
-        
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
-        
-        # Call the method
-        result = client.copy(
-            source_key='test/source.txt',
-            destination_key='test/destination.txt'
-        )
-        
-        # Assert result and verify interactions
-        assert result is True
-        mock_copy.assert_called_once_with(
-            source_key='test/source.txt',
-            destination_key='test/destination.txt',
-            source_bucket='test-bucket',
-            destination_bucket='test-bucket'
-        )
-
-
-def test_s3client_get_metadata_success():
-    """Test successful metadata retrieval using S3Client class"""
-    with mock.patch('boto3.client'), mock.patch('...app.integrations.aws.s3.get_object_metadata') as mock_metadata:
-        # Setup mock
-        mock_metadata.return_value = {
-            'ContentLength': 12,
-            'ContentType': 'text/plain',
-            'Metadata': {'custom-key': 'custom-value'}
-        }
-        
-        # Initialize client
-        client = S3Client(bucket_name='test-bucket')
-        
-        # Call the method
-        result = client.get_metadata(key='test/file.txt')
-        
-        # Assert result and verify interactions
-        assert result == {
-            'ContentLength': 12,
-            'ContentType': 'text/plain',
-            'Metadata': {'custom-key': 'custom-value'}
-        }
-        mock_metadata.assert_called_once_with(
-            key='test/file.txt',
-            bucket_name='test-bucket'
-        )
-
-
-def test_s3client_generate_key():
+def test_s3client_generate_key(s3_client):
     """Test key generation with folder and filename"""
-    with mock.patch('uuid.uuid4') as mock_uuid:
-        # Setup mock
-        mock_uuid.return_value = uuid.UUID('12345678-1234-5678-1234-567812345678')
-        
-        # Initialize client
-        client = S3Client()
-        
+    with mock.patch.object(s3_module.uuid, 'uuid4', return_value=FIXED_UUID):
         # Call the method
-        result = client.generate_key(
+        result = s3_client.generate_key(
             folder='documents',
             filename='test.pdf'
         )
@@ -12,7 +12,6 @@ from src.backend.app.constants.error_messages import CSV_ERRORS, STANDARD_PROPER
 from src.backend.app.core.exceptions import CSVException, MoleculeException
 from src.backend.app.services.csv_service import CSVService
 from src.backend.app.utils.smiles import validate_smiles
-from src.backend.tests.conftest import db_session, test_user  # type: ignore
 
 
 def test_process_file_success(mocker: pytest_mock.MockFixture):
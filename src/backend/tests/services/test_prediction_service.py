@@ -10,7 +10,6 @@ from src.backend.app.integrations.ai_engine.exceptions import AIEngineException,
 from src.backend.app.core.exceptions import PredictionException
 from src.backend.app.models.prediction import PredictionStatus
 from src.backend.app.constants.molecule_properties import PREDICTABLE_PROPERTIES
-from tests.conftest import db_session, test_molecule, test_molecules
 
 
 class TestPredictionService: